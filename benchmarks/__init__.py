@@ -0,0 +1,12 @@
+"""
+Benchmarks of the public entry points of :py:mod:`sabrmetrics`, written using
+`pytest-benchmark`_.
+
+Requests are served from an archive of synthetic responses, recorded at the start of the session
+(see :py:func:`sabrmetrics.tests.payloads.record`) and replayed by
+:py:class:`sabrmetrics.transport.ReplayTransport`, so that no benchmark depends on the network.
+Each benchmark also records the peak memory allocated by one call, and the package version, in
+its ``extra_info``.
+
+.. _pytest-benchmark: https://pytest-benchmark.readthedocs.io/
+"""
@@ -0,0 +1,53 @@
+"""
+"""
+
+import tracemalloc
+import typing
+
+import pytest
+
+import sabrmetrics
+from sabrmetrics.sfbb import PlayerIDMap
+from sabrmetrics.tests import payloads
+from sabrmetrics.transport import replaying
+
+
+@pytest.fixture(scope="session")
+def archive(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """
+    :return: Path to the archive of recorded responses
+    """
+    path = str(tmp_path_factory.mktemp("fixtures") / "responses.zip")
+    payloads.record(path)
+    return path
+
+
+@pytest.fixture
+def replay(archive: str) -> typing.Iterator[None]:
+    """
+    Serves every request from the archive of recorded responses.
+    """
+    PlayerIDMap._hyperlinks_cache.clear()
+    with replaying(archive):
+        yield
+    PlayerIDMap._hyperlinks_cache.clear()
+
+
+@pytest.fixture
+def measure(benchmark: typing.Any) -> typing.Callable[..., typing.Any]:
+    """
+    :return: Function that benchmarks a call, and records its peak memory allocation
+    """
+    def measure(
+        function: typing.Callable[..., typing.Any], *args: typing.Any, **kwargs: typing.Any
+    ) -> typing.Any:
+        tracemalloc.start()
+        try:
+            function(*args, **kwargs)
+            benchmark.extra_info["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["version"] = sabrmetrics.__version__
+        return benchmark(function, *args, **kwargs)
+
+    return measure
@@ -0,0 +1,80 @@
+"""
+Parse time of batches of standings and Player ID Map payloads (see :py:mod:`sabrmetrics.batch`)
+over process pools of 1, 2 and 4 workers, against parsing them in this process, and the transfer
+of the parsed tables as Arrow IPC buffers against pickled ``DataFrame`` objects.
+"""
+
+import concurrent.futures
+import datetime
+import json
+import pickle
+import typing
+
+import pytest
+
+from sabrmetrics import batch
+from sabrmetrics import snapshot
+from sabrmetrics.mlb.standings import Standings
+from sabrmetrics.sfbb import PlayerIDMap
+from sabrmetrics.tests import payloads
+
+pytest.importorskip("pyarrow")
+
+
+STANDINGS = [
+    json.dumps(payloads.standings(s, datetime.date(s, 7, 1))).encode() for s in range(2004, 2024)
+] * 4
+PLAYERIDMAPS = [payloads.playeridmap_csv(4000)] * 8
+
+
+@pytest.fixture(scope="module", params=[1, 2, 4], ids=lambda x: f"{x}-workers")
+def workers(request: pytest.FixtureRequest) -> int:
+    """
+    :return: Number of worker processes
+    """
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def executor(workers: int) -> typing.Iterator[concurrent.futures.ProcessPoolExecutor]:
+    """
+    :return: Started process pool, so that its start-up is not measured
+    """
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(int, range(workers)))
+        yield executor
+
+
+def test_standings_serial(measure):
+    measure(lambda: [Standings.from_payload(x).standings() for x in STANDINGS])
+
+
+def test_standings(measure, workers, executor):
+    measure(batch.parse_standings, STANDINGS, workers=workers, executor=executor)
+
+
+def test_playeridmaps_serial(measure):
+    measure(lambda: [PlayerIDMap.read_csv(x) for x in PLAYERIDMAPS])
+
+
+def test_playeridmaps(measure, workers, executor):
+    measure(batch.parse_playeridmaps, PLAYERIDMAPS, workers=workers, executor=executor)
+
+
+@pytest.mark.parametrize("transfer", ["ipc", "pickle"])
+def test_transfer(benchmark, measure, transfer):
+    """
+    Serializes and deserializes a parsed Player ID Map, as between a worker and this process.
+    """
+    table = PlayerIDMap.read_csv(PLAYERIDMAPS[0])
+    if transfer == "ipc":
+        def roundtrip():
+            return snapshot.read_ipc(pickle.loads(pickle.dumps(snapshot.to_ipc(table))))
+    else:
+        def roundtrip():
+            return pickle.loads(pickle.dumps(table))
+
+    benchmark.extra_info["payload_bytes"] = len(pickle.dumps(
+        snapshot.to_ipc(table) if transfer == "ipc" else table
+    ))
+    measure(roundtrip)
@@ -0,0 +1,63 @@
+"""
+Decode time and peak memory of standings documents of increasing size, with each installed JSON
+backend (see :py:mod:`sabrmetrics.decoding`), against ``requests.Response.json``, and decoding
+them whole against :py:class:`sabrmetrics.decoding.LazyDocument`.
+"""
+
+import datetime
+import json
+import typing
+
+import pytest
+import requests
+
+from sabrmetrics import decoding
+from sabrmetrics.decoding import LazyDocument
+from sabrmetrics.tests import payloads
+
+
+@pytest.fixture(scope="module", params=[1, 10, 100], ids=lambda x: f"{x}-seasons")
+def payload(request: pytest.FixtureRequest) -> bytes:
+    """
+    :return: Standings document, with the records of as many seasons as the parameter
+    """
+    records = []
+    for season in range(2023 - request.param, 2023):
+        records.extend(payloads.standings(season + 1, datetime.date(season + 1, 7, 1))["records"])
+    return json.dumps({"copyright": "", "records": records}).encode()
+
+
+@pytest.fixture(params=decoding.backends())
+def backend(request: pytest.FixtureRequest) -> typing.Iterator[str]:
+    """
+    :return: Name of the selected backend
+    """
+    previous = decoding.set_backend(request.param)
+    yield request.param
+    decoding.set_backend(previous)
+
+
+def test_loads(benchmark, measure, payload, backend):
+    benchmark.extra_info["payload_bytes"] = len(payload)
+    measure(decoding.loads, payload)
+
+
+def test_lazy(benchmark, measure, payload, backend):
+    """
+    Reads the records twice, as the standings views do.
+    """
+    def read():
+        document = LazyDocument(payload)
+        return document["records"], document["records"]
+
+    benchmark.extra_info["payload_bytes"] = len(payload)
+    measure(read)
+
+
+def test_response_json(benchmark, measure, payload):
+    response = requests.Response()
+    response._content = payload
+    response.encoding = "utf-8"
+
+    benchmark.extra_info["payload_bytes"] = len(payload)
+    measure(response.json)
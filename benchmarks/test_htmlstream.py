@@ -0,0 +1,43 @@
+"""
+Parse time and peak memory of the streamed table rows (see :py:mod:`sabrmetrics.htmlstream`),
+against a BeautifulSoup parse tree of the whole web view.
+"""
+
+import typing
+
+import pytest
+
+from sabrmetrics.htmlstream import iter_table_rows
+from sabrmetrics.sfbb import PlayerIDMap
+from sabrmetrics.tests import payloads
+
+bs4 = pytest.importorskip("bs4")
+
+
+def soup_rows(document: bytes) -> typing.List[typing.List[str]]:
+    """
+    :param document:
+    :return: Text of the cells of the rows of the ``<tbody>`` of the web view
+    """
+    soup = bs4.BeautifulSoup(document, "lxml")
+    return [
+        [cell.get_text(strip=True) for cell in row.find_all(["td", "th"], recursive=False)]
+        for row in soup.select("div#sheets-viewport div.grid-container table tbody tr")
+    ]
+
+
+def stream_rows(document: bytes) -> typing.List[typing.List[str]]:
+    """
+    :param document:
+    :return: Text of the cells of the rows of the ``<tbody>`` of the web view
+    """
+    chunks = (document[i:i + 2 ** 16] for i in range(0, len(document), 2 ** 16))
+    return list(iter_table_rows(chunks, PlayerIDMap.webview_selector, head=False))
+
+
+@pytest.mark.parametrize("count", [500, 2000])
+@pytest.mark.parametrize("parser", [stream_rows, soup_rows], ids=["stream", "bs4"])
+def test_webview(measure, parser, count):
+    document = payloads.playeridmap_html(count)
+    rows = measure(parser, document)
+    assert len(rows) == count + 2
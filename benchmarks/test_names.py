@@ -0,0 +1,47 @@
+"""
+Resolution of 50k player names, with and without typos, against a synthetic Player ID Map.
+"""
+
+import random
+
+import pandas as pd
+import pytest
+
+from sabrmetrics.sfbb import NameResolver
+from sabrmetrics.sfbb import PlayerIDMap
+from sabrmetrics.tests import payloads
+
+
+NAMES = 50000
+
+
+def _typo(name: str, rng: random.Random) -> str:
+    """
+    :return: ``name``, with two adjacent characters swapped
+    """
+    i = rng.randrange(len(name) - 1)
+    return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+
+
+@pytest.fixture(scope="module")
+def playeridmap() -> pd.DataFrame:
+    return PlayerIDMap.read_csv(payloads.playeridmap_csv())
+
+
+@pytest.fixture(scope="module")
+def resolver(playeridmap: pd.DataFrame) -> NameResolver:
+    return NameResolver(playeridmap)
+
+
+def test_build(measure, playeridmap):
+    measure(NameResolver, playeridmap)
+
+
+@pytest.mark.parametrize("typos", [0.0, 0.2, 1.0], ids=["exact", "20%-typos", "all-typos"])
+def test_resolve(measure, playeridmap, resolver, typos):
+    rng = random.Random(0)
+    names = [
+        _typo(x, rng) if rng.random() < typos else x
+        for x in rng.choices(list(playeridmap.loc[:, "Name"]), k=NAMES)
+    ]
+    measure(resolver.resolve, names)
@@ -0,0 +1,46 @@
+"""
+Type conversion of the Player ID Map table: the vectorized conversions of
+:py:meth:`PlayerIDMap._typed_playeridmap`, against the per-cell conversions they replaced.
+"""
+
+import io
+
+import dateutil.parser
+import pandas as pd
+import pytest
+
+from sabrmetrics.sfbb import PlayerIDMap
+from sabrmetrics.tests import payloads
+
+
+def _per_cell(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Type conversion of the Player ID Map table with per-cell callbacks, as before vectorization.
+    """
+    df = df.loc[:, PlayerIDMap.playeridmap_columns].copy()
+    df["Birthdate"] = df.loc[:, "Birthdate"].apply(dateutil.parser.parse)
+    df["AllPositions"] = df.loc[:, "AllPositions"].apply(lambda x: x.split("/"))
+    df["Active"] = df.loc[:, "Active"].apply(lambda x: x == "Y")
+    for column in PlayerIDMap.integer_columns:
+        df[column] = df.loc[:, column].apply(lambda x: int(x) if isinstance(x, str) else pd.NA)
+    return df
+
+
+@pytest.fixture(params=[4000, 40000], ids=["4k", "40k"])
+def table(request: pytest.FixtureRequest) -> pd.DataFrame:
+    """
+    :return: Renamed, unconverted Player ID Map table
+    """
+    df = pd.read_csv(
+        io.BytesIO(payloads.playeridmap_csv(request.param)),
+        usecols=list(PlayerIDMap.playeridmap_colmap), dtype=str, keep_default_na=False,
+        na_values=[""]
+    )
+    return df.rename(columns=PlayerIDMap.playeridmap_colmap)
+
+
+@pytest.mark.parametrize(
+    "convert", [PlayerIDMap._typed_playeridmap, _per_cell], ids=["vectorized", "per-cell"]
+)
+def test_convert(measure, table, convert):
+    measure(convert, table)
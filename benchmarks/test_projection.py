@@ -0,0 +1,33 @@
+"""
+Size and parse time of standings documents trimmed to the fields of a few columns (see
+:py:func:`sabrmetrics.mlb.standings.projection`), against the whole documents.
+"""
+
+import datetime
+import json
+
+import pytest
+
+from sabrmetrics.mlb.standings import Standings
+from sabrmetrics.mlb.standings import projection
+from sabrmetrics.tests import payloads
+
+
+DATE = datetime.date(2023, 7, 1)
+
+COLUMNS = {
+    "full": None,
+    "standard": ["wins", "losses", "gamesBack"],
+    "split": [("home", "wins"), ("home", "losses"), ("away", "wins"), ("away", "losses")],
+    "division": [(0, "wins"), (0, "losses"), (0, ("division", "id"))],
+}
+
+
+@pytest.mark.parametrize("name", list(COLUMNS))
+def test_parse(benchmark, measure, name):
+    fields = projection(COLUMNS[name])[0] if COLUMNS[name] else None
+    payload = json.dumps(payloads.standings(2023, DATE, fields=fields)).encode()
+    advanced = name if name in ("split", "division") else None
+
+    benchmark.extra_info["payload_bytes"] = len(payload)
+    measure(lambda: Standings.from_payload(payload).standings(advanced=advanced))
@@ -0,0 +1,65 @@
+"""
+Flattening of the per-team records of the standings: the single pass of
+:py:meth:`Standings._flat_record` and :py:meth:`Standings._nested_record`, against building and
+stacking a ``DataFrame`` per team, as before.
+"""
+
+import datetime
+import typing
+
+import pandas as pd
+import pytest
+
+from sabrmetrics.mlb.standings import Standings
+from sabrmetrics.tests import payloads
+
+
+def _stacked_flat_record(records: typing.List[dict], key: str) -> pd.DataFrame:
+    series = []
+    for record in records:
+        dataframe = pd.DataFrame(record[key])
+        dataframe.rename(index=dataframe.loc[:, "type"], inplace=True)
+        dataframe.drop(columns=["type"], inplace=True)
+        series.append(dataframe.stack())
+    return pd.DataFrame(series)
+
+
+def _stacked_nested_record(records: typing.List[dict], key: str, inner_key: str) -> pd.DataFrame:
+    series = []
+    for record in records:
+        dataframe = pd.DataFrame(record[key])
+        nested_df = pd.DataFrame(list(dataframe.loc[:, inner_key]))
+        nested_df.columns = pd.MultiIndex.from_product([[inner_key], nested_df.columns])
+        series.append(pd.concat([dataframe.drop(columns=[inner_key]), nested_df], axis=1).stack())
+    return pd.DataFrame(series)
+
+
+@pytest.fixture(scope="module", params=[1, 20], ids=["1-season", "20-seasons"])
+def records(request: pytest.FixtureRequest) -> typing.List[dict]:
+    """
+    :return: Records of each team of one or more seasons
+    """
+    return [
+        x["records"]
+        for season in range(2023 - request.param, 2023)
+        for r in payloads.standings(season, datetime.date(season, 7, 1))["records"]
+        for x in r["teamRecords"]
+    ]
+
+
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+@pytest.mark.parametrize("method", ["single-pass", "stacked"])
+def test_flat(measure, records, method):
+    if method == "single-pass":
+        measure(Standings.__new__(Standings)._flat_record, records, "splitRecords")
+    else:
+        measure(_stacked_flat_record, records, "splitRecords")
+
+
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+@pytest.mark.parametrize("method", ["single-pass", "stacked"])
+def test_nested(measure, records, method):
+    if method == "single-pass":
+        measure(Standings.__new__(Standings)._nested_record, records, "divisionRecords", "division")
+    else:
+        measure(_stacked_nested_record, records, "divisionRecords", "division")
@@ -0,0 +1,75 @@
+"""
+Parse time and peak memory of the public scraper entry points, over recorded responses.
+"""
+
+import datetime
+
+import pytest
+
+from sabrmetrics.mlb import divisions
+from sabrmetrics.mlb import leagues
+from sabrmetrics.mlb.standings import Standings
+from sabrmetrics.mlb.scraper import Scraper
+from sabrmetrics.sfbb import PlayerIDMap
+
+
+DATE = datetime.datetime(2023, 7, 1)
+
+
+@pytest.fixture(autouse=True)
+def _replay(replay: None) -> None:
+    pass
+
+
+@pytest.fixture(autouse=True)
+def _no_flight(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Benchmarks single calls, whose requests are never shared with concurrent calls.
+    """
+    monkeypatch.setattr(Scraper.flight, "do", lambda key, function: function())
+
+
+def test_league(measure):
+    measure(leagues.AmericanLeague, 2023)
+
+
+def test_division(measure):
+    measure(divisions.ALWest)
+
+
+def test_season(measure):
+    measure(lambda: leagues.Season(2023).date_range("regular-season"))
+
+
+@pytest.mark.parametrize("view", [None, leagues.AmericanLeague, divisions.ALEast])
+def test_standings(measure, view):
+    measure(Standings, view=view, season=2023, date=DATE)
+
+
+@pytest.mark.parametrize("advanced", [None, "split", "division", "overall", "league", "expected"])
+def test_standings_table(measure, advanced):
+    standings = Standings(season=2023, date=DATE)
+    measure(lambda: standings.standings(advanced=advanced))
+
+
+def test_standings_views(measure):
+    def build():
+        standings = Standings(season=2023, date=DATE)
+        for name in Standings.views:
+            getattr(standings, name)
+
+    measure(build)
+
+
+def test_hyperlinks(measure):
+    measure(PlayerIDMap.hyperlinks, refresh=True)
+
+
+@pytest.mark.parametrize("source", ["csv", "html"])
+def test_playeridmap(measure, source):
+    measure(PlayerIDMap().playeridmap, source=source)
+
+
+@pytest.mark.parametrize("source", ["csv", "html"])
+def test_changelog(measure, source):
+    measure(PlayerIDMap().changelog, source=source)
@@ -0,0 +1,50 @@
+"""
+Load time and file size of columnar snapshots (see :py:mod:`sabrmetrics.snapshot`), against
+pickled and CSV copies of the same tables.
+"""
+
+import datetime
+import json
+import os
+import typing
+
+import pandas as pd
+import pytest
+
+from sabrmetrics import snapshot
+from sabrmetrics.mlb.standings import Standings
+from sabrmetrics.sfbb import PlayerIDMap
+from sabrmetrics.tests import payloads
+
+pytest.importorskip("pyarrow")
+
+
+FORMATS: typing.Dict[str, typing.Tuple[
+    typing.Callable[[pd.DataFrame, str], None], typing.Callable[[str], pd.DataFrame]
+]] = {
+    "parquet": (snapshot.to_parquet, lambda path: snapshot.read_snapshot(path, as_pandas=True)),
+    "feather": (snapshot.to_feather, lambda path: snapshot.read_snapshot(path, as_pandas=True)),
+    "pickle": (lambda df, path: df.to_pickle(path), pd.read_pickle),
+    "csv": (lambda df, path: df.to_csv(path, index=False), pd.read_csv),
+}
+
+
+@pytest.fixture(scope="module", params=["standings", "playeridmap"])
+def table(request: pytest.FixtureRequest) -> pd.DataFrame:
+    """
+    :return: Flattened table (see :py:func:`snapshot.flatten`)
+    """
+    if request.param == "standings":
+        payload = json.dumps(payloads.standings(2023, datetime.date(2023, 7, 1))).encode()
+        return snapshot.flatten(Standings.from_payload(payload).standings(advanced="split"))
+    return snapshot.flatten(PlayerIDMap.read_csv(payloads.playeridmap_csv(40000)))
+
+
+@pytest.mark.parametrize("name", list(FORMATS))
+def test_load(benchmark, measure, tmp_path, table, name):
+    write, read = FORMATS[name]
+    path = str(tmp_path / f"table.{name}")
+    write(table, path)
+
+    benchmark.extra_info["file_bytes"] = os.path.getsize(path)
+    measure(read, path)
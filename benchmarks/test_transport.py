@@ -0,0 +1,97 @@
+"""
+Requests per second of the shared pooled transport, against one connection per request (as with
+bare ``requests.get``), over a local stand-in server.
+"""
+
+import datetime
+import typing
+
+import pytest
+import requests
+
+from sabrmetrics.mlb import standings
+from sabrmetrics.mlb.scraper import Scraper
+from sabrmetrics.tests import payloads
+from sabrmetrics.transport import Transport
+from sabrmetrics.transport import set_transport
+
+
+SEASONS = range(2004, 2024)
+
+
+class StandInTransport(Transport):
+    """
+    Sends the requests to the statsapi to a :py:class:`payloads.StandInServer` instead.
+
+    :param server:
+    :param pooled: Whether to reuse pooled connections, or to open a connection per request
+    """
+    def __init__(self, server: payloads.StandInServer, *, pooled: bool = True):
+        super().__init__()
+
+        self._server = server
+        self._pooled = pooled
+        self.requests = 0
+
+    def _request(self, url: str, **kwargs: typing.Any) -> requests.Response:
+        self.requests += 1
+        url = url.replace(payloads.STATSAPI.rsplit("/api/v1", 1)[0], self._server.url)
+        if self._pooled:
+            return super()._request(url, **kwargs)
+        return requests.get(url, **{**kwargs, "timeout": kwargs.get("timeout") or 100})
+
+
+@pytest.fixture(scope="module")
+def server() -> typing.Iterator[payloads.StandInServer]:
+    with payloads.StandInServer() as server:
+        yield server
+
+
+@pytest.fixture(autouse=True)
+def _no_flight(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Scraper.flight, "do", lambda key, function: function())
+
+
+@pytest.mark.parametrize("pooled", [True, False], ids=["pooled", "per-request"])
+def test_standings_seasons(benchmark, server, pooled):
+    """
+    Builds the standings of 20 seasons, as of July 1st of each season.
+    """
+    transport = StandInTransport(server, pooled=pooled)
+    previous = set_transport(transport)
+
+    def build():
+        for season in SEASONS:
+            standings.Standings(season=season, date=datetime.datetime(season, 7, 1))
+
+    try:
+        benchmark.pedantic(build, rounds=5, warmup_rounds=1)
+    finally:
+        set_transport(previous)
+        transport.close()
+
+    per_round = transport.requests // 6
+    benchmark.extra_info["requests"] = per_round
+    if benchmark.stats is not None:
+        benchmark.extra_info["requests_per_second"] = per_round / benchmark.stats.stats.mean
+
+
+@pytest.mark.parametrize("pooled", [True, False], ids=["pooled", "per-request"])
+def test_requests(benchmark, server, pooled):
+    """
+    Requests the standings documents of 20 seasons.
+    """
+    addresses = [
+        standings.Address(season=s, date=datetime.datetime(s, 7, 1)) for s in SEASONS
+    ]
+    transport = StandInTransport(server, pooled=pooled)
+
+    def fetch():
+        for address in addresses:
+            transport.get(address.url, params=dict(address.query)).content
+
+    with transport:
+        benchmark.pedantic(fetch, rounds=5, warmup_rounds=1)
+
+    if benchmark.stats is not None:
+        benchmark.extra_info["requests_per_second"] = len(addresses) / benchmark.stats.stats.mean
@@ -3,10 +3,18 @@
 """
 
 import datetime
-import pkg_resources
+
+try:
+    from importlib import metadata as _metadata
+except ImportError:     # Python < 3.8
+    _metadata = None
 
 
 TODAY = datetime.datetime.today()
 
 
-__version__ = pkg_resources.get_distribution("sabrmetrics").version
+if _metadata is not None:
+    __version__ = _metadata.version("sabrmetrics")
+else:
+    import pkg_resources
+    __version__ = pkg_resources.get_distribution("sabrmetrics").version
@@ -0,0 +1,266 @@
+"""
+Resumable bulk export of historical standings (and Player ID Map snapshots) to a directory of
+Parquet files.
+
+Each partition (one season and date of standings, or one Player ID Map snapshot) is written
+atomically to its own file, using Hive-style directory names (e.g.
+``standings/season=1901/date=1901-10-06/part.parquet``), and recorded in a checkpoint file once
+written.
+Running a backfill again only fetches the partitions missing from the checkpoint file.
+Writing Parquet files requires the optional ``pyarrow`` dependency.
+"""
+
+import concurrent.futures
+import datetime
+import json
+import os
+import threading
+import time
+import typing
+
+from . import snapshot
+from .mlb import standings
+from .mlb.leagues import Season
+from .mlb.leagues import SeasonCalendar
+from .mlb.standings import Standings
+from .instrumentation import in_context
+from .sfbb import PlayerIDMap
+
+
+class Partition(typing.NamedTuple):
+    """
+    Unit of work of a :py:class:`Backfill`.
+
+    ``kind`` is ``"standings"`` or ``"playeridmap"``.
+    A standings partition without a ``date`` holds the standings on the last day of the regular
+    season.
+    """
+    kind: str
+    season: typing.Optional[int] = None
+    date: typing.Optional[datetime.date] = None
+
+    @property
+    def path(self) -> str:
+        """
+        Path of the partition's file, relative to the backfill directory.
+        """
+        parts = [self.kind]
+        if self.season is not None:
+            parts.append(f"season={self.season}")
+        if self.date is not None:
+            parts.append(f"date={self.date.isoformat()}")
+        return os.path.join(*parts, "part.parquet")
+
+
+class BackfillProgress(typing.NamedTuple):
+    """
+    Progress of a :py:class:`Backfill` run.
+    """
+    total: int
+    completed: int
+    skipped: int
+    failed: int
+    rows: int
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """
+        Partitions written per second.
+        """
+        return self.completed / self.elapsed if self.elapsed else 0.0
+
+
+class Backfill:
+    """
+    :param directory: Root directory of the partition files
+    :param partitions:
+    :param workers: Maximum number of partitions fetched and written at once
+    :param progress: Called with a :py:class:`BackfillProgress` after each partition
+
+    .. py:attribute:: checkpoint_file
+
+        Name of the checkpoint file (JSON lines) in ``directory``.
+
+        :type: str
+    """
+    checkpoint_file = "_checkpoints.jsonl"
+
+    def __init__(
+        self, directory: str, partitions: typing.Iterable[Partition], *, workers: int = 8,
+        progress: typing.Optional[typing.Callable[[BackfillProgress], typing.Any]] = None
+    ):
+        self._directory = directory
+        self._partitions = list(dict.fromkeys(partitions))
+        self._workers = workers
+        self._progress = progress
+        self._lock = threading.Lock()
+        self._errors: typing.Dict[Partition, BaseException] = {}
+
+        os.makedirs(directory, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(directory={self.directory!r}, partitions={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self._partitions)
+
+    @classmethod
+    def grid(
+        cls, seasons: typing.Iterable[int], *,
+        frequency: typing.Literal["final", "daily"] = "final",
+        span: str = "regular-season", playeridmap: bool = False
+    ) -> typing.List[Partition]:
+        """
+        :param seasons:
+        :param frequency: Whether to fetch the final standings of each season, or the standings
+            on every date of ``span``
+        :param span: See :py:attr:`Season.date_spans`
+        :param playeridmap: Whether to include a snapshot of the current Player ID Map
+        :return:
+        """
+        seasons = sorted(set(seasons))
+        if frequency == "final":
+            partitions = [Partition("standings", s) for s in seasons]
+        elif frequency == "daily":
+            calendar = SeasonCalendar(seasons)
+            partitions = []
+            for season in seasons:
+                start, end = calendar[season].date_range(span)
+                days = (min(end, datetime.datetime.today()) - start).days + 1
+                partitions.extend(
+                    Partition("standings", season, (start + datetime.timedelta(x)).date())
+                    for x in range(days)
+                )
+        else:
+            raise ValueError(frequency)
+
+        if playeridmap:
+            partitions.append(Partition("playeridmap", date=datetime.date.today()))
+        return partitions
+
+    @property
+    def directory(self) -> str:
+        """
+        """
+        return self._directory
+
+    @property
+    def errors(self) -> typing.Dict[Partition, BaseException]:
+        """
+        Exception raised by each partition that failed during the last run.
+        """
+        return dict(self._errors)
+
+    def completed(self) -> typing.Set[Partition]:
+        """
+        :return: Partitions recorded in the checkpoint file whose file still exists
+        """
+        completed = set()
+        try:
+            with open(self._path(self.checkpoint_file), encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    partition = Partition(
+                        entry["kind"], entry["season"],
+                        datetime.date.fromisoformat(entry["date"]) if entry["date"] else None
+                    )
+                    if os.path.exists(self._path(partition.path)):
+                        completed.add(partition)
+        except FileNotFoundError:
+            pass
+        return completed
+
+    def run(self) -> BackfillProgress:
+        """
+        Fetches and writes every partition missing from the checkpoint file.
+        Failed partitions are not recorded (see :py:attr:`errors`), so the next run retries them.
+
+        :return:
+        """
+        completed = self.completed()
+        pending = [p for p in self._partitions if p not in completed]
+        self._errors = {}
+
+        counts = {"completed": 0, "failed": 0, "rows": 0}
+        start = time.perf_counter()
+
+        def report() -> BackfillProgress:
+            return BackfillProgress(
+                total=len(self._partitions), completed=counts["completed"],
+                skipped=len(self._partitions) - len(pending), failed=counts["failed"],
+                rows=counts["rows"], elapsed=time.perf_counter() - start
+            )
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self._workers) as executor:
+            futures = {executor.submit(in_context(self._write, p)): p for p in pending}
+            for future in concurrent.futures.as_completed(futures):
+                partition = futures[future]
+                try:
+                    rows = future.result()
+                except Exception as error:
+                    self._errors[partition] = error
+                    counts["failed"] += 1
+                else:
+                    self._checkpoint(partition, rows)
+                    counts["completed"] += 1
+                    counts["rows"] += rows
+
+                if self._progress is not None:
+                    self._progress(report())
+
+        return report()
+
+    def _write(self, partition: Partition) -> int:
+        """
+        :param partition:
+        :return: Number of rows written
+        """
+        if partition.kind == "standings":
+            date = partition.date or Season(partition.season).date_range("regular-season")[1]
+            if isinstance(date, datetime.date) and not isinstance(date, datetime.datetime):
+                date = datetime.datetime(date.year, date.month, date.day)
+            address = standings.Address(season=partition.season, date=date)
+            table = Standings.from_address(address).standings()
+        elif partition.kind == "playeridmap":
+            table = PlayerIDMap().playeridmap()
+        else:
+            raise ValueError(partition.kind)
+
+        path = self._path(partition.path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            snapshot.to_parquet(table, temporary)
+            os.replace(temporary, path)
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+        return len(table)
+
+    def _checkpoint(self, partition: Partition, rows: int) -> None:
+        """
+        :param partition:
+        :param rows:
+        """
+        entry = {
+            "kind": partition.kind, "season": partition.season,
+            "date": partition.date.isoformat() if partition.date else None,
+            "path": partition.path, "rows": rows,
+            "completed": datetime.datetime.now().isoformat()
+        }
+        with self._lock, open(self._path(self.checkpoint_file), "a", encoding="utf-8") as file:
+            file.write(json.dumps(entry) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+    def _path(self, path: str) -> str:
+        """
+        :param path:
+        :return:
+        """
+        return os.path.join(self.directory, path)
@@ -0,0 +1,118 @@
+"""
+Parallel parsing of large batches of raw payloads (e.g., recorded or cached response bodies).
+
+Parsing is CPU-bound, so payloads are parsed in worker processes rather than threads.
+Each worker returns its table serialized in the Arrow IPC format (see
+:py:func:`sabrmetrics.snapshot.to_ipc`) rather than as a pickled ``DataFrame``, and the tables are
+read back without copying their columns.
+Requires the optional ``pyarrow`` dependency.
+"""
+
+import concurrent.futures
+import functools
+import os
+import typing
+
+import pandas as pd
+
+from . import snapshot
+from .mlb.divisions import Division
+from .mlb.leagues import League
+from .mlb.standings import Standings
+from .sfbb import PlayerIDMap
+
+
+def parse_standings(
+    payloads: typing.Sequence[bytes], *,
+    view: typing.Union[typing.Type[Division], typing.Type[League]] = None,
+    advanced: typing.Literal["split", "division", "overall", "league", "expected"] = None,
+    streak: bool = True, league_record: bool = True,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional[concurrent.futures.ProcessPoolExecutor] = None,
+    as_pandas: bool = False
+) -> typing.List[typing.Union["pyarrow.Table", pd.DataFrame]]:
+    """
+    :param payloads: Raw standings documents
+    :param view: See :py:class:`sabrmetrics.mlb.Standings`
+    :param advanced: See :py:meth:`sabrmetrics.mlb.Standings.standings`
+    :param streak: See :py:meth:`sabrmetrics.mlb.Standings.standings`
+    :param league_record: See :py:meth:`sabrmetrics.mlb.Standings.standings`
+    :param workers: Number of worker processes (defaults to the number of CPUs)
+    :param executor: Process pool to reuse, instead of starting one
+    :param as_pandas: Whether to return ``DataFrame`` objects instead of Arrow tables
+    :return: Flattened (see :py:func:`sabrmetrics.snapshot.flatten`) standings table of each
+        payload, in order
+    """
+    function = functools.partial(
+        _parse_standings, view=view,
+        options={"advanced": advanced, "streak": streak, "league_record": league_record}
+    )
+    return _map(function, payloads, workers=workers, executor=executor, as_pandas=as_pandas)
+
+
+def parse_playeridmaps(
+    payloads: typing.Sequence[bytes], *,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional[concurrent.futures.ProcessPoolExecutor] = None,
+    as_pandas: bool = False
+) -> typing.List[typing.Union["pyarrow.Table", pd.DataFrame]]:
+    """
+    :param payloads: Raw Player ID Map CSV files
+    :param workers: Number of worker processes (defaults to the number of CPUs)
+    :param executor: Process pool to reuse, instead of starting one
+    :param as_pandas: Whether to return ``DataFrame`` objects instead of Arrow tables
+    :return: Player ID Map table of each payload (see
+        :py:meth:`sabrmetrics.sfbb.PlayerIDMap.read_csv`), in order
+    """
+    return _map(
+        _parse_playeridmap, payloads, workers=workers, executor=executor, as_pandas=as_pandas
+    )
+
+
+def _map(
+    function: typing.Callable[[bytes], "pyarrow.Buffer"], payloads: typing.Sequence[bytes], *,
+    workers: typing.Optional[int], executor: typing.Optional[concurrent.futures.Executor],
+    as_pandas: bool
+) -> typing.List[typing.Union["pyarrow.Table", pd.DataFrame]]:
+    """
+    :param function: Parses a payload into an Arrow IPC buffer
+    :param payloads:
+    :param workers:
+    :param executor:
+    :param as_pandas:
+    :return:
+    """
+    snapshot._require_pyarrow()
+
+    payloads = list(payloads)
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(payloads) // (workers * 4))
+
+    if executor is not None:
+        buffers = list(executor.map(function, payloads, chunksize=chunksize))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            buffers = list(pool.map(function, payloads, chunksize=chunksize))
+
+    return [snapshot.read_ipc(x, as_pandas=as_pandas) for x in buffers]
+
+
+def _parse_standings(
+    payload: bytes, *, view: typing.Union[typing.Type[Division], typing.Type[League], None],
+    options: typing.Dict[str, typing.Any]
+) -> "pyarrow.Buffer":
+    """
+    :param payload:
+    :param view:
+    :param options: Keyword arguments to :py:meth:`sabrmetrics.mlb.Standings.standings`
+    :return:
+    """
+    return snapshot.to_ipc(Standings.from_payload(payload, view=view), **options)
+
+
+def _parse_playeridmap(payload: bytes) -> "pyarrow.Buffer":
+    """
+    :param payload:
+    :return:
+    """
+    return snapshot.to_ipc(PlayerIDMap.read_csv(payload))
@@ -0,0 +1,433 @@
+"""
+HTTP response caches for :py:class:`sabrmetrics.transport.Transport`.
+
+Two backends are provided: :py:class:`MemoryCache`, which lives for the lifetime of the process,
+and :py:class:`SQLiteCache`, which persists responses to disk.
+Both evict the least-recently-used responses once their total size exceeds ``max_bytes``.
+"""
+
+import abc
+import collections
+import json
+import sqlite3
+import threading
+import time
+import typing
+
+import requests
+
+from .instrumentation import get_instrument
+from .transport import build_response
+from .transport import request_key
+
+
+class CacheEntry(typing.NamedTuple):
+    """
+    A cached HTTP response.
+
+    ``expires`` is the Unix time after which the entry must be revalidated, or ``None`` if the
+    entry never expires.
+    """
+    url: str
+    status_code: int
+    headers: typing.Dict[str, str]
+    content: bytes
+    encoding: typing.Optional[str]
+    stored: float
+    expires: typing.Optional[float]
+
+    @property
+    def etag(self) -> typing.Optional[str]:
+        """
+        """
+        return self.headers.get("ETag", self.headers.get("etag"))
+
+    @property
+    def last_modified(self) -> typing.Optional[str]:
+        """
+        """
+        return self.headers.get("Last-Modified", self.headers.get("last-modified"))
+
+    @property
+    def size(self) -> int:
+        """
+        """
+        return len(self.content)
+
+    def fresh(self, now: typing.Optional[float] = None) -> bool:
+        """
+        :param now:
+        :return:
+        """
+        return self.expires is None or (time.time() if now is None else now) < self.expires
+
+    def validators(self) -> typing.Dict[str, str]:
+        """
+        Conditional request headers for revalidating this entry.
+
+        :return:
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def response(self) -> requests.Response:
+        """
+        :return:
+        """
+        response = build_response(
+            self.content, status_code=self.status_code, headers=self.headers,
+            url=self.url, encoding=self.encoding
+        )
+        response.from_cache = True
+        return response
+
+
+class CacheStats:
+    """
+    Thread-safe counters of cache behavior.
+    """
+    counters = ("hits", "misses", "revalidations", "stores", "evictions")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self.counters, 0)
+
+    def __repr__(self) -> str:
+        arguments = ", ".join(f"{k}={v}" for k, v in self.as_dict().items())
+        return f"{type(self).__name__}({arguments})"
+
+    def __getattr__(self, name: str) -> int:
+        if name in type(self).counters:
+            return self._counts[name]
+        raise AttributeError(name)
+
+    def increment(self, counter: str, value: int = 1) -> None:
+        """
+        :param counter:
+        :param value:
+        """
+        with self._lock:
+            self._counts[counter] += value
+        get_instrument().count(f"cache_{counter}_total", value)
+
+    def as_dict(self) -> typing.Dict[str, int]:
+        """
+        :return:
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self) -> None:
+        """
+        """
+        with self._lock:
+            self._counts = dict.fromkeys(self.counters, 0)
+
+
+class ResponseCache(abc.ABC):
+    """
+    Base class of the response cache backends.
+
+    Time-to-live of a response is the value in ``ttls`` of the longest URL prefix matching the
+    response URL, or ``default_ttl`` if none matches.
+    Responses whose time-to-live is zero are not stored, unless requested as immutable (e.g.,
+    standings of past seasons), in which case they never expire.
+
+    :param max_bytes: Maximum total size (in bytes) of the cached response bodies
+    :param default_ttl: Time-to-live (in seconds) of responses whose URL matches no ``ttls`` prefix
+    :param ttls: Time-to-live (in seconds), keyed by URL prefix
+
+    .. py:attribute:: default_ttls
+
+        Time-to-live (in seconds) of the endpoints scraped by this package, keyed by URL prefix.
+
+        :type: dict[str, float]
+    """
+    default_ttls = {
+        "https://statsapi.mlb.com/api/v1/league/": 3600,
+        "https://statsapi.mlb.com/api/v1/divisions/": 86400,
+        "https://statsapi.mlb.com/api/v1/standings": 60,
+        "https://smartfantasybaseball.com/tools/": 3600,
+    }
+
+    def __init__(
+        self, *, max_bytes: int = 64 * 2 ** 20, default_ttl: float = 0,
+        ttls: typing.Optional[typing.Dict[str, float]] = None
+    ):
+        self._max_bytes = max_bytes
+        self._default_ttl = default_ttl
+        self._ttls = dict(self.default_ttls if ttls is None else ttls)
+        self._stats = CacheStats()
+        self._lock = threading.RLock()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(max_bytes={self.max_bytes}, stats={self.stats})"
+
+    @property
+    def max_bytes(self) -> int:
+        """
+        """
+        return self._max_bytes
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        """
+        return self._stats
+
+    @staticmethod
+    def key(url: str, params: typing.Optional[typing.Dict[str, typing.Any]] = None) -> str:
+        """
+        Canonical cache key of a ``GET`` request.
+
+        :param url:
+        :param params:
+        :return:
+        """
+        return request_key(url, params)
+
+    def ttl(self, url: str) -> float:
+        """
+        :param url:
+        :return:
+        """
+        prefixes = [p for p in self._ttls if url.startswith(p)]
+        return self._ttls[max(prefixes, key=len)] if prefixes else self._default_ttl
+
+    def storable(self, response: requests.Response, *, immutable: bool = False) -> bool:
+        """
+        :param response:
+        :param immutable:
+        :return: Whether the response is stored
+        """
+        return response.status_code == 200 and (immutable or self.ttl(response.url) > 0)
+
+    def entry(
+        self, response: requests.Response, *, immutable: bool = False
+    ) -> CacheEntry:
+        """
+        :param response:
+        :param immutable:
+        :return:
+        """
+        now = time.time()
+        return CacheEntry(
+            url=response.url, status_code=response.status_code,
+            headers=dict(response.headers), content=response.content,
+            encoding=response.encoding, stored=now,
+            expires=None if immutable else now + self.ttl(response.url)
+        )
+
+    def refresh(self, key: str, entry: CacheEntry, *, immutable: bool = False) -> CacheEntry:
+        """
+        Re-stores an entry that the server has confirmed to be unchanged.
+
+        :param key:
+        :param entry:
+        :param immutable:
+        :return:
+        """
+        now = time.time()
+        entry = entry._replace(
+            stored=now, expires=None if immutable else now + self.ttl(entry.url)
+        )
+        self.set(key, entry)
+        self.stats.increment("revalidations")
+        return entry
+
+    @abc.abstractmethod
+    def get(self, key: str) -> typing.Optional[CacheEntry]:
+        """
+        :param key:
+        :return:
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """
+        :param key:
+        :param entry:
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        :param key:
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """
+        """
+        raise NotImplementedError
+
+
+class MemoryCache(ResponseCache):
+    """
+    In-process response cache.
+    """
+    def __init__(self, **kwargs: typing.Any):
+        super().__init__(**kwargs)
+
+        self._entries: "collections.OrderedDict[str, CacheEntry]" = collections.OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """
+        Total size (in bytes) of the cached response bodies.
+        """
+        return self._size
+
+    def get(self, key: str) -> typing.Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if entry.size > self.max_bytes:
+            return
+
+        with self._lock:
+            self.delete(key)
+            self._entries[key] = entry
+            self._size += entry.size
+            self.stats.increment("stores")
+
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+                self.stats.increment("evictions")
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size -= entry.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class SQLiteCache(ResponseCache):
+    """
+    On-disk response cache backed by a SQLite database.
+
+    :param path: Path to the database file
+    """
+    schema = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            status_code INTEGER NOT NULL,
+            headers TEXT NOT NULL,
+            content BLOB NOT NULL,
+            encoding TEXT,
+            stored REAL NOT NULL,
+            expires REAL,
+            size INTEGER NOT NULL,
+            accessed REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+    """
+
+    def __init__(self, path: str, **kwargs: typing.Any):
+        super().__init__(**kwargs)
+
+        self._path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(self.schema)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @property
+    def path(self) -> str:
+        """
+        """
+        return self._path
+
+    @property
+    def size(self) -> int:
+        """
+        Total size (in bytes) of the cached response bodies.
+        """
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+
+    def get(self, key: str) -> typing.Optional[CacheEntry]:
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT url, status_code, headers, content, encoding, stored, expires "
+                "FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+
+        url, status_code, headers, content, encoding, stored, expires = row
+        return CacheEntry(
+            url=url, status_code=status_code, headers=json.loads(headers),
+            content=bytes(content), encoding=encoding, stored=stored, expires=expires
+        )
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if entry.size > self.max_bytes:
+            return
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key, entry.url, entry.status_code, json.dumps(entry.headers),
+                    sqlite3.Binary(entry.content), entry.encoding, entry.stored, entry.expires,
+                    entry.size, time.time()
+                )
+            )
+            self.stats.increment("stores")
+
+            total = self._connection.execute("SELECT SUM(size) FROM responses").fetchone()[0]
+            rows = self._connection.execute(
+                "SELECT key, size FROM responses ORDER BY accessed"
+            ).fetchall() if total > self.max_bytes else []
+            evicted = []
+            for evicted_key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                evicted.append((evicted_key,))
+                total -= size
+            self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+            self.stats.increment("evictions", len(evicted))
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """
+        """
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,166 @@
+"""
+JSON decoding of API responses.
+
+Responses are decoded by the fastest available backend: `orjson`_, then `pysimdjson`_, then the
+standard library :py:mod:`json` module (see :py:func:`set_backend`).
+:py:class:`LazyDocument` keeps the raw response body, and only decodes it when a key is accessed.
+
+.. _orjson: https://github.com/ijl/orjson
+.. _pysimdjson: https://github.com/TkTech/pysimdjson
+"""
+
+import collections.abc
+import json
+import threading
+import typing
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+
+def _backends() -> typing.Dict[str, typing.Callable[[typing.Union[bytes, str]], typing.Any]]:
+    """
+    :return: Decoding function of each installed backend, from fastest to slowest
+    """
+    backends = {}
+    if orjson is not None:
+        backends["orjson"] = orjson.loads
+    if simdjson is not None:
+        backends["simdjson"] = simdjson.loads
+    backends["json"] = json.loads
+    return backends
+
+
+_BACKENDS = _backends()
+_backend = next(iter(_BACKENDS))
+_backend_lock = threading.Lock()
+
+
+def backends() -> typing.List[str]:
+    """
+    :return: Names of the installed backends, from fastest to slowest
+    """
+    return list(_BACKENDS)
+
+
+def get_backend() -> str:
+    """
+    :return: Name of the backend used by :py:func:`loads`
+    """
+    return _backend
+
+
+def set_backend(name: typing.Optional[str] = None) -> str:
+    """
+    :param name: ``"orjson"``, ``"simdjson"`` or ``"json"``, or ``None`` for the fastest installed
+        backend
+    :return: The previous backend
+    :raise ValueError: If the backend is not installed
+    """
+    global _backend
+    if name is not None and name not in _BACKENDS:
+        raise ValueError(f"JSON backend not installed: {name!r} (installed: {backends()})")
+    with _backend_lock:
+        previous, _backend = _backend, name or next(iter(_BACKENDS))
+    return previous
+
+
+def loads(data: typing.Union[bytes, str]) -> typing.Any:
+    """
+    :param data: JSON document (UTF-8 encoded, if ``bytes``)
+    :return:
+    """
+    return _BACKENDS[_backend](data)
+
+
+class LazyDocument(collections.abc.Mapping):
+    """
+    Read-only mapping over the raw bytes of a JSON object, which is only decoded on first access.
+
+    With the ``simdjson`` backend, only the value of each accessed key is converted to Python
+    objects, and kept.
+    With the other backends, the whole document is decoded once, on first access, and kept.
+    The backend is the one selected (see :py:func:`set_backend`) when the document is created.
+
+    :param data: JSON object (UTF-8 encoded)
+    """
+    def __init__(self, data: bytes):
+        self._data = data
+        self._backend = _backend
+        self._document: typing.Optional[dict] = None
+        self._values: typing.Dict[str, typing.Any] = {}
+        self._keys: typing.Optional[typing.List[str]] = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        decoded = list(self._document or self._values)
+        return f"{type(self).__name__}(nbytes={self.nbytes}, decoded={decoded})"
+
+    def __getitem__(self, key: str) -> typing.Any:
+        with self._lock:
+            if self._backend != "simdjson":
+                return self._decoded()[key]
+            if key not in self._values:
+                self._values[key] = self._decode(key)
+            return self._values[key]
+
+    def __iter__(self) -> typing.Iterator[str]:
+        with self._lock:
+            if self._keys is None:
+                if self._backend == "simdjson":
+                    parser = simdjson.Parser()
+                    self._keys = list(parser.parse(self._data).keys())
+                else:
+                    self._keys = list(self._decoded())
+            return iter(self._keys)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    @property
+    def raw(self) -> bytes:
+        """
+        The raw JSON object.
+        """
+        return self._data
+
+    @property
+    def nbytes(self) -> int:
+        """
+        """
+        return len(self._data)
+
+    def decode(self) -> dict:
+        """
+        :return: The whole JSON object
+        """
+        return _BACKENDS[self._backend](self._data)
+
+    def _decoded(self) -> dict:
+        """
+        :return: The whole JSON object, decoded on first call
+        """
+        if self._document is None:
+            self._document = _BACKENDS[self._backend](self._data)
+        return self._document
+
+    def _decode(self, key: str) -> typing.Any:
+        """
+        :param key:
+        :return:
+        :raise KeyError:
+        """
+        parser = simdjson.Parser()
+        value = parser.parse(self._data)[key]
+        if isinstance(value, simdjson.Object):
+            return value.as_dict()
+        if isinstance(value, simdjson.Array):
+            return value.as_list()
+        return value
@@ -0,0 +1,241 @@
+"""
+Incremental extraction of elements (e.g., table rows) from HTML documents, without building the
+parse tree of the whole document.
+
+The document is fed to an :py:class:`lxml.etree.HTMLPullParser` chunk by chunk (e.g., from
+:py:meth:`requests.Response.iter_content`).
+Each element matching a selector is yielded as soon as it is complete, and every element outside
+the matches is discarded as soon as it is complete, so memory use is bounded by the size of the
+largest match rather than the size of the document.
+
+Selectors are a subset of CSS: compound selectors of a tag name, ID, classes and
+``:nth-of-type(n)`` (e.g., ``div#sheets-viewport``, ``td:nth-of-type(1)``), separated by
+descendant combinators (whitespace).
+"""
+
+import re
+import typing
+
+import requests
+from lxml import etree
+
+
+_COMPOUND = re.compile(
+    r"^(?P<tag>[a-zA-Z][\w-]*|\*)?(?P<rest>(?:[#.][\w-]+|:nth-of-type\(\d+\))*)$"
+)
+_SIMPLE = re.compile(r"([#.])([\w-]+)|:nth-of-type\((\d+)\)")
+
+
+class _Compound(typing.NamedTuple):
+    """
+    Compound selector (e.g., ``div#id.class:nth-of-type(2)``).
+    """
+    tag: typing.Optional[str]
+    id: typing.Optional[str]
+    classes: typing.FrozenSet[str]
+    nth: typing.Optional[int]
+
+    def matches(self, tag: str, attrib: typing.Mapping[str, str], nth: int) -> bool:
+        """
+        :param tag:
+        :param attrib:
+        :param nth: Position of the element among its siblings of the same tag, starting at 1
+        :return:
+        """
+        return (
+            (self.tag is None or self.tag == tag)
+            and (self.id is None or attrib.get("id") == self.id)
+            and self.classes <= set(attrib.get("class", "").split())
+            and (self.nth is None or self.nth == nth)
+        )
+
+
+def parse_selector(selector: str) -> typing.Tuple[_Compound, ...]:
+    """
+    :param selector:
+    :return: Compound selectors, from outermost to innermost
+    :raise ValueError: If ``selector`` is not supported
+    """
+    compounds = []
+    for part in selector.split():
+        match = _COMPOUND.match(part)
+        if match is None:
+            raise ValueError(f"unsupported selector: {selector!r}")
+
+        id_, classes, nth = None, set(), None
+        for prefix, name, position in _SIMPLE.findall(match.group("rest")):
+            if prefix == "#":
+                id_ = name
+            elif prefix == ".":
+                classes.add(name)
+            else:
+                nth = int(position)
+
+        tag = match.group("tag")
+        compounds.append(_Compound(
+            None if tag in (None, "*") else tag.lower(), id_, frozenset(classes), nth
+        ))
+
+    if not compounds:
+        raise ValueError(f"unsupported selector: {selector!r}")
+    return tuple(compounds)
+
+
+def _matches(
+    selector: typing.Tuple[_Compound, ...],
+    path: typing.List[typing.Tuple[str, typing.Mapping[str, str], int]]
+) -> bool:
+    """
+    :param selector:
+    :param path: Tag, attributes and position of the element and its ancestors, from the root
+    :return: Whether the last element of ``path`` matches ``selector``
+    """
+    if not selector[-1].matches(*path[-1]):
+        return False
+
+    remaining = len(selector) - 2
+    for ancestor in reversed(path[:-1]):
+        if remaining < 0:
+            break
+        if selector[remaining].matches(*ancestor):
+            remaining -= 1
+    return remaining < 0
+
+
+def iter_elements(
+    chunks: typing.Iterable[bytes], selector: str, *, encoding: typing.Optional[str] = None
+) -> typing.Iterator[etree._Element]:
+    """
+    Elements nested within a match are not matched themselves.
+
+    :param chunks: Chunks of the HTML document
+    :param selector:
+    :param encoding: Encoding of the document, or ``None`` to detect it
+    :return: Elements matching ``selector``, in document order. Each element is only valid until
+        the next element is requested, after which it is discarded.
+    :raise ValueError: If ``selector`` is not supported
+    """
+    compounds = parse_selector(selector)
+    parser = etree.HTMLPullParser(events=("start", "end"), encoding=encoding)
+
+    # Tag, attributes and position of each open element, and the tag counts of its children
+    path: typing.List[typing.Tuple[str, typing.Mapping[str, str], int]] = []
+    counts: typing.List[typing.Dict[str, int]] = [{}]
+    match: typing.Optional[etree._Element] = None
+
+    def events() -> typing.Iterator[typing.Tuple[str, etree._Element]]:
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+
+    for event, element in events():
+        if not isinstance(element.tag, str):
+            continue
+
+        if event == "start":
+            tag = element.tag.lower()
+            nth = counts[-1][tag] = counts[-1].get(tag, 0) + 1
+            path.append((tag, element.attrib, nth))
+            counts.append({})
+            if match is None and _matches(compounds, path):
+                match = element
+            continue
+
+        path.pop()
+        counts.pop()
+        if match is not None and element is not match:
+            continue
+        if element is match:
+            match = None
+            yield element
+
+        # Discard the complete element, and its complete preceding siblings
+        element.clear()
+        parent = element.getparent()
+        if parent is not None:
+            while element.getprevious() is not None:
+                del parent[0]
+
+
+def iter_table_rows(
+    chunks: typing.Iterable[bytes], selector: str, *, encoding: typing.Optional[str] = None,
+    head: bool = True
+) -> typing.Iterator[typing.List[str]]:
+    """
+    Cells spanning several columns or rows (``colspan``/``rowspan``) are repeated in each column
+    and row they span, as by :py:func:`pandas.read_html`.
+
+    The HTML parser does not insert the ``<tbody>`` elements that browsers imply, so selectors
+    should not depend on them (e.g., ``table#data tr`` rather than ``table#data tbody tr``).
+
+    :param chunks: Chunks of the HTML document
+    :param selector: Selector of the table rows (e.g., ``table#data tr``)
+    :param encoding: Encoding of the document, or ``None`` to detect it
+    :param head: Whether to include the rows of the ``<thead>`` of a table
+    :return: Text of the header and data cells of each row
+    :raise ValueError: If ``selector`` is not supported
+    """
+    # Text of the cells spanning into the next rows, and the number of those rows, by column
+    spans: typing.Dict[int, typing.Tuple[int, str]] = {}
+    section = None
+
+    for row in iter_elements(chunks, selector, encoding=encoding):
+        parent = row.getparent()
+        if parent is not section:
+            section, spans = parent, {}
+        if not head and parent is not None and str(parent.tag).lower() == "thead":
+            continue
+
+        cells: typing.List[str] = []
+
+        def spanned(until: typing.Optional[int] = None) -> None:
+            while spans and (until is None or len(cells) < until):
+                column = len(cells)
+                if column not in spans:
+                    if until is not None or column > max(spans):
+                        break
+                    cells.append("")
+                    continue
+                remaining, text = spans.pop(column)
+                cells.append(text)
+                if remaining > 1:
+                    spans[column] = (remaining - 1, text)
+
+        for cell in row:
+            if not isinstance(cell.tag, str) or cell.tag.lower() not in ("td", "th"):
+                continue
+            while len(cells) in spans:
+                spanned(len(cells) + 1)
+
+            text = "".join(cell.itertext()).strip()
+            rowspan = _span(cell.get("rowspan"))
+            for _ in range(_span(cell.get("colspan"))):
+                if rowspan > 1:
+                    spans[len(cells)] = (rowspan - 1, text)
+                cells.append(text)
+
+        spanned()
+        yield cells
+
+
+def _span(value: typing.Optional[str]) -> int:
+    """
+    :param value: Value of a ``colspan`` or ``rowspan`` attribute
+    :return: Number of columns or rows spanned (at least 1)
+    """
+    try:
+        return max(int(value), 1)
+    except (TypeError, ValueError):
+        return 1
+
+
+def declared_encoding(response: requests.Response) -> typing.Optional[str]:
+    """
+    :param response:
+    :return: Encoding declared by the ``Content-Type`` header of ``response``, or ``None`` (in
+        which case the parser detects the encoding from the document)
+    """
+    content_type = response.headers.get("Content-Type", "").lower()
+    return response.encoding if "charset=" in content_type else None
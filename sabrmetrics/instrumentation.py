@@ -0,0 +1,426 @@
+"""
+Metrics and tracing of requests, response decoding, parsing and table transforms.
+
+Instrumented code reports to the process-wide :py:class:`Instrument` (see
+:py:func:`get_instrument`), which by default discards everything.
+Installing another instrument (see :py:func:`set_instrument`) reports to a logger
+(:py:class:`LoggingInstrument`), an in-process registry rendered in the Prometheus text format
+(:py:class:`RegistryInstrument`) or OpenTelemetry (:py:class:`OpenTelemetryInstrument`).
+:py:func:`profile` records everything reported within a block of code.
+
+Phases (``*_seconds`` of spans) are reported as exclusive time: the time of a phase excludes
+that of the phases nested within it (e.g., the ``decode`` within a ``transform``), so that the
+totals of all phases add up to the time spent.
+
+The following metrics are reported:
+
+- ``headers_seconds``: Time from sending the request until the response headers were received
+  (including connection setup and the server's time to first byte), per request
+- ``download_seconds``: Time spent reading the response body, per request
+- ``response_bytes``: Size of the response body, per request
+- ``retries_total``: Number of retried requests
+- ``cache_<counter>_total``: Response cache counters (see :py:class:`sabrmetrics.cache.CacheStats`)
+- ``decode_seconds``: Time spent decoding JSON responses
+- ``parse_seconds``: Time spent parsing HTML and CSV responses
+- ``transform_seconds``: Time spent building tables from decoded responses
+"""
+
+import contextlib
+import contextvars
+import functools
+import logging
+import threading
+import time
+import typing
+
+
+_NULL_SPAN = contextlib.nullcontext()
+
+
+class Instrument:
+    """
+    Instrument that discards everything reported to it.
+    Subclasses override :py:meth:`count` and :py:meth:`observe` (and optionally :py:meth:`span`).
+
+    .. py:attribute:: enabled
+
+        Whether reports are recorded, so that instrumented code can skip computing them.
+
+        :type: bool
+    """
+    enabled = False
+
+    def span(self, name: str, **labels: typing.Any) -> typing.ContextManager:
+        """
+        Times a phase (e.g., ``"decode"``), reported as ``<name>_seconds``.
+
+        :param name:
+        :param labels:
+        :return:
+        """
+        return _NULL_SPAN
+
+    def count(self, name: str, value: float = 1, **labels: typing.Any) -> None:
+        """
+        Increments a counter.
+
+        :param name:
+        :param value:
+        :param labels:
+        """
+
+    def observe(self, name: str, value: float, **labels: typing.Any) -> None:
+        """
+        Records a measurement (e.g., a duration or a size).
+
+        :param name:
+        :param value:
+        :param labels:
+        """
+
+
+class _Timer:
+    """
+    Reports the exclusive time of a span: the time of the spans nested within it (in the same
+    context) is subtracted.
+
+    :param instrument:
+    :param name:
+    :param labels:
+    """
+    __slots__ = ("_instrument", "_name", "_labels", "_start", "_nested", "_parent", "_token")
+
+    def __init__(self, instrument: Instrument, name: str, labels: typing.Dict[str, typing.Any]):
+        self._instrument = instrument
+        self._name = name
+        self._labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self._nested = 0.0
+        self._parent = _span.get()
+        self._token = _span.set(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args) -> None:
+        elapsed = time.perf_counter() - self._start
+        _span.reset(self._token)
+        if self._parent is not None:
+            self._parent._nested += elapsed
+        self._instrument.observe(
+            f"{self._name}_seconds", max(elapsed - self._nested, 0.0), **self._labels
+        )
+
+
+_span: "contextvars.ContextVar[typing.Optional[_Timer]]" = contextvars.ContextVar(
+    "sabrmetrics_span", default=None
+)
+
+
+class LoggingInstrument(Instrument):
+    """
+    Logs every report.
+
+    :param logger: Defaults to the ``sabrmetrics`` logger
+    :param level:
+    """
+    enabled = True
+
+    def __init__(self, logger: typing.Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        self._logger = logger or logging.getLogger("sabrmetrics")
+        self._level = level
+
+    def span(self, name: str, **labels: typing.Any) -> typing.ContextManager:
+        return _Timer(self, name, labels)
+
+    def count(self, name: str, value: float = 1, **labels: typing.Any) -> None:
+        self._logger.log(self._level, "%s += %s %s", name, value, labels)
+
+    def observe(self, name: str, value: float, **labels: typing.Any) -> None:
+        self._logger.log(self._level, "%s = %s %s", name, value, labels)
+
+
+class RegistryInstrument(Instrument):
+    """
+    Aggregates reports in memory: counters are summed, and measurements are summarized by their
+    count and sum (like Prometheus summaries).
+
+    :param namespace: Prefix of the metric names in :py:meth:`render`
+    """
+    enabled = True
+
+    def __init__(self, namespace: str = "sabrmetrics"):
+        self._namespace = namespace
+        self._lock = threading.Lock()
+        self._counters: typing.Dict[typing.Tuple, float] = {}
+        self._summaries: typing.Dict[typing.Tuple, typing.List[float]] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(counters={len(self._counters)}, "
+            f"summaries={len(self._summaries)})"
+        )
+
+    def span(self, name: str, **labels: typing.Any) -> typing.ContextManager:
+        return _Timer(self, name, labels)
+
+    def count(self, name: str, value: float = 1, **labels: typing.Any) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: typing.Any) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            summary = self._summaries.setdefault(key, [0, 0.0])
+            summary[0] += 1
+            summary[1] += value
+
+    def counters(self) -> typing.Dict[typing.Tuple, float]:
+        """
+        :return: Value of each counter, keyed by name and labels
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    def summaries(self) -> typing.Dict[typing.Tuple, typing.Tuple[int, float]]:
+        """
+        :return: Count and sum of the measurements, keyed by name and labels
+        """
+        with self._lock:
+            return {k: tuple(v) for k, v in self._summaries.items()}
+
+    def reset(self) -> None:
+        """
+        """
+        with self._lock:
+            self._counters.clear()
+            self._summaries.clear()
+
+    def render(self) -> str:
+        """
+        :return: All metrics, in the Prometheus text exposition format
+        """
+        lines = []
+        for name, kind, samples in self._families():
+            lines.append(f"# TYPE {name} {kind}")
+            for suffix, labels, value in samples:
+                lines.append(f"{name}{suffix}{self._labels(labels)} {value:g}")
+        return "\n".join(lines) + "\n"
+
+    def _families(self) -> typing.Iterator[typing.Tuple[str, str, typing.List[typing.Tuple]]]:
+        """
+        :return: Name, type and samples (suffix, labels and value) of each metric
+        """
+        families: typing.Dict[typing.Tuple[str, str], typing.List[typing.Tuple]] = {}
+        for (name, labels), value in sorted(self.counters().items()):
+            families.setdefault((name, "counter"), []).append(("", labels, value))
+        for (name, labels), (count, total) in sorted(self.summaries().items()):
+            samples = families.setdefault((name, "summary"), [])
+            samples.extend([("_count", labels, count), ("_sum", labels, total)])
+
+        for (name, kind), samples in families.items():
+            yield f"{self._namespace}_{name}", kind, samples
+
+    @staticmethod
+    def _labels(labels: typing.Tuple[typing.Tuple[str, typing.Any], ...]) -> str:
+        """
+        :param labels:
+        :return:
+        """
+        if not labels:
+            return ""
+        values = (
+            "{}=\"{}\"".format(
+                k, str(v).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+            )
+            for k, v in labels
+        )
+        return "{" + ",".join(values) + "}"
+
+
+class OpenTelemetryInstrument(Instrument):
+    """
+    Reports phases as OpenTelemetry spans, counters as OpenTelemetry counters and measurements as
+    OpenTelemetry histograms.
+    Requires the optional ``opentelemetry-api`` dependency.
+
+    :param tracer: Defaults to the tracer of the global tracer provider
+    :param meter: Defaults to the meter of the global meter provider
+    :raise ImportError: If ``opentelemetry-api`` is not installed
+    """
+    enabled = True
+
+    def __init__(self, tracer: typing.Any = None, meter: typing.Any = None):
+        try:
+            from opentelemetry import metrics
+            from opentelemetry import trace
+        except ImportError as error:
+            raise ImportError(
+                "OpenTelemetry instrumentation requires opentelemetry-api; install it with "
+                "'pip install opentelemetry-api'"
+            ) from error
+
+        self._tracer = tracer or trace.get_tracer("sabrmetrics")
+        self._meter = meter or metrics.get_meter("sabrmetrics")
+        self._lock = threading.Lock()
+        self._instruments: typing.Dict[str, typing.Any] = {}
+
+    def span(self, name: str, **labels: typing.Any) -> typing.ContextManager:
+        return self._tracer.start_as_current_span(name, attributes=self._attributes(labels))
+
+    def count(self, name: str, value: float = 1, **labels: typing.Any) -> None:
+        counter = self._instrument(name, self._meter.create_counter)
+        counter.add(value, attributes=self._attributes(labels))
+
+    def observe(self, name: str, value: float, **labels: typing.Any) -> None:
+        histogram = self._instrument(name, self._meter.create_histogram)
+        histogram.record(value, attributes=self._attributes(labels))
+
+    def _instrument(self, name: str, create: typing.Callable[[str], typing.Any]) -> typing.Any:
+        """
+        :param name:
+        :param create:
+        :return:
+        """
+        with self._lock:
+            if name not in self._instruments:
+                self._instruments[name] = create(f"sabrmetrics.{name}")
+            return self._instruments[name]
+
+    @staticmethod
+    def _attributes(labels: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+        """
+        :param labels:
+        :return:
+        """
+        return {
+            k: v if isinstance(v, (str, bool, int, float)) else str(v) for k, v in labels.items()
+        }
+
+
+class ProfileReport(Instrument):
+    """
+    Records every report made within a :py:func:`profile` block, in order.
+
+    :param forward: Instrument that reports are also passed on to
+    """
+    enabled = True
+
+    def __init__(self, forward: typing.Optional[Instrument] = None):
+        self._forward = forward or Instrument()
+        self._lock = threading.Lock()
+        self._events: typing.List[typing.Tuple[str, float, typing.Dict[str, typing.Any]]] = []
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(events={len(self._events)})"
+
+    def __str__(self) -> str:
+        rows = [("metric", "count", "total")]
+        for name, (count, total) in self.summary().items():
+            rows.append((name, str(count), f"{total:.6g}"))
+        widths = [max(len(r[i]) for r in rows) for i in range(3)]
+        return "\n".join(
+            f"{r[0]:<{widths[0]}}  {r[1]:>{widths[1]}}  {r[2]:>{widths[2]}}" for r in rows
+        )
+
+    @property
+    def events(self) -> typing.List[typing.Tuple[str, float, typing.Dict[str, typing.Any]]]:
+        """
+        Name, value and labels of every report, in order.
+        """
+        with self._lock:
+            return list(self._events)
+
+    def summary(self) -> typing.Dict[str, typing.Tuple[int, float]]:
+        """
+        :return: Number of reports and total value of each metric
+        """
+        summary: typing.Dict[str, typing.Tuple[int, float]] = {}
+        for name, value, _ in self.events:
+            count, total = summary.get(name, (0, 0.0))
+            summary[name] = (count + 1, total + value)
+        return summary
+
+    def span(self, name: str, **labels: typing.Any) -> typing.ContextManager:
+        return _Timer(self, name, labels)
+
+    def count(self, name: str, value: float = 1, **labels: typing.Any) -> None:
+        with self._lock:
+            self._events.append((name, value, labels))
+        self._forward.count(name, value, **labels)
+
+    def observe(self, name: str, value: float, **labels: typing.Any) -> None:
+        with self._lock:
+            self._events.append((name, value, labels))
+        self._forward.observe(name, value, **labels)
+
+
+_instrument = Instrument()
+_profile: "contextvars.ContextVar[typing.Optional[ProfileReport]]" = contextvars.ContextVar(
+    "sabrmetrics_profile", default=None
+)
+
+
+def get_instrument() -> Instrument:
+    """
+    :return: The instrument reported to by all requests, scrapers and tables: the report of the
+        innermost :py:func:`profile` block of the current context, if any, or else the
+        process-wide instrument
+    """
+    report = _profile.get()
+    return _instrument if report is None else report
+
+
+def set_instrument(instrument: typing.Optional[Instrument]) -> Instrument:
+    """
+    :param instrument: ``None`` restores the default (no-op) instrument
+    :return: The previous instrument
+    """
+    global _instrument
+    previous, _instrument = _instrument, instrument or Instrument()
+    return previous
+
+
+@contextlib.contextmanager
+def profile() -> typing.Iterator[ProfileReport]:
+    """
+    Records every report made within the block in a :py:class:`ProfileReport`.
+    Reports are still passed on to the current instrument.
+
+    The report is scoped to the current context (thread or asyncio task), so that concurrent
+    blocks record only their own reports.
+    Work that the package runs in worker threads on behalf of the block (e.g.,
+    :py:func:`sabrmetrics.mlb.gather_standings`) runs in a copy of the context, and is recorded
+    too (see :py:func:`in_context`).
+    """
+    report = ProfileReport(get_instrument())
+    token = _profile.set(report)
+    try:
+        yield report
+    finally:
+        _profile.reset(token)
+
+
+T = typing.TypeVar("T")
+
+
+def in_context(
+    function: typing.Callable[..., T], *args: typing.Any, **kwargs: typing.Any
+) -> typing.Callable[[], T]:
+    """
+    Binds a call to a copy of the current context, e.g., for running it in a worker thread
+    within a :py:func:`profile` block.
+    Spans of the call are not nested within the span (if any) that is current when binding it,
+    since they may run concurrently with it.
+
+    :param function:
+    :param args:
+    :param kwargs:
+    :return: Zero-argument callable making the call
+    """
+    def call() -> T:
+        _span.set(None)
+        return function(*args, **kwargs)
+
+    return functools.partial(contextvars.copy_context().run, call)
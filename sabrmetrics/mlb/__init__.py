@@ -1,5 +1,10 @@
 """
 """
 
+from .history import StandingsHistory
 from .leagues import League
+from .leagues import SeasonCalendar
+from .leagues import classify_dates
+from .poller import StandingsPoller
 from .standings import Standings
+from .standings import gather_standings
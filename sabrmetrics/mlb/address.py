@@ -1,35 +1,171 @@
 """
 """
 
+import datetime
+import string
+import threading
+import types
 import typing
+import urllib.parse
+
+
+class LazyDefault:
+    """
+    Field default that is resolved on first use, rather than when the address class is defined.
+    The resolved value is memoized until the end of the day on which it was resolved (or until
+    :py:meth:`reset`), since defaults such as the latest season depend on the current date.
+
+    :param function: Zero-argument callable returning the default value
+    """
+    def __init__(self, function: typing.Callable[[], typing.Any]):
+        self._function = function
+        self._lock = threading.Lock()
+        self._day: typing.Optional[datetime.date] = None
+        self._value = None
+
+    def __repr__(self) -> str:
+        value = repr(self._value) if self.resolved else "<unresolved>"
+        return f"{type(self).__name__}({value})"
+
+    @property
+    def resolved(self) -> bool:
+        """
+        Whether the value has been resolved today.
+        """
+        return self._day == datetime.date.today()
+
+    def resolve(self) -> typing.Any:
+        """
+        :return: The memoized value, or a new value if none was resolved today
+        """
+        today = datetime.date.today()
+        if self._day != today:
+            with self._lock:
+                if self._day != today:
+                    self._value = self._function()
+                    self._day = today
+        return self._value
+
+    def reset(self) -> None:
+        """
+        Discards the memoized value, so that the next :py:meth:`resolve` calls the function again.
+        """
+        with self._lock:
+            self._day = None
+            self._value = None
+
+
+class _URL:
+    """
+    ``url`` attribute of the address classes: the URL template (a string) when accessed on the
+    class, and the rendered URL when accessed on an instance.
+    """
+    def __get__(
+        self, instance: typing.Optional["APIAddress"], owner: typing.Type["APIAddress"]
+    ) -> str:
+        if instance is None:
+            return owner.url_template
+        return instance._url
 
 
 class APIAddress:
     """
+    Immutable, hashable address (URL and query parameters) of an API resource.
+
+    Subclasses define the class attributes ``url`` (a URL template, whose ``{placeholders}`` are
+    filled from the constructor keyword arguments of the same name) and ``field_defaults``.
+    The URL and query parameters are rendered once, on construction.
+    On the class, ``url`` remains the template (e.g., ``Address.url``); on an instance, it is the
+    rendered URL.
+
+    :param kwargs: Field values, and URL template values
     """
-    url: str
-    field_defaults: typing.Dict[str, typing.Any]
+    __slots__ = ("_url", "_fields", "_query", "_hash")
+
+    url_template: str = ""
+    field_defaults: typing.Dict[str, typing.Any] = {}
+
+    def __init_subclass__(cls, **kwargs: typing.Any):
+        super().__init_subclass__(**kwargs)
+
+        if isinstance(cls.__dict__.get("url"), str):
+            cls.url_template = cls.__dict__["url"]
+            cls.url = APIAddress.__dict__["url"]
 
     def __init__(self, **kwargs: typing.Any):
-        self._fields = {}
-        for key, value in self.field_defaults.items():
-            self._fields.setdefault(
-                key,
-                kwargs[key] if key in filter(lambda x: kwargs[x] is not None, kwargs) else value
-            )
+        fields = {}
+        for key, default in self.field_defaults.items():
+            value = kwargs.get(key)
+            if value is None:
+                value = default.resolve() if isinstance(default, LazyDefault) else default
+            fields[key] = tuple(value) if isinstance(value, list) else value
+
+        url = self.url_template
+        placeholders = [p for _, p, _, _ in string.Formatter().parse(url) if p]
+        if placeholders:
+            url = url.format(**{p: kwargs[p] for p in placeholders})
+
+        object.__setattr__(self, "_url", url)
+        object.__setattr__(self, "_fields", fields)
+        object.__setattr__(self, "_query", tuple(sorted(self.parameters.items())))
+        object.__setattr__(self, "_hash", hash((type(self), self._url, self._query)))
 
     def __repr__(self) -> str:
         arguments = ", ".join(f"{k}={self.__getattribute__(k)}" for k in self.fields)
         return f"{type(self).__name__}({arguments})"
 
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if not isinstance(other, APIAddress):
+            return NotImplemented
+        return (type(self), self._url, self._query) == (type(other), other._url, other._query)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        return {k: getattr(self, k) for k in APIAddress.__slots__}
+
+    def __setstate__(self, state: typing.Dict[str, typing.Any]) -> None:
+        for key, value in state.items():
+            object.__setattr__(self, key, value)
+
+    url = _URL()
+
     @property
-    def fields(self) -> typing.Dict[str, typing.Any]:
+    def fields(self) -> typing.Mapping[str, typing.Any]:
         """
         """
-        return self._fields
-    
+        return types.MappingProxyType(self._fields)
+
     @property
     def parameters(self) -> typing.Dict[str, str]:
         """
         """
         return {}
+
+    @property
+    def query(self) -> typing.Tuple[typing.Tuple[str, str], ...]:
+        """
+        Query parameters, sorted by name, as rendered on construction.
+        """
+        return self._query
+
+    @property
+    def query_string(self) -> str:
+        """
+        """
+        return urllib.parse.urlencode(self._query)
+
+    @property
+    def immutable(self) -> bool:
+        """
+        Whether the addressed resource never changes (e.g., data for a past season), so that its
+        cached response never needs to be revalidated.
+        """
+        return False
@@ -8,6 +8,8 @@ from .scraper import APIScraper
 class Address(APIAddress):
     """
     """
+    __slots__ = ()
+
     url = "https://statsapi.mlb.com/api/v1/divisions/{division_id}"
     field_defaults = {}
 
@@ -18,10 +20,7 @@ class Division(APIScraper):
     division_id: int
 
     def __init__(self):
-        address = Address()
-        address.url = Address.url.format(division_id=self.division_id)
-
-        super().__init__(address)
+        super().__init__(Address(division_id=self.division_id))
 
 
 class ALWest(Division):
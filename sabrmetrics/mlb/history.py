@@ -0,0 +1,305 @@
+"""
+Day-by-day standings over a span of a season.
+"""
+
+import asyncio
+import concurrent.futures
+import datetime
+import typing
+
+import numpy as np
+import pandas as pd
+
+from . import standings
+from .leagues import Season
+from .scraper import APIScraper
+from sabrmetrics.instrumentation import in_context
+
+
+class StandingsHistory:
+    """
+    Standings of every team on every date of a span of a season, stored as a
+    (date x team x metric) ``float32`` array.
+    Only the regular season standings are fetched, so that the records of other standings types
+    do not overwrite those of the regular season.
+    Teams ahead of the wild card line (``"+2.0"`` wild card games back) have negative values of
+    ``wildCardGamesBack``.
+
+    The standings of each date are fetched concurrently, through the shared transport (see
+    :py:func:`sabrmetrics.transport.set_transport`), which only caches the responses if it was
+    given a response cache.
+    Dates after today (including given ``dates``) are omitted.
+
+    :param season: Defaults to the latest season (see :py:class:`sabrmetrics.mlb.standings.Address`)
+    :param span: Span of the season (see :py:attr:`Season.date_spans`)
+    :param dates: Dates to fetch, instead of every date of ``span``
+    :param league_id:
+    :param concurrency: Maximum number of requests in flight at once
+
+    .. py:attribute:: metrics
+
+        Names of the metrics stored for each team and date.
+
+        :type: tuple[str]
+    """
+    metrics = (
+        "wins", "losses", "gamesBack", "wildCardGamesBack", "divisionRank", "leagueRank",
+        "runsScored", "runsAllowed", "runDifferential"
+    )
+
+    def __init__(
+        self, season: typing.Optional[int] = None, span: str = "regular-season", *,
+        dates: typing.Optional[typing.Sequence[datetime.datetime]] = None,
+        league_id: typing.Optional[typing.Sequence[int]] = None,
+        concurrency: int = 8
+    ):
+        if season is None:
+            season = standings.Address.field_defaults["season"].resolve()
+        today = pd.Timestamp.today().normalize()
+        if dates is None:
+            start, end = Season(season).date_range(span)
+            dates = pd.date_range(start, min(pd.Timestamp(end), today), freq="D")
+        dates = pd.DatetimeIndex(dates)
+        self._season = season
+        self._dates = dates[dates.normalize() <= today]
+
+        fetches = [
+            in_context(self._fetch, season, league_id, x) for x in self._dates.to_pydatetime()
+        ]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            payloads = list(executor.map(lambda fetch: fetch(), fetches))
+
+        self._parse(payloads)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(season={self.season}, dates={len(self.dates)}, "
+            f"teams={len(self.teams)})"
+        )
+
+    @classmethod
+    async def fetch(
+        cls, *args: typing.Any,
+        executor: typing.Optional[concurrent.futures.Executor] = None, **kwargs: typing.Any
+    ) -> "StandingsHistory":
+        """
+        Asynchronous constructor.
+
+        :param args: Positional arguments to the constructor
+        :param executor:
+        :param kwargs: Keyword arguments to the constructor
+        :return:
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, in_context(cls, *args, **kwargs))
+
+    @property
+    def season(self) -> int:
+        """
+        """
+        return self._season
+
+    @property
+    def dates(self) -> pd.DatetimeIndex:
+        """
+        """
+        return self._dates
+
+    @property
+    def teams(self) -> pd.DataFrame:
+        """
+        ID, name, league ID and division ID of each team, in the order of the team axis.
+        """
+        return self._teams
+
+    @property
+    def cube(self) -> np.ndarray:
+        """
+        (date x team x metric) array of standings.
+        Missing values (e.g., dates before a team's first game) are ``NaN``.
+        """
+        return self._cube
+
+    @property
+    def nbytes(self) -> int:
+        """
+        """
+        return self._cube.nbytes
+
+    def metric(self, name: str) -> pd.DataFrame:
+        """
+        :param name: One of :py:attr:`metrics`
+        :return: (date x team ID) table of the metric
+        """
+        return self._frame(self._cube[:, :, self.metrics.index(name)])
+
+    def frame(self) -> pd.DataFrame:
+        """
+        :return: Table of all metrics, indexed by (date, team ID)
+        """
+        index = pd.MultiIndex.from_product(
+            [self.dates, self.teams.loc[:, "id"]], names=["date", "team"]
+        )
+        return pd.DataFrame(
+            self._cube.reshape(-1, len(self.metrics)), index=index, columns=list(self.metrics)
+        )
+
+    def win_pct(self) -> pd.DataFrame:
+        """
+        :return: (date x team ID) table of winning percentages
+        """
+        wins, losses = self._metric("wins"), self._metric("losses")
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self._frame(wins / (wins + losses))
+
+    def rolling_win_pct(self, window: int = 10) -> pd.DataFrame:
+        """
+        :param window: Number of dates
+        :return: (date x team ID) table of winning percentages over the last ``window`` dates
+        :raise ValueError: If ``window`` is less than 1
+        """
+        if window < 1:
+            raise ValueError(f"window must be at least 1, not {window}")
+
+        wins, losses = self._metric("wins"), self._metric("losses")
+        recent_wins = np.full_like(wins, np.nan)
+        recent_games = np.full_like(wins, np.nan)
+        recent_wins[window:] = wins[window:] - wins[:-window]
+        recent_games[window:] = recent_wins[window:] + losses[window:] - losses[:-window]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self._frame(recent_wins / recent_games)
+
+    def playoff_line_distance(self, spots: int = 6) -> pd.DataFrame:
+        """
+        Division leaders qualify automatically, so the playoff line is held by the team with the
+        last wild card spot: the ``spots - divisions``-th best team by winning percentage among
+        the teams that do not lead their division.
+
+        :param spots: Number of playoff spots per league, including those of division winners
+        :return: (date x team ID) table of games behind (positive) or ahead of (negative) the
+            team holding the last wild card spot of its league
+        """
+        wins, losses = self._metric("wins"), self._metric("losses")
+        distance = np.full_like(wins, np.nan)
+        league_ids = self.teams.loc[:, "league"].to_numpy()
+        division_ids = self.teams.loc[:, "division"].to_numpy()
+
+        for league_id in self.teams.loc[:, "league"].dropna().unique():
+            columns = np.flatnonzero(league_ids == league_id)
+            divisions = pd.unique(division_ids[columns])
+            wild_cards = spots - len(divisions)
+            if wild_cards < 1 or len(columns) < spots:
+                continue
+            w, l = wins[:, columns], losses[:, columns]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                pct = np.nan_to_num(w / (w + l), nan=-1.0)
+
+            contenders = pct.copy()
+            rows = np.arange(len(w))
+            for division_id in divisions:
+                members = np.flatnonzero(division_ids[columns] == division_id)
+                leaders = members[np.argmax(pct[:, members], axis=1)]
+                contenders[rows, leaders] = -np.inf
+
+            line = np.argsort(-contenders, axis=1, kind="stable")[:, wild_cards - 1]
+            w_line, l_line = w[rows, line][:, None], l[rows, line][:, None]
+            distance[:, columns] = ((w_line - w) + (l - l_line)) / 2
+
+        return self._frame(distance)
+
+    def magic_number(self, games: int = 162) -> pd.DataFrame:
+        """
+        :param games: Number of games in the season
+        :return: (date x team ID) table of each team's magic number for clinching its division
+            (meaningful for division leaders)
+        """
+        wins, losses = self._metric("wins"), self._metric("losses")
+        magic = np.full_like(wins, np.nan)
+
+        for division_id in self.teams.loc[:, "division"].dropna().unique():
+            columns = np.flatnonzero(self.teams.loc[:, "division"].to_numpy() == division_id)
+            if len(columns) < 2:
+                continue
+            l = np.nan_to_num(losses[:, columns], nan=0.0)
+            order = np.sort(l, axis=1)
+            lowest, second = order[:, :1], order[:, 1:2]
+            rival_losses = np.where(l == lowest, second, lowest)
+            magic[:, columns] = np.maximum(games + 1 - wins[:, columns] - rival_losses, 0)
+
+        return self._frame(magic)
+
+    @staticmethod
+    def _fetch(
+        season: int, league_id: typing.Optional[typing.Sequence[int]], date: datetime.datetime
+    ) -> dict:
+        """
+        :param season:
+        :param league_id:
+        :param date:
+        :return:
+        """
+        address = standings.Address(
+            league_id=tuple(map(int, league_id)) if league_id else None,
+            season=season, date=date, standings_types=("regularSeason",)
+        )
+        return APIScraper(address).data
+
+    def _parse(self, payloads: typing.List[dict]) -> None:
+        """
+        :param payloads: Standings documents, in the order of :py:attr:`dates`
+        """
+        teams: typing.Dict[int, typing.Dict[str, typing.Any]] = {}
+        values: typing.List[typing.Dict[int, typing.List[float]]] = []
+
+        for payload in payloads:
+            values.append({})
+            for record in payload.get("records", []):
+                for team_record in record["teamRecords"]:
+                    team_id = team_record["team"]["id"]
+                    teams[team_id] = {
+                        "id": team_id, "name": team_record["team"].get("name"),
+                        "league": record.get("league", {}).get("id"),
+                        "division": record.get("division", {}).get("id"),
+                    }
+                    values[-1][team_id] = [
+                        self._number(k, team_record.get(k)) for k in self.metrics
+                    ]
+
+        self._teams = pd.DataFrame(
+            [teams[k] for k in sorted(teams)], columns=["id", "name", "league", "division"]
+        )
+        self._cube = np.full((len(payloads), len(teams), len(self.metrics)), np.nan, np.float32)
+        for i, day in enumerate(values):
+            for j, team_id in enumerate(self._teams.loc[:, "id"]):
+                if team_id in day:
+                    self._cube[i, j] = day[team_id]
+
+    @staticmethod
+    def _number(metric: str, value: typing.Any) -> float:
+        """
+        :param metric:
+        :param value:
+        :return:
+        """
+        if value == "-":
+            return 0.0 if metric == "gamesBack" else np.nan
+        if metric == "wildCardGamesBack" and isinstance(value, str) and value.startswith("+"):
+            value = f"-{value[1:]}"
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return np.nan
+
+    def _metric(self, name: str) -> np.ndarray:
+        """
+        :param name:
+        :return:
+        """
+        return self._cube[:, :, self.metrics.index(name)].astype(np.float64)
+
+    def _frame(self, values: np.ndarray) -> pd.DataFrame:
+        """
+        :param values:
+        :return:
+        """
+        return pd.DataFrame(values, index=self.dates, columns=self.teams.loc[:, "id"].to_numpy())
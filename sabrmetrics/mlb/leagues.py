@@ -1,19 +1,30 @@
 """
 """
 
+import concurrent.futures
 import datetime
+import re
+import threading
 import typing
 
+import numpy as np
+import pandas as pd
 
 from . import divisions
 from .address import APIAddress
 from .scraper import APIScraper
 from sabrmetrics import TODAY
+from sabrmetrics.instrumentation import in_context
+
+
+_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
 
 class Address(APIAddress):
     """
     """
+    __slots__ = ()
+
     url = "https://statsapi.mlb.com/api/v1/league/{league_id}"
     field_defaults = {"season": TODAY.year}
 
@@ -29,6 +40,12 @@ class Address(APIAddress):
         """
         return str(self.fields["season"])
 
+    @property
+    def immutable(self) -> bool:
+        """
+        """
+        return int(self.fields["season"]) < TODAY.year
+
 
 class League(APIScraper):
     """
@@ -38,10 +55,7 @@ class League(APIScraper):
     divisions: typing.List[typing.Type[divisions.Division]]
 
     def __init__(self, season: int = TODAY.year):
-        address = Address(season=season)
-        address.url = Address.url.format(league_id=self.league_id)
-
-        super().__init__(address)
+        super().__init__(Address(season=season, league_id=self.league_id))
 
 
 class AmericanLeague(League):
@@ -89,9 +103,21 @@ class Season:
     def __init__(self, year: int = TODAY.year, *, league: League = AmericanLeague):
         self._year = year
         self._data = league(year)["leagues"][0]["seasonDateInfo"]
+        self._values: typing.Dict[str, typing.Union[int, float, str, datetime.datetime]] = {}
 
     def __getitem__(self, key: str) -> typing.Union[int, float, str, datetime.datetime]:
-        value = self.data[key]
+        if key not in self._values:
+            self._values[key] = self._parse(self.data[key])
+        return self._values[key]
+
+    @staticmethod
+    def _parse(value: typing.Any) -> typing.Union[int, float, str, datetime.datetime]:
+        """
+        :param value:
+        :return:
+        """
+        if isinstance(value, str) and _DATE.match(value):
+            return datetime.datetime.strptime(value, "%Y-%m-%d")
 
         try:
             return int(value)
@@ -99,24 +125,31 @@ class Season:
             try:
                 return float(value)
             except ValueError:
-                try:
-                    return datetime.datetime.strptime(value, "%Y-%m-%d")
-                except ValueError:
-                    return str(value)
+                return str(value)
 
     @classmethod
     def latest_season(
-        cls, date: datetime.datetime = TODAY, span: str = "regular-season"
+        cls, date: typing.Optional[datetime.datetime] = None, span: str = "regular-season"
     ) -> "Season":
         """
+        :param date: Defaults to the current date and time
+        :param span:
+        :return:
+        :raise ValueError:
+        """
+        date = date or datetime.datetime.today()
+        return cls._latest_season(cls(date.year), date, span)
+
+    @classmethod
+    def _latest_season(cls, season: "Season", date: datetime.datetime, span: str) -> "Season":
+        """
+        :param season: Season of the year of ``date``
         :param date:
         :param span:
         :return:
         :raise ValueError:
         """
-        season = cls(date.year)
-        keys = cls.date_spans[span]
-        start = season[keys[0]]
+        start = season[cls.date_spans[span][0]]
 
         if datetime.datetime(date.year, 1, 1) <= date < start:
             return cls(date.year - 1)
@@ -126,28 +159,33 @@ class Season:
             raise ValueError(date)
 
     @classmethod
-    def latest_year(cls, date: datetime.datetime = TODAY, span: str = "regular-season") -> int:
+    def latest_year(
+        cls, date: typing.Optional[datetime.datetime] = None, span: str = "regular-season"
+    ) -> int:
         """
-        :param date:
+        :param date: Defaults to the current date and time
         :param span:
         :return:
         """
         return cls.latest_season(date, span).year
 
     @classmethod
-    def latest_date(cls, date: datetime.datetime = TODAY, span: str = "regular-season") -> int:
+    def latest_date(
+        cls, date: typing.Optional[datetime.datetime] = None, span: str = "regular-season"
+    ) -> int:
         """
-        :param date:
+        :param date: Defaults to the current date and time
         :return:
         :raise ValueError:
         """
+        date = date or datetime.datetime.today()
         season = cls(date.year)
         keys = cls.date_spans[span]
         start, end = season[keys[0]], season[keys[1]]
 
         if start <= date <= end:
             return date
-        return cls.latest_season(date, span)[keys[1]]
+        return cls._latest_season(season, date, span)[keys[1]]
 
     @property
     def data(self) -> dict:
@@ -183,3 +221,152 @@ class Season:
         """
         start, end = self.date_range(span)
         return start <= date <= end
+
+
+class SeasonCalendar:
+    """
+    Span boundaries (see :py:attr:`Season.date_spans`) of several seasons, for classifying large
+    numbers of dates at once.
+
+    :param years:
+    :param league:
+    :param concurrency: Maximum number of seasons fetched at once
+
+    .. py:attribute:: default_spans
+
+        Spans assigned by :py:meth:`classify_dates`, in order of precedence.
+
+        :type: tuple[str]
+    """
+    default_spans = (
+        "postseason", "first-half", "second-half", "regular-season", "spring", "preseaon",
+        "offseason"
+    )
+
+    def __init__(
+        self, years: typing.Iterable[int], *, league: League = AmericanLeague,
+        concurrency: int = 8
+    ):
+        years = sorted(set(map(int, years)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            seasons = executor.map(
+                lambda season: season(), [in_context(Season, x, league=league) for x in years]
+            )
+            self._seasons = dict(zip(years, seasons))
+
+        keys = sorted({k for v in Season.date_spans.values() for k in v})
+        self._table = pd.DataFrame(
+            [[s.data.get(k) for k in keys] for s in self._seasons.values()],
+            index=pd.Index(years, name="year"), columns=keys
+        ).apply(pd.to_datetime, format="%Y-%m-%d", errors="coerce")
+        self._bounds: typing.Dict[str, typing.Tuple[np.ndarray, np.ndarray]] = {}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(years={list(self._seasons)})"
+
+    def __getitem__(self, year: int) -> Season:
+        return self._seasons[year]
+
+    @property
+    def table(self) -> pd.DataFrame:
+        """
+        Date of each season (row) for each ``seasonDateInfo`` key (column).
+        """
+        return self._table
+
+    def span_mask(
+        self, dates: typing.Union[np.ndarray, pd.Series, typing.Sequence], span: str
+    ) -> np.ndarray:
+        """
+        :param dates:
+        :param span:
+        :return: Whether each date lies within ``span`` of any season
+        """
+        days = self._days(dates)
+        starts, ends = self._span_bounds(span)
+
+        position = np.searchsorted(starts, days, side="right") - 1
+        found = position >= 0
+        mask = np.zeros(len(days), dtype=bool)
+        mask[found] = days[found] <= ends[position[found]]
+        return mask
+
+    def classify_dates(
+        self, dates: typing.Union[np.ndarray, pd.Series, typing.Sequence],
+        spans: typing.Optional[typing.Sequence[str]] = None
+    ) -> typing.Union[pd.Categorical, pd.Series]:
+        """
+        :param dates:
+        :param spans: Spans to assign, in order of precedence (defaults to
+            :py:attr:`default_spans`)
+        :return: The first span of ``spans`` containing each date (missing if none does), as a
+            ``Series`` if ``dates`` is a ``Series``
+        """
+        spans = list(spans or self.default_spans)
+        codes = np.full(len(dates), -1, dtype=np.int8)
+        for code, span in enumerate(spans):
+            codes[(codes < 0) & self.span_mask(dates, span)] = code
+
+        labels = pd.Categorical.from_codes(codes, categories=spans)
+        if isinstance(dates, pd.Series):
+            return pd.Series(labels, index=dates.index, name=dates.name)
+        return labels
+
+    def _span_bounds(self, span: str) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """
+        :param span:
+        :return: Start and end days of ``span`` of each season, sorted by start
+        """
+        if span not in self._bounds:
+            start, end = Season.date_spans[span]
+            bounds = self._table.loc[:, [start, end]].dropna().sort_values(start)
+            self._bounds[span] = (
+                bounds.loc[:, start].to_numpy(dtype="datetime64[D]"),
+                bounds.loc[:, end].to_numpy(dtype="datetime64[D]")
+            )
+        return self._bounds[span]
+
+    @staticmethod
+    def _days(dates: typing.Union[np.ndarray, pd.Series, typing.Sequence]) -> np.ndarray:
+        """
+        :param dates: Naive or timezone-aware dates (or ISO 8601 strings); aware dates are
+            converted to UTC
+        :return:
+        """
+        index = pd.DatetimeIndex(pd.to_datetime(dates))
+        if index.tz is not None:
+            index = index.tz_convert(None)
+        return index.to_numpy(dtype="datetime64[D]")
+
+
+# Calendars built by classify_dates, by years and league
+_calendars: typing.Dict[typing.Tuple[typing.Tuple[int, ...], League], SeasonCalendar] = {}
+_calendars_lock = threading.Lock()
+
+
+def classify_dates(
+    dates: typing.Union[np.ndarray, pd.Series, typing.Sequence],
+    spans: typing.Optional[typing.Sequence[str]] = None, *,
+    calendar: typing.Optional[SeasonCalendar] = None,
+    league: League = AmericanLeague
+) -> typing.Union[pd.Categorical, pd.Series]:
+    """
+    Vectorized :py:meth:`SeasonCalendar.classify_dates`.
+    If no ``calendar`` is given, the calendar of the years of ``dates`` (and the years before
+    them, whose offseasons extend into the next year) is built on first use, and reused by later
+    calls for the same years and league.
+
+    :param dates:
+    :param spans:
+    :param calendar:
+    :param league:
+    :return:
+    """
+    if calendar is None:
+        years = pd.DatetimeIndex(SeasonCalendar._days(dates)).year.dropna().unique()
+        key = tuple(sorted({y for x in years for y in (int(x) - 1, int(x))})), league
+        with _calendars_lock:
+            calendar = _calendars.get(key)
+            if calendar is None:
+                calendar = _calendars[key] = SeasonCalendar(key[0], league=league)
+    return calendar.classify_dates(dates, spans)
@@ -0,0 +1,203 @@
+"""
+Polling of the live standings, with change detection.
+"""
+
+import asyncio
+import datetime
+import hashlib
+import threading
+import typing
+
+from . import standings
+from .leagues import Season
+from .scraper import APIScraper
+from sabrmetrics.instrumentation import in_context
+
+
+class StandingsDelta(typing.NamedTuple):
+    """
+    Change of one standings field of one team between two polls.
+    """
+    team_id: int
+    team: str
+    field: str
+    previous: typing.Any
+    current: typing.Any
+
+
+class StandingsPoller:
+    """
+    Polls the standings and reports the per-team changes between polls.
+
+    Each poll requests the standings through a lazy :py:class:`APIScraper`, so concurrent polls
+    share a single request.
+    The raw response body is hashed, and the response is only decoded and compared when the hash
+    differs from that of the previous poll.
+    Each poll revalidates any cached response, so that no poll sees a response cached by an
+    earlier one.
+    The season calendar (the season and date polled, and whether a span in ``spans`` is in
+    progress) is fetched once per day.
+    Polls may run concurrently (e.g., from several threads).
+    The first poll records the current standings and reports no changes.
+
+    :param league_id:
+    :param interval: Seconds between polls while a season span in ``spans`` is in progress
+    :param idle_interval: Seconds between polls otherwise (e.g., in the offseason)
+    :param spans: Season spans (see :py:attr:`Season.date_spans`) during which standings change
+
+    .. py:attribute:: fields
+
+        Tracked fields of each team record.
+
+        :type: tuple[str]
+    """
+    fields = (
+        "wins", "losses", "gamesBack", "wildCardGamesBack", "divisionRank", "leagueRank",
+        "runDifferential", "streak"
+    )
+
+    def __init__(
+        self, *, league_id: typing.Optional[typing.Sequence[int]] = None,
+        interval: float = 60, idle_interval: float = 6 * 3600,
+        spans: typing.Sequence[str] = ("regular-season", "postseason")
+    ):
+        self._league_id = tuple(map(int, league_id)) if league_id else None
+        self._interval = interval
+        self._idle_interval = idle_interval
+        self._spans = tuple(spans)
+
+        self._digest: typing.Optional[str] = None
+        self._state: typing.Optional[typing.Dict[int, typing.Dict[str, typing.Any]]] = None
+        self._counts = {"polls": 0, "unchanged": 0, "parsed": 0}
+        self._calendars: typing.Dict[datetime.datetime, typing.Tuple] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(league_id={self._league_id}, stats={self.stats})"
+
+    async def __aiter__(self) -> typing.AsyncIterator[StandingsDelta]:
+        loop = asyncio.get_running_loop()
+        while True:
+            for delta in await loop.run_in_executor(None, in_context(self.poll)):
+                yield delta
+            await asyncio.sleep(await loop.run_in_executor(None, in_context(self.interval)))
+
+    @property
+    def stats(self) -> typing.Dict[str, int]:
+        """
+        Number of polls, of polls whose response was unchanged, and of responses decoded.
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    @property
+    def state(self) -> typing.Optional[typing.Dict[int, typing.Dict[str, typing.Any]]]:
+        """
+        Tracked fields of each team as of the last poll, keyed by team ID.
+        """
+        return self._state
+
+    def interval(self, now: typing.Optional[datetime.datetime] = None) -> float:
+        """
+        :param now:
+        :return: Seconds until the next poll
+        """
+        return self._interval if self._calendar(now)[2] else self._idle_interval
+
+    def poll(self, now: typing.Optional[datetime.datetime] = None) -> typing.List[StandingsDelta]:
+        """
+        :param now:
+        :return: Changes since the previous poll
+        """
+        season, date, _ = self._calendar(now)
+        address = standings.Address(league_id=self._league_id, season=season, date=date)
+        scraper = APIScraper(address, refresh=True, lazy=True)
+        scraper.response.raise_for_status()
+        digest = hashlib.sha256(scraper.data.raw).hexdigest()
+
+        with self._lock:
+            self._counts["polls"] += 1
+            if digest == self._digest:
+                self._counts["unchanged"] += 1
+                return []
+            self._digest = digest
+
+            state = self._parse(scraper.data)
+            self._counts["parsed"] += 1
+
+            previous, self._state = self._state, state
+        if previous is None:
+            return []
+
+        deltas = []
+        for team_id, fields in state.items():
+            before = previous.get(team_id, {})
+            for field in self.fields:
+                if field in fields and before.get(field) != fields[field]:
+                    deltas.append(StandingsDelta(
+                        team_id, fields["team"], field, before.get(field), fields[field]
+                    ))
+        return deltas
+
+    def run(
+        self, callback: typing.Callable[[StandingsDelta], typing.Any],
+        stop: typing.Optional[threading.Event] = None
+    ) -> None:
+        """
+        Polls until ``stop`` is set, calling ``callback`` with each change.
+
+        :param callback:
+        :param stop:
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            for delta in self.poll():
+                callback(delta)
+            stop.wait(self.interval())
+
+    def _calendar(
+        self, now: typing.Optional[datetime.datetime] = None
+    ) -> typing.Tuple[int, datetime.datetime, bool]:
+        """
+        :param now:
+        :return: Season and date of the standings to poll on the day of ``now``, and whether a
+            span in ``spans`` is in progress on that day
+        """
+        now = now or datetime.datetime.today()
+        today = datetime.datetime(now.year, now.month, now.day)
+
+        with self._lock:
+            calendar = self._calendars.get(today)
+        if calendar is not None:
+            return calendar
+
+        season, active = Season(today.year), False
+        for span in self._spans:
+            try:
+                active = season.date_in_span(today, span)
+            except (KeyError, TypeError):
+                continue
+            if active:
+                break
+
+        calendar = (Season.latest_year(today), Season.latest_date(today), active)
+        with self._lock:
+            self._calendars = {today: calendar}
+        return calendar
+
+    def _parse(
+        self, data: typing.Mapping[str, typing.Any]
+    ) -> typing.Dict[int, typing.Dict[str, typing.Any]]:
+        """
+        :param data: Standings document
+        :return:
+        """
+        state = {}
+        for record in data.get("records", []):
+            for team_record in record["teamRecords"]:
+                fields = {k: team_record.get(k) for k in self.fields if k in team_record}
+                if isinstance(fields.get("streak"), dict):
+                    fields["streak"] = fields["streak"].get("streakCode")
+                fields["team"] = team_record["team"].get("name")
+                state[team_record["team"]["id"]] = fields
+        return state
@@ -1,31 +1,78 @@
 """
 """
 
+import asyncio
+import concurrent.futures
 import typing
 
 import bs4
 import requests
 
 from .address import APIAddress
+from sabrmetrics.decoding import LazyDocument
+from sabrmetrics.decoding import loads
+from sabrmetrics.htmlstream import declared_encoding
+from sabrmetrics.htmlstream import iter_table_rows
+from sabrmetrics.instrumentation import get_instrument
+from sabrmetrics.instrumentation import in_context
+from sabrmetrics.transport import SingleFlight
+from sabrmetrics.transport import get_transport
 
 
 class Scraper:
     """
+    Concurrent scrapers of the same address (URL and query parameters) share a single request,
+    and the same decoded response (see :py:attr:`flight`).
+
     :param address:
-    :param fields:
+    :param response: Response to decode instead of requesting ``address`` (e.g., a recorded
+        response)
+    :param refresh: Whether to revalidate any cached response to ``address`` (see
+        :py:meth:`sabrmetrics.transport.Transport.get`)
+
+    .. py:attribute:: flight
+
+        Coalesces the requests (and response decoding) of concurrent scrapers.
+
+        :type: SingleFlight
     """
-    def __init__(self, address: APIAddress):
+    flight = SingleFlight()
+
+    def __init__(
+        self, address: typing.Optional[APIAddress], *,
+        response: typing.Optional[requests.Response] = None, refresh: bool = False
+    ):
         self._address = address
+        self._refresh = refresh
 
-        self._response = requests.get(
-            self.address.url, params=self.address.parameters, timeout=100
-        )
+        if response is None:
+            self._response, self._decoded = self.flight.do(self._flight_key(), self._load)
+        else:
+            self._response, self._decoded = response, self._decode(response)
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(address={self.address})"
 
+    @classmethod
+    async def fetch(
+        cls, *args: typing.Any,
+        executor: typing.Optional[concurrent.futures.Executor] = None, **kwargs: typing.Any
+    ) -> "Scraper":
+        """
+        Asynchronous constructor.
+        The blocking request (and parsing) is run in ``executor``, or the event loop's default
+        executor if ``executor`` is ``None``.
+
+        :param args: Positional arguments to the constructor
+        :param executor:
+        :param kwargs: Keyword arguments to the constructor
+        :return:
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, in_context(cls, *args, **kwargs))
+
     @property
-    def address(self) -> APIAddress:
+    def address(self) -> typing.Optional[APIAddress]:
         """
         """
         return self._address
@@ -36,39 +83,120 @@ class Scraper:
         """
         return self._response
 
+    def _load(self) -> typing.Tuple[requests.Response, typing.Any]:
+        """
+        :return: The response, and the decoded response body
+        """
+        response = get_transport().get(
+            self.address.url, params=dict(self.address.query), timeout=100,
+            immutable=self.address.immutable, refresh=self._refresh
+        )
+        return response, self._decode(response)
+
+    def _decode(self, response: requests.Response) -> typing.Any:
+        """
+        :param response:
+        :return: The decoded response body
+        """
+        return None
+
+    def _flight_key(self) -> typing.Hashable:
+        """
+        :return: Key shared by the scrapers that can share a request and decoded response
+        """
+        return type(self)._decode, self._refresh, self.address
+
 
 class APIScraper(Scraper):
     """
+    Responses are decoded by :py:func:`sabrmetrics.decoding.loads`.
+
     :param address:
+    :param response:
+    :param refresh:
+    :param lazy: Whether to keep the raw response body, and only decode it when a key is accessed
+        (see :py:class:`sabrmetrics.decoding.LazyDocument`)
     """
-    def __init__(self, address: APIAddress):
-        super().__init__(address)
+    def __init__(
+        self, address: typing.Optional[APIAddress], *,
+        response: typing.Optional[requests.Response] = None, refresh: bool = False,
+        lazy: bool = False
+    ):
+        self._lazy = lazy
 
-        self._data = self.response.json()
+        super().__init__(address, response=response, refresh=refresh)
+
+        self._data = self._decoded
 
     def __getitem__(self, key: str) -> typing.Any:
         return self.data[key]
 
     @property
-    def data(self) -> dict:
+    def data(self) -> typing.Mapping[str, typing.Any]:
         """
         :return:
         """
         return self._data
 
+    @property
+    def lazy(self) -> bool:
+        """
+        """
+        return self._lazy
+
+    def _decode(self, response: requests.Response) -> typing.Any:
+        if self._lazy:
+            return LazyDocument(response.content)
+        with get_instrument().span("decode", scraper=type(self).__name__):
+            return loads(response.content)
+
+    def _flight_key(self) -> typing.Hashable:
+        return type(self)._decode, self._refresh, self._lazy, self.address
+
 
 class WebScraper(Scraper):
     """
     :param address:
+    :param response:
     """
-    def __init__(self, address: APIAddress):
-        super().__init__(address)
+    def __init__(
+        self, address: typing.Optional[APIAddress], *,
+        response: typing.Optional[requests.Response] = None
+    ):
+        super().__init__(address, response=response)
 
-        self._soup = bs4.BeautifulSoup(self.response.text, features="lxml")
+        self._soup = self._decoded
 
     @property
     def soup(self) -> bs4.BeautifulSoup:
         """
         :return:
         """
-        return self._soup
\ No newline at end of file
+        return self._soup
+
+    @classmethod
+    def iter_rows(
+        cls, address: APIAddress, selector: str, *, chunk_size: int = 2 ** 16
+    ) -> typing.Iterator[typing.List[str]]:
+        """
+        Streaming alternative to the constructor, for extracting a single table: the response body
+        is parsed incrementally as it is downloaded, and only the rows matching ``selector`` are
+        kept (see :py:mod:`sabrmetrics.htmlstream`).
+
+        :param address:
+        :param selector: Selector of the table rows (e.g., ``table#data tr``)
+        :param chunk_size: Number of bytes downloaded and parsed at a time
+        :return: Text of the cells of each row
+        """
+        with get_transport().get(
+            address.url, params=dict(address.query), timeout=100, stream=True
+        ) as response:
+            response.raise_for_status()
+            yield from iter_table_rows(
+                response.iter_content(chunk_size), selector,
+                encoding=declared_encoding(response)
+            )
+
+    def _decode(self, response: requests.Response) -> typing.Any:
+        with get_instrument().span("parse", scraper=type(self).__name__):
+            return bs4.BeautifulSoup(response.text, features="lxml")
\ No newline at end of file
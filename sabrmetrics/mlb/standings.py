@@ -2,7 +2,11 @@
 
 """
 
+import asyncio
+import concurrent.futures
 import datetime
+import itertools
+import threading
 import typing
 
 import numpy as np
@@ -11,10 +15,15 @@ import pandas as pd
 from . import divisions
 from . import leagues
 from .address import APIAddress
+from .address import LazyDefault
 from .divisions import Division
 from .leagues import League
 from .leagues import Season
 from .scraper import APIScraper
+from sabrmetrics import TODAY
+from sabrmetrics.instrumentation import get_instrument
+from sabrmetrics.instrumentation import in_context
+from sabrmetrics.transport import build_response
 
 
 LEAGUES = [
@@ -25,33 +34,69 @@ DIVISIONS = [
     divisions.NLWest, divisions.NLEast, divisions.NLCentral
 ]
 
+HYDRATE_ALL = (
+    "division", "conference", "sport", "league",
+    "team({next_schedule},{previous_schedule})".format(
+        next_schedule="nextSchedule(team,gameType=[R,F,D,L,W,C],inclusive=false)",
+        previous_schedule="previousSchedule(team,gameType=[R,F,D,L,W,C],inclusive=true)"
+    )
+)
+
+# Types of the entries of each key of a team record's "records" that are flattened by type (the
+# first level of the column labels of their advanced record tables)
+_RECORD_TYPES = {
+    "splitRecords": (
+        "home", "away", "left", "leftHome", "leftAway", "right", "rightHome", "rightAway",
+        "lastTen", "extraInning", "oneRun", "winners", "day", "night", "grass", "turf"
+    ),
+    "overallRecords": ("home", "away"),
+    "expectedRecords": ("xWinLoss", "xWinLossSeason"),
+}
+# Nested field of the entries of each other key of a team record's "records"
+_NESTED_RECORDS = {"divisionRecords": "division", "leagueRecords": "league"}
+
+# Path of the team records in the standings document
+_TEAM_RECORDS = "records.teamRecords"
+
 
 class Address(APIAddress):
     """
     """
+    __slots__ = ()
+
     url = "https://statsapi.mlb.com/api/v1/standings"
     field_defaults = {
         "league_id": (leagues.AmericanLeague.league_id, leagues.NationalLeague.league_id),
-        "season": Season.latest_year(),
-        "date": Season.latest_date(),
+        "season": LazyDefault(Season.latest_year),
+        "date": LazyDefault(Season.latest_date),
         "standings_types": ("regularSeason", "springTraining", "firstHalf", "secondHalf"),
-        "hydrate": (
-            "division", "conference", "sport", "league",
-            "team({next_schedule},{previous_schedule})".format(
-                next_schedule="nextSchedule(team,gameType=[R,F,D,L,W,C],inclusive=false)",
-                previous_schedule="previousSchedule(team,gameType=[R,F,D,L,W,C],inclusive=true)"
-            )
-        )
+        "hydrate": (),
+        "response_fields": ()
     }
 
     @property
     def parameters(self) -> typing.Dict[str, str]:
         """
+        ``hydrate`` and ``fields`` are only sent if they are not empty.
         """
-        return {
+        parameters = {
             "leagueId": self.league_id, "season": self.season, "date": self.date,
             "standingsTypes": self.standings_types
         }
+        if self.fields["hydrate"]:
+            parameters["hydrate"] = self.hydrate
+        if self.fields["response_fields"]:
+            parameters["fields"] = self.response_fields
+        return parameters
+
+    @property
+    def immutable(self) -> bool:
+        """
+        """
+        return (
+            int(self.fields["season"]) < TODAY.year
+            or self.fields["date"].date() < TODAY.date()
+        )
 
     @property
     def league_id(self) -> str:
@@ -83,120 +128,314 @@ class Address(APIAddress):
         """
         return ",".join(self.fields["hydrate"])
 
+    @property
+    def response_fields(self) -> str:
+        """
+        """
+        return ",".join(self.fields["response_fields"])
+
+
+def projection(
+    columns: typing.Iterable[typing.Union[str, typing.Tuple]], *,
+    view: typing.Union[typing.Type[Division], typing.Type[League]] = None
+) -> typing.Tuple[typing.Tuple[str, ...], typing.Tuple[str, ...]]:
+    """
+    Maps columns of :py:meth:`Standings.standings` to the smallest ``fields`` and ``hydrate``
+    query parameters of the standings endpoint that include them.
+    The ``fields`` parameter is a flat list of node names (e.g.,
+    ``records,teamRecords,records,splitRecords,type,wins``), which keeps the nodes of those names
+    at every level of the document, so some fields other than those of the columns come back too
+    (e.g., the ``wins`` of every record).
+    The team ID and name are always included.
+
+    Columns are given as the column labels of :py:meth:`Standings.standings` (e.g.,
+    ``("standard", "wins")``, ``("streak", "streakCode")``, ``("home", "wins")``), or as the
+    names of fields of the team records (e.g., ``"gamesBack"``).
+    Fields of the advanced records can also be given with the key of their record (e.g.,
+    ``("splitRecords", "wins")``).
+    Labels shared by several advanced record tables (e.g., ``("home", "wins")`` of the split and
+    overall records) include the fields of each of them.
+    Fields of the team other than its ID and name, including its schedules, require hydration.
+
+    :param columns:
+    :param view: See :py:class:`Standings`
+    :return: Node names of the fields, and hydrations
+    :raise ValueError: If a column is not a column of :py:meth:`Standings.standings`
+    """
+    fields = {*_TEAM_RECORDS.split("."), "team", "id", "name"}
+    hydrate = set()
+    if view is not None:
+        fields.update(("league", "division"))
+
+    for column in columns:
+        for path in _column_paths(column):
+            fields.update(path.split("."))
+
+        if isinstance(column, tuple) and column[0] == "team" and column[1:] and (
+            set(column[1:]) - {"id", "name", "link"}
+        ):
+            if {"nextSchedule", "previousSchedule"} & set(column[1:]):
+                hydrate.add(HYDRATE_ALL[-1])
+            else:
+                hydrate.add("team")
+
+    if HYDRATE_ALL[-1] in hydrate:
+        hydrate.discard("team")
+    return tuple(sorted(fields)), tuple(sorted(hydrate))
+
+
+def _column_paths(label: typing.Union[str, typing.Tuple]) -> typing.List[str]:
+    """
+    :param label: Column label of :py:meth:`Standings.standings`, or field of the team records
+    :return: Paths of the fields of the team records required to build the column
+    :raise ValueError: If the label is not a column of :py:meth:`Standings.standings`
+    """
+    if isinstance(label, str) and label:
+        return [label]
+    if not isinstance(label, tuple) or len(label) < 2:
+        raise ValueError(f"Unknown column of the standings: {label!r}")
+
+    first, rest = label[0], label[1:]
+    field = _field_path(rest[0]) if len(rest) == 1 else None
+
+    if first == "team" and all(isinstance(x, str) for x in rest):
+        return [".".join(label)]
+    if first == "standard" and field is not None and "." not in field:
+        return [field]
+    if first in ("streak", "leagueRecord") and field is not None and "." not in field:
+        return [f"{first}.{field}"]
+
+    keys = []
+    if first in _RECORD_TYPES or first in _NESTED_RECORDS:
+        keys = [first]
+    elif isinstance(first, str):
+        keys = [k for k, types in _RECORD_TYPES.items() if first in types]
+    elif isinstance(first, int) and not isinstance(first, bool):
+        keys = list(_NESTED_RECORDS)
+        if field is not None and "." in field:
+            keys = [k for k in keys if field.split(".")[0] == _NESTED_RECORDS[k]]
+
+    if not keys or field is None:
+        raise ValueError(f"Unknown column of the standings: {label!r}")
+    if "." in field and any(field.split(".")[0] != _NESTED_RECORDS.get(k) for k in keys):
+        raise ValueError(f"Unknown column of the standings: {label!r}")
+
+    paths = []
+    for key in keys:
+        if key in _RECORD_TYPES:
+            paths.append(f"records.{key}.type")
+        paths.append(f"records.{key}.{field}")
+    return paths
+
+
+def _field_path(part: typing.Any) -> typing.Optional[str]:
+    """
+    :param part: Second level of a column label: a field, or a (nested field, field) pair
+    :return: Dotted path of the field, or ``None`` if ``part`` is neither
+    """
+    if isinstance(part, str) and part:
+        return part
+    if isinstance(part, tuple) and len(part) == 2 and all(isinstance(x, str) for x in part):
+        return ".".join(part)
+    return None
+
 
 class Standings(APIScraper):
     """
+    Derived views (:py:attr:`team`, :py:attr:`split_records`, etc.) are built on first access
+    and cached; see :py:meth:`invalidate`.
+    Each access returns a copy of the cached view, which the caller is free to modify.
+    Concurrent accesses to the same view share a single build, while different views are built
+    concurrently.
+
     :param view:
     :param league_id:
     :param season:
     :param date:
+    :param eager: Whether to build all derived views on a background thread
+    :param columns: Columns of :py:meth:`standings` to request, instead of the whole standings
+        (see :py:func:`projection`). Views of fields that were not requested raise
+        :py:class:`KeyError`.
+    :param lazy: See :py:class:`sabrmetrics.mlb.scraper.APIScraper`
+
+    .. py:attribute:: views
+
+        Names of the cached derived views.
+
+        :type: tuple[str]
     """
+    views = (
+        "team", "streak", "league_record", "split_records", "division_records",
+        "overall_records", "league_records", "expected_records"
+    )
+
+    # Path of the field of the team records of each view
+    _view_fields = {
+        "team": "team", "streak": "streak", "league_record": "leagueRecord",
+        "split_records": "records.splitRecords", "division_records": "records.divisionRecords",
+        "overall_records": "records.overallRecords", "league_records": "records.leagueRecords",
+        "expected_records": "records.expectedRecords",
+    }
+
     def __init__(
         self, *, view: typing.Union[typing.Type[Division], typing.Type[League]] = None,
         league_id: typing.Optional[typing.Sequence[int]] = None,
         season: typing.Optional[int] = None,
-        date: typing.Optional[datetime.datetime] = None
+        date: typing.Optional[datetime.datetime] = None,
+        eager: bool = False,
+        columns: typing.Optional[typing.Iterable[typing.Union[str, typing.Tuple]]] = None,
+        lazy: bool = False
     ):
+        response_fields, hydrate = projection(columns, view=view) if columns else (None, None)
         address = Address(
             league_id=tuple(map(int, league_id)) if league_id else None,
             season=int(season) if season else None,
-            date=Season.latest_date(date) if date else None
+            date=Season.latest_date(date) if date else None,
+            hydrate=hydrate, response_fields=response_fields
         )
-        super().__init__(address)
+        super().__init__(address, lazy=lazy)
 
-        if view is None or not isinstance(view, type):
-            self._records = self.data["records"]
-        elif issubclass(view, League):
-            self._records = filter(
-                lambda x: x["league"]["id"] == view.league_id, self.data["records"]
-            )
-        elif issubclass(view, Division):
-            self._records = filter(
-                lambda x: x["division"]["id"] == view.division_id, self.data["records"]
-            )
+        self._build(view, eager)
+
+    @classmethod
+    def from_address(
+        cls, address: Address, *,
+        view: typing.Union[typing.Type[Division], typing.Type[League]] = None,
+        eager: bool = False, lazy: bool = False
+    ) -> "Standings":
+        """
+        Alternative constructor, which requests the standings of an address as is (e.g., a date
+        outside the regular season, which the constructor would move into it).
 
-        self._dataframe = pd.concat(pd.DataFrame(x["teamRecords"]) for x in self._records)
-        self._dataframe.reset_index(drop=True, inplace=True)
-        self._dataframe.replace("-", np.nan, inplace=True)
+        :param address:
+        :param view:
+        :param eager:
+        :param lazy:
+        :return:
+        """
+        standings = cls.__new__(cls)
+        APIScraper.__init__(standings, address, lazy=lazy)
+        standings._build(view, eager)
+        return standings
+
+    @classmethod
+    def from_payload(
+        cls, payload: bytes, *,
+        view: typing.Union[typing.Type[Division], typing.Type[League]] = None,
+        lazy: bool = False
+    ) -> "Standings":
+        """
+        Alternative constructor, which parses a raw standings document (e.g., a recorded or cached
+        response body) without making any request.
+
+        :param payload:
+        :param view:
+        :param lazy:
+        :return:
+        """
+        standings = cls.__new__(cls)
+        APIScraper.__init__(standings, None, response=build_response(
+            payload, headers={"Content-Type": "application/json"}
+        ), lazy=lazy)
+        standings._build(view, eager=False)
+        return standings
 
     @property
     def team(self) -> pd.DataFrame:
         """
         """
-        return pd.DataFrame(list(self._dataframe.loc[:, "team"]))
+        return self._view("team", lambda: pd.DataFrame(self._column("team"))).copy()
 
     @property
     def streak(self) -> pd.DataFrame:
         """
         """
-        return pd.DataFrame(list(self._dataframe.loc[:, "streak"]))
-    
+        return self._view("streak", lambda: pd.DataFrame(self._column("streak"))).copy()
+
     @property
     def league_record(self) -> pd.DataFrame:
         """
         """
-        return pd.DataFrame(list(self._dataframe.loc[:, "leagueRecord"]))
+        return self._view(
+            "league_record", lambda: pd.DataFrame(self._column("leagueRecord"))
+        ).copy()
 
     @property
     def split_records(self) -> pd.DataFrame:
         """
         """
-        return self._flat_record(
-            list(self._dataframe.loc[:, "records"]), "splitRecords"
-        )
+        return self._view("split_records", lambda: self._flat_record(
+            self._column("records.splitRecords"), "splitRecords"
+        )).copy()
 
     @property
     def division_records(self) -> pd.DataFrame:
         """
         """
-        return self._nested_record(
-            list(self._dataframe.loc[:, "records"]), "divisionRecords", "division"
-        )
-    
+        return self._view("division_records", lambda: self._nested_record(
+            self._column("records.divisionRecords"), "divisionRecords", "division"
+        )).copy()
+
     @property
     def overall_records(self) -> pd.DataFrame:
         """
         """
-        return self._flat_record(
-            list(self._dataframe.loc[:, "records"]), "overallRecords"
-        )
-    
+        return self._view("overall_records", lambda: self._flat_record(
+            self._column("records.overallRecords"), "overallRecords"
+        )).copy()
+
     @property
     def league_records(self) -> pd.DataFrame:
         """
         """
-        return self._nested_record(
-            list(self._dataframe.loc[:, "records"]), "leagueRecords", "league"
-        )
+        return self._view("league_records", lambda: self._nested_record(
+            self._column("records.leagueRecords"), "leagueRecords", "league"
+        )).copy()
 
     @property
     def expected_records(self) -> pd.DataFrame:
         """
         """
-        return self._flat_record(
-            list(self._dataframe.loc[:, "records"]), "expectedRecords"
-        )
+        return self._view("expected_records", lambda: self._flat_record(
+            self._column("records.expectedRecords"), "expectedRecords"
+        )).copy()
 
     def standings(
         self, *,
         advanced: typing.Literal["split", "division", "overall", "league", "expected"] = None,
         streak: bool = True,
         league_record: bool = True
-    ) -> pd.DataFrame:  
+    ) -> pd.DataFrame:
+        """
+        :param advanced:
+        :param streak: Whether to include the streak, if it was requested (see the ``columns`` of
+            :py:class:`Standings`)
+        :param league_record: Whether to include the league record, if it was requested
+        :return:
+        :raise KeyError: If the ``advanced`` records were not requested
+        """
+        with get_instrument().span("transform", table="standings", view="standings"):
+            return self._standings(advanced, streak, league_record)
+
+    def _standings(
+        self, advanced: typing.Optional[str], streak: bool, league_record: bool
+    ) -> pd.DataFrame:
         """
         :param advanced:
         :param streak:
         :param league_record:
         :return:
         """
-        df_standard = pd.concat(
-            [self._dataframe.drop(columns=["team", "streak", "leagueRecord", "records"])],
-            keys=["standard"], axis=1
-        )
-        df_team = pd.concat([self.team], keys=["team"], axis=1)
+        base = dataframe = self._view("_base", lambda: pd.concat([
+            pd.concat([self.team], keys=["team"], axis=1),
+            pd.concat(
+                [self._dataframe.drop(
+                    columns=["team", "streak", "leagueRecord", "records"], errors="ignore"
+                )],
+                keys=["standard"], axis=1
+            )
+        ], axis=1))
 
-        dataframe = pd.concat([df_team, df_standard], axis=1)
-            
         if advanced == "split":
             dataframe = dataframe.join(self.split_records)
         elif advanced == "division":
@@ -207,17 +446,120 @@ class Standings(APIScraper):
             dataframe = dataframe.join(self.league_records)
         elif advanced == "expected":
             dataframe = dataframe.join(self.expected_records)
-        
-        if streak:
-            dataframe = dataframe.join(
-                pd.concat([self.streak], keys=["streak"], axis=1)
+
+        if streak and self._requested("streak"):
+            dataframe = dataframe.join(self._view(
+                "_streak", lambda: pd.concat([self.streak], keys=["streak"], axis=1)
+            ))
+        if league_record and self._requested("leagueRecord"):
+            dataframe = dataframe.join(self._view(
+                "_league_record",
+                lambda: pd.concat([self.league_record], keys=["leagueRecord"], axis=1)
+            ))
+
+        return dataframe.copy() if dataframe is base else dataframe
+
+    def invalidate(self, *views: str) -> None:
+        """
+        Discards cached derived views, so that they are rebuilt on next access.
+
+        :param views: Names of the views to discard (see :py:attr:`views`), or none to discard
+            all cached views
+        """
+        with self._views_lock:
+            if not views:
+                self._views.clear()
+            for name in views:
+                self._views.pop(name, None)
+                self._views.pop(f"_{name}", None)
+                if name == "team":
+                    self._views.pop("_base", None)
+
+    def _build(
+        self, view: typing.Union[typing.Type[Division], typing.Type[League], None], eager: bool
+    ) -> None:
+        """
+        :param view:
+        :param eager:
+        """
+        if view is None or not isinstance(view, type):
+            self._records = self.data["records"]
+        elif issubclass(view, League):
+            self._records = filter(
+                lambda x: x["league"]["id"] == view.league_id, self.data["records"]
             )
-        if league_record:
-            dataframe = dataframe.join(
-                pd.concat([self.league_record], keys=["leagueRecord"], axis=1)
+        elif issubclass(view, Division):
+            self._records = filter(
+                lambda x: x["division"]["id"] == view.division_id, self.data["records"]
             )
 
-        return dataframe
+        with get_instrument().span("transform", table="standings", view="records"):
+            self._dataframe = pd.concat(pd.DataFrame(x["teamRecords"]) for x in self._records)
+            self._dataframe.reset_index(drop=True, inplace=True)
+            self._dataframe.replace("-", np.nan, inplace=True)
+
+        self._views: typing.Dict[str, pd.DataFrame] = {}
+        self._views_lock = threading.Lock()
+        self._view_locks: typing.Dict[str, threading.Lock] = {}
+        if eager:
+            threading.Thread(target=self._build_views, daemon=True).start()
+
+    def _requested(self, path: str) -> bool:
+        """
+        :param path: Path of a field of the team records (e.g., ``records.splitRecords``)
+        :return: Whether the name of each node of the path was requested, as is every field of
+            standings requested without ``columns``
+        """
+        fields = self.address.fields["response_fields"] if self.address is not None else ()
+        return not fields or set(f"{_TEAM_RECORDS}.{path}".split(".")) <= set(fields)
+
+    def _column(self, path: str) -> typing.List[typing.Any]:
+        """
+        :param path: Path of a field of the team records (e.g., ``records.splitRecords``)
+        :return: Values of the top-level field of the path (an empty ``dict`` where the field is
+            missing)
+        :raise KeyError: If the field was not requested
+        """
+        if not self._requested(path):
+            raise KeyError(f"{path!r} was not requested (see the columns of Standings)")
+
+        name = path.split(".")[0]
+        if name not in self._dataframe.columns:
+            return [{}] * len(self._dataframe)
+        return [x if isinstance(x, dict) else {} for x in self._dataframe.loc[:, name]]
+
+    def _view(self, name: str, build: typing.Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Only the builds of the same view are serialized (by a lock per view), so that a view is
+        built once, without blocking the builds of other views.
+
+        :param name:
+        :param build:
+        :return: The cached view (not a copy)
+        """
+        with self._views_lock:
+            view = self._views.get(name)
+            if view is not None:
+                return view
+            lock = self._view_locks.setdefault(name, threading.Lock())
+
+        with lock:
+            with self._views_lock:
+                view = self._views.get(name)
+            if view is None:
+                with get_instrument().span("transform", table="standings", view=name):
+                    view = build()
+                with self._views_lock:
+                    self._views[name] = view
+        return view
+
+    def _build_views(self) -> None:
+        """
+        """
+        for name in self.views:
+            if self._requested(self._view_fields[name]):
+                getattr(self, name)
+        self.standings(streak=True, league_record=True)
 
     def _flat_record(
         self, records: typing.List[typing.Dict], key: str
@@ -227,18 +569,19 @@ class Standings(APIScraper):
         :param key:
         :return:
         """
-        series = []
-
-        for record in records:
-            dataframe = pd.DataFrame(record[key])
+        columns: typing.Dict[typing.Tuple, typing.List] = {}
 
-            dataframe.rename(index=dataframe.loc[:, "type"], inplace=True)
-            dataframe.drop(columns=["type"], inplace=True)
+        for i, record in enumerate(records):
+            for entry in record.get(key, []):
+                for field, value in entry.items():
+                    if field != "type" and value is not None:
+                        column = (entry["type"], field)
+                        if column not in columns:
+                            columns[column] = [np.nan] * len(records)
+                        columns[column][i] = value
 
-            series.append(dataframe.stack())
+        return self._record_frame(columns, len(records))
 
-        return pd.DataFrame(series)
-    
     def _nested_record(
         self, records: typing.List[typing.Dict], key: str, inner_key: str
     ) -> pd.DataFrame:
@@ -248,14 +591,97 @@ class Standings(APIScraper):
         :param inner_key:
         :return:
         """
-        series = []
+        columns: typing.Dict[typing.Tuple, typing.List] = {}
+
+        def assign(column: typing.Tuple, i: int, value: typing.Any) -> None:
+            if value is None:
+                return
+            if column not in columns:
+                columns[column] = [np.nan] * len(records)
+            columns[column][i] = value
+
+        for i, record in enumerate(records):
+            for j, entry in enumerate(record.get(key, [])):
+                for field, value in entry.items():
+                    if field != inner_key:
+                        assign((j, field), i, value)
+                for field, value in (entry.get(inner_key) or {}).items():
+                    assign((j, (inner_key, field)), i, value)
+
+        return self._record_frame(columns, len(records))
+
+    @staticmethod
+    def _record_frame(
+        columns: typing.Dict[typing.Tuple, typing.List], length: int
+    ) -> pd.DataFrame:
+        """
+        Missing (and ``null``) values are ``NaN``, and columns without any value are left out.
+
+        :param columns: Values of each column, keyed by (two-level) column label
+        :param length:
+        :return:
+        """
+        if not columns:
+            return pd.DataFrame(index=pd.RangeIndex(length))
 
-        for record in records:
-            dataframe = pd.DataFrame(record[key])
+        dataframe = pd.DataFrame(dict(enumerate(columns.values())))
+        dataframe.columns = pd.MultiIndex.from_tuples(list(columns))
+        return dataframe
 
-            nested_df = pd.DataFrame(list(dataframe.loc[:, inner_key]))
-            nested_df.columns = pd.MultiIndex.from_product([[inner_key], nested_df.columns])
 
-            series.append(pd.concat([dataframe.iloc[:, :-1], nested_df], axis=1).stack())
+async def gather_standings(
+    seasons: typing.Optional[typing.Iterable[int]] = None,
+    dates: typing.Optional[typing.Iterable[datetime.datetime]] = None, *,
+    view: typing.Union[typing.Type[Division], typing.Type[League]] = None,
+    league_id: typing.Optional[typing.Sequence[int]] = None,
+    columns: typing.Optional[typing.Iterable[typing.Union[str, typing.Tuple]]] = None,
+    concurrency: int = 8,
+    executor: typing.Optional[concurrent.futures.Executor] = None
+) -> typing.Dict[typing.Tuple[int, typing.Optional[datetime.datetime]], Standings]:
+    """
+    Concurrently fetches :py:class:`Standings` for several seasons and/or dates.
+
+    If only ``seasons`` is given, the standings of each season are fetched for the default date.
+    If only ``dates`` is given, the standings on each date are fetched for the season of that
+    date's year.
+    If both are given, the standings are fetched for every (season, date) pair.
+    Dates are requested as given (see :py:meth:`Standings.from_address`).
+
+    :param seasons:
+    :param dates:
+    :param view:
+    :param league_id:
+    :param columns: See :py:class:`Standings`
+    :param concurrency: Maximum number of requests in flight at once
+    :param executor: Executor in which the blocking requests are run, or ``None`` for the event
+        loop's default executor
+    :return: Mapping of each (season, date) pair to its standings
+    :raise ValueError: If neither ``seasons`` nor ``dates`` is given
+    """
+    if seasons is None and dates is None:
+        raise ValueError("at least one of 'seasons' or 'dates' is required")
+    if dates is None:
+        keys = [(season, None) for season in seasons]
+    elif seasons is None:
+        keys = [(date.year, date) for date in dates]
+    else:
+        keys = list(itertools.product(seasons, dates))
+
+    response_fields, hydrate = projection(columns, view=view) if columns else (None, None)
+    league_id = tuple(map(int, league_id)) if league_id else None
+
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(season: int, date: typing.Optional[datetime.datetime]) -> Standings:
+        address = Address(
+            league_id=league_id, season=int(season), date=date, hydrate=hydrate,
+            response_fields=response_fields
+        )
+        async with semaphore:
+            return await loop.run_in_executor(
+                executor, in_context(Standings.from_address, address, view=view)
+            )
 
-        return pd.DataFrame(series)
+    results = await asyncio.gather(*(fetch(season, date) for season, date in keys))
+    return dict(zip(keys, results))
@@ -5,3 +5,8 @@ Web scraper for the `Smart Fantasy Baseball`_ website.
 """
 
 from ._tools import PlayerIDMap
+from ._index import PlayerIDIndex
+from ._sync import PlayerIDMapDiff
+from ._sync import PlayerIDMapSync
+from ._names import NameResolver
+from ._names import normalize_name
@@ -0,0 +1,195 @@
+"""
+Hash-indexed cross-reference of the player IDs of the **Smart Fantasy Baseball** Player ID Map.
+"""
+
+import typing
+
+import numpy as np
+import pandas as pd
+
+from ._tools import PlayerIDMap
+
+
+class PlayerIDIndex:
+    """
+    Translates player IDs (or names) between any two of the systems in the Player ID Map.
+
+    Systems are referred to either by site name (a key of :py:attr:`PlayerIDMap.site_columns`,
+    which refers to the first column listed for that site, e.g. ``"MLB"`` for ``MLBID``), or by
+    column name (e.g. ``"MLBName"``).
+    ``"SFBB"`` refers to the ``PlayerID`` column.
+
+    All values are stored as strings; missing values are stored as empty strings.
+
+    :param columns: Values of each column, keyed by column name
+
+    .. py:attribute:: columns
+
+        Player ID Map columns held by the index.
+
+        :type: list[str]
+    """
+    columns = ["PlayerID", *(c for v in PlayerIDMap.site_columns.values() for c in v)]
+
+    def __init__(self, columns: typing.Dict[str, np.ndarray]):
+        self._columns = {k: np.asarray(v, dtype=str) for k, v in columns.items()}
+        self._indexes: typing.Dict[str, typing.Tuple[pd.Index, np.ndarray]] = {}
+
+        lengths = {len(v) for v in self._columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("columns have different lengths")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(players={len(self)}, columns={len(self._columns)})"
+
+    def __len__(self) -> int:
+        return len(next(iter(self._columns.values()), ()))
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "PlayerIDIndex":
+        """
+        :param df: Player ID Map table, as returned by :py:meth:`PlayerIDMap.playeridmap`
+        :return:
+        """
+        return cls({
+            c: df.loc[:, c].astype("string").fillna("").to_numpy(dtype=str)
+            for c in cls.columns if c in df.columns
+        })
+
+    @classmethod
+    def from_playeridmap(cls, playeridmap: typing.Optional[PlayerIDMap] = None) -> "PlayerIDIndex":
+        """
+        :param playeridmap:
+        :return:
+        """
+        return cls.from_dataframe((playeridmap or PlayerIDMap()).playeridmap())
+
+    @classmethod
+    def load(cls, path: str) -> "PlayerIDIndex":
+        """
+        Loads an index saved by :py:meth:`save`.
+
+        :param path:
+        :return:
+        """
+        with open(path, "rb") as file, np.load(file, allow_pickle=False) as archive:
+            return cls({k: archive[k] for k in archive.files})
+
+    def save(self, path: str) -> None:
+        """
+        Saves the index to a compressed ``.npz`` file at exactly ``path`` (no ``.npz`` suffix is
+        appended).
+
+        :param path:
+        """
+        with open(path, "wb") as file:
+            np.savez_compressed(file, **self._columns)
+
+    def patch(
+        self, added: pd.DataFrame, removed: pd.DataFrame, changed: pd.DataFrame
+    ) -> "PlayerIDIndex":
+        """
+        Applies a row-level difference of the Player ID Map table to the index: the rows of the
+        ``removed`` players are dropped, the rows of the ``changed`` players are overwritten in
+        place, and the ``added`` players are appended.
+        Players are matched by ``PlayerID``.
+
+        :param added: Rows of the players to add
+        :param removed: Rows of the players to remove
+        :param changed: New version of the rows of the players to overwrite
+        :return: The patched index
+        :raise KeyError: If the index does not hold the ``PlayerID`` column
+        """
+        ids = self._columns["PlayerID"]
+        keep = ~np.isin(ids, self._keys(removed.loc[:, "PlayerID"]))
+        locations = pd.Index(self._keys(changed.loc[:, "PlayerID"])).get_indexer(ids[keep])
+        hit = locations >= 0
+
+        changes, additions = (type(self).from_dataframe(df)._columns for df in (changed, added))
+        columns = {}
+        for column, values in self._columns.items():
+            values = values[keep].astype(object)
+            values[hit] = changes[column][locations[hit]]
+            columns[column] = np.concatenate([values, additions[column].astype(object)])
+        return type(self)(columns)
+
+    def column(self, system: str) -> str:
+        """
+        :param system: Site name or column name
+        :return: The column name of ``system``
+        :raise KeyError: If the index does not hold a column for ``system``
+        """
+        if system == "SFBB":
+            system = "PlayerID"
+        elif system in PlayerIDMap.site_columns:
+            system = PlayerIDMap.site_columns[system][0]
+
+        if system not in self._columns:
+            raise KeyError(system)
+        return system
+
+    def translate(
+        self, ids: typing.Union[typing.Iterable, np.ndarray, pd.Series], src: str, dst: str,
+        default: typing.Any = None
+    ) -> np.ndarray:
+        """
+        :param ids: IDs in the ``src`` system
+        :param src: Site name or column name
+        :param dst: Site name or column name
+        :param default: Value for IDs that are not found, or have no ``dst`` equivalent
+        :return: IDs in the ``dst`` system, as strings
+        """
+        keys = self._keys(ids)
+        index, positions = self._index(self.column(src))
+        values = self._columns[self.column(dst)]
+
+        locations = index.get_indexer(keys)
+        found = locations >= 0
+
+        result = np.full(len(keys), default, dtype=object)
+        result[found] = values[positions[locations[found]]]
+        result[result == ""] = default
+        return result
+
+    def lookup(self, player_id: typing.Any, src: str) -> typing.Optional[typing.Dict[str, str]]:
+        """
+        :param player_id: ID in the ``src`` system
+        :param src: Site name or column name
+        :return: All IDs of the player, keyed by column name, or ``None`` if not found
+        """
+        index, positions = self._index(self.column(src))
+        location = index.get_indexer(self._keys([player_id]))[0]
+        if location < 0:
+            return None
+
+        row = positions[location]
+        return {k: v[row] or None for k, v in self._columns.items()}
+
+    def _index(self, column: str) -> typing.Tuple[pd.Index, np.ndarray]:
+        """
+        :param column:
+        :return: Unique values of ``column``, and the row of each value
+        """
+        if column not in self._indexes:
+            values = self._columns[column]
+            present = np.flatnonzero(values != "")
+            index = pd.Index(values[present])
+            unique = ~index.duplicated()
+            self._indexes[column] = (index[unique], present[unique])
+        return self._indexes[column]
+
+    @staticmethod
+    def _keys(ids: typing.Union[typing.Iterable, np.ndarray, pd.Series]) -> np.ndarray:
+        """
+        :param ids:
+        :return:
+        """
+        if not isinstance(ids, pd.Series):
+            ids = np.asarray(ids if isinstance(ids, np.ndarray) else list(ids))
+            if ids.dtype.kind != "f":
+                return ids.astype(str)
+            ids = pd.Series(ids)
+
+        if ids.dtype.kind == "f":
+            ids = ids.astype("Int64")
+        return ids.astype("string").fillna("").to_numpy(dtype=str)
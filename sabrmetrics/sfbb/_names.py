@@ -0,0 +1,262 @@
+"""
+Resolution of player names to the players of the **Smart Fantasy Baseball** Player ID Map.
+"""
+
+import collections
+import difflib
+import re
+import typing
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+from ._tools import PlayerIDMap
+
+
+SUFFIXES = frozenset({"jr", "sr", "ii", "iii", "iv", "v"})
+
+
+def normalize_name(name: typing.Any) -> str:
+    """
+    Normalizes a player name for matching: accents, punctuation and generational suffixes
+    (e.g., "Jr.") are removed, the name is lower-cased, and "Last, First" is reordered to
+    "First Last".
+
+    :param name:
+    :return: The normalized name, or an empty string if ``name`` is not a string
+    """
+    if not isinstance(name, str):
+        return ""
+
+    if "," in name:
+        last, first = name.split(",", 1)
+        name = f"{first} {last}"
+
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    name = re.sub(r"[.'`]", "", name.lower())
+    return " ".join(t for t in re.split(r"[^a-z0-9]+", name) if t and t not in SUFFIXES)
+
+
+class NameResolver:
+    """
+    Matches player names against the name columns of the Player ID Map.
+
+    Names are first looked up exactly (after :py:func:`normalize_name`).
+    Names without an exact match are blocked by character trigrams: the known names sharing the
+    most trigrams with the name are counted at once (with :py:func:`numpy.bincount` over an
+    inverted index), so that typos in any part of the name still find their match.
+    Only the best :py:attr:`candidates` of these are compared using
+    :py:class:`difflib.SequenceMatcher`.
+    When several players match equally well, the player matching the most of the given team,
+    birthdate and position is chosen.
+
+    :param df: Player ID Map table, as returned by :py:meth:`PlayerIDMap.playeridmap`
+    :param name_columns: Columns of ``df`` to match names against
+
+    .. py:attribute:: name_columns
+
+        :type: list[str]
+
+    .. py:attribute:: candidates
+
+        Maximum number of known names compared to each name without an exact match.
+
+        :type: int
+    """
+    name_columns = [
+        "Name", "LastFirst", "CBSName", "DraftKingsName", "ESPNName", "FanDuelName",
+        "FanGraphsName", "FantasyProsName", "FantraxName", "KFFLName", "MasterballName",
+        "MLBName", "NFBCName", "NFBCLastFirst", "RazzballName", "RotoWireName", "YahooName",
+    ]
+    candidates = 32
+
+    def __init__(
+        self, df: pd.DataFrame, name_columns: typing.Optional[typing.Sequence[str]] = None
+    ):
+        name_columns = [c for c in (name_columns or self.name_columns) if c in df.columns]
+
+        self._player_ids = df.loc[:, "PlayerID"].astype("string").fillna("").to_numpy(dtype=str)
+        self._teams = self._strings(df.loc[:, "Team"])
+        self._birthdates = self._dates(df.loc[:, "Birthdate"])
+        self._positions = [
+            {p.upper() for p in (v if isinstance(v, list) else [])} | {str(w).upper()}
+            for v, w in zip(df.loc[:, "AllPositions"], df.loc[:, "Position"])
+        ]
+
+        self._exact: typing.Dict[str, typing.Set[int]] = collections.defaultdict(set)
+        for column in name_columns:
+            for row, name in enumerate(map(normalize_name, df.loc[:, column])):
+                if name:
+                    self._exact[name].add(row)
+
+        self._names = list(self._exact)
+        postings: typing.Dict[str, typing.List[int]] = collections.defaultdict(list)
+        for i, name in enumerate(self._names):
+            for gram in self._trigrams(name):
+                postings[gram].append(i)
+        self._postings = {k: np.array(v, dtype=np.int32) for k, v in postings.items()}
+        self._gram_counts = np.array([len(self._trigrams(x)) for x in self._names], dtype=np.int32)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(players={len(self._player_ids)})"
+
+    @classmethod
+    def from_playeridmap(cls, playeridmap: typing.Optional[PlayerIDMap] = None) -> "NameResolver":
+        """
+        :param playeridmap:
+        :return:
+        """
+        return cls((playeridmap or PlayerIDMap()).playeridmap())
+
+    def resolve(
+        self, names: typing.Iterable[str], *,
+        team: typing.Union[str, typing.Sequence[typing.Optional[str]], None] = None,
+        birthdate: typing.Union[typing.Any, typing.Sequence[typing.Any], None] = None,
+        position: typing.Union[str, typing.Sequence[typing.Optional[str]], None] = None,
+        threshold: float = 0.85, tolerance: float = 0.05
+    ) -> pd.DataFrame:
+        """
+        :param names:
+        :param team: Team of each player, or of all players
+        :param birthdate: Birthdate of each player, or of all players
+        :param position: Position of each player, or of all players
+        :param threshold: Minimum similarity (between 0 and 1) of a fuzzy match
+        :param tolerance: Maximum similarity difference between the best match and the other
+            matches considered when disambiguating
+        :return: For each name, the ``PlayerID`` of the matched player (or ``None``), the
+            similarity ``Score``, and whether the match was ``Ambiguous``
+        """
+        names = list(names)
+        teams = self._context(team, len(names), self._strings)
+        birthdates = self._context(birthdate, len(names), self._dates)
+        positions = self._context(position, len(names), self._strings)
+
+        candidates: typing.Dict[str, typing.List[typing.Tuple[float, int]]] = {}
+        player_ids, scores, ambiguous = [], [], []
+
+        for i, name in enumerate(names):
+            key = normalize_name(name)
+            if key not in candidates:
+                candidates[key] = self._candidates(key, threshold)
+
+            matches = candidates[key]
+            if not matches:
+                player_ids.append(None)
+                scores.append(np.nan)
+                ambiguous.append(False)
+                continue
+
+            best = matches[0][0]
+            contenders = [(s, r) for s, r in matches if s >= best - tolerance]
+            ranked = sorted(
+                ((self._agreement(r, teams[i], birthdates[i], positions[i]), s, r)
+                 for s, r in contenders),
+                reverse=True
+            )
+
+            player_ids.append(self._player_ids[ranked[0][2]])
+            scores.append(ranked[0][1])
+            ambiguous.append(len(ranked) > 1 and ranked[0][:2] == ranked[1][:2])
+
+        return pd.DataFrame(
+            {"Name": names, "PlayerID": player_ids, "Score": scores, "Ambiguous": ambiguous}
+        )
+
+    def _candidates(self, key: str, threshold: float) -> typing.List[typing.Tuple[float, int]]:
+        """
+        :param key: Normalized name
+        :param threshold:
+        :return: Similarity and row of each matching player, best first
+        """
+        if not key:
+            return []
+        if key in self._exact:
+            return [(1.0, r) for r in sorted(self._exact[key])]
+
+        grams = self._trigrams(key)
+        postings = [self._postings[g] for g in grams if g in self._postings]
+        if not postings:
+            return []
+
+        shared = np.bincount(np.concatenate(postings), minlength=len(self._names))
+        similarity = 2 * shared / (len(grams) + self._gram_counts)
+        blocked = np.flatnonzero(shared)
+        if len(blocked) > self.candidates:
+            best = np.argpartition(-similarity[blocked], self.candidates)[:self.candidates]
+            blocked = blocked[best]
+
+        matcher = difflib.SequenceMatcher(a=key, autojunk=False)
+        scores: typing.Dict[int, float] = {}
+        for i in blocked:
+            matcher.set_seq2(self._names[i])
+            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                continue
+            score = matcher.ratio()
+            if score >= threshold:
+                for row in self._exact[self._names[i]]:
+                    scores[row] = max(scores.get(row, 0.0), score)
+
+        return sorted(((s, r) for r, s in scores.items()), key=lambda x: (-x[0], x[1]))
+
+    def _agreement(
+        self, row: int, team: str, birthdate: str, position: str
+    ) -> int:
+        """
+        :param row:
+        :param team:
+        :param birthdate:
+        :param position:
+        :return: Number of the given attributes agreeing with the player at ``row``
+        """
+        return (
+            bool(team) and team == self._teams[row]
+        ) + (
+            bool(birthdate) and birthdate == self._birthdates[row]
+        ) + (
+            bool(position) and position in self._positions[row]
+        )
+
+    @staticmethod
+    def _trigrams(name: str) -> typing.Set[str]:
+        """
+        :param name: Normalized name
+        :return: Character trigrams of the name, padded at both ends
+        """
+        padded = f"  {name} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    @staticmethod
+    def _context(
+        value: typing.Any, length: int, convert: typing.Callable[[pd.Series], np.ndarray]
+    ) -> np.ndarray:
+        """
+        :param value: Scalar, or sequence of ``length`` values
+        :param length:
+        :param convert:
+        :return:
+        """
+        if value is None or isinstance(value, str) or np.isscalar(value) or not hasattr(
+            value, "__len__"
+        ):
+            value = [value] * length
+        if len(value) != length:
+            raise ValueError("context has a different length than 'names'")
+        return convert(pd.Series(list(value), dtype=object))
+
+    @staticmethod
+    def _strings(series: pd.Series) -> np.ndarray:
+        """
+        :param series:
+        :return:
+        """
+        return series.astype("string").str.upper().fillna("").to_numpy(dtype=str)
+
+    @staticmethod
+    def _dates(series: pd.Series) -> np.ndarray:
+        """
+        :param series:
+        :return:
+        """
+        dates = pd.to_datetime(series, errors="coerce", format="mixed")
+        return dates.dt.strftime("%Y-%m-%d").fillna("").to_numpy(dtype=str)
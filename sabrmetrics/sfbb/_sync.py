@@ -0,0 +1,267 @@
+"""
+Incremental synchronization of a local snapshot of the **Smart Fantasy Baseball** Player ID Map.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import typing
+
+import pandas as pd
+
+from ._index import PlayerIDIndex
+from ._tools import PlayerIDMap
+from sabrmetrics import snapshot
+
+
+class PlayerIDMapDiff(typing.NamedTuple):
+    """
+    Row-level difference between two versions of the Player ID Map table.
+
+    ``changed`` holds the new version of the rows of players present in both versions whose
+    values differ.
+    """
+    added: pd.DataFrame
+    removed: pd.DataFrame
+    changed: pd.DataFrame
+
+    @property
+    def empty(self) -> bool:
+        """
+        """
+        return self.added.empty and self.removed.empty and self.changed.empty
+
+
+class PlayerIDMapSync:
+    """
+    Local snapshot of the Player ID Map table (and its :py:class:`PlayerIDIndex`), refreshed only
+    when the Player ID Map CHANGELOG differs from that of the last synchronization.
+
+    The table is stored as a Parquet file (see :py:mod:`sabrmetrics.snapshot`), which requires the
+    optional ``pyarrow`` dependency.
+
+    :param directory: Directory in which the snapshot is stored
+    :param playeridmap:
+    """
+    snapshot_file = "playeridmap.parquet"
+    index_file = "playeridindex.npz"
+    state_file = "sync.json"
+
+    def __init__(self, directory: str, playeridmap: typing.Optional[PlayerIDMap] = None):
+        self._directory = directory
+        self._playeridmap = playeridmap
+        self._snapshot: typing.Optional[pd.DataFrame] = None
+        self._index: typing.Optional[PlayerIDIndex] = None
+
+        os.makedirs(directory, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(directory={self.directory!r}, last_sync={self.last_sync})"
+
+    @property
+    def directory(self) -> str:
+        """
+        """
+        return self._directory
+
+    @property
+    def playeridmap(self) -> PlayerIDMap:
+        """
+        """
+        if self._playeridmap is None:
+            self._playeridmap = PlayerIDMap()
+        return self._playeridmap
+
+    @property
+    def snapshot(self) -> typing.Optional[pd.DataFrame]:
+        """
+        The stored Player ID Map table, or ``None`` if nothing has been synchronized yet.
+        """
+        if self._snapshot is None and os.path.exists(self._path(self.snapshot_file)):
+            self._snapshot = snapshot.read_snapshot(
+                self._path(self.snapshot_file), as_pandas=True
+            )
+        return self._snapshot
+
+    @property
+    def index(self) -> typing.Optional[PlayerIDIndex]:
+        """
+        The index of the stored Player ID Map table, or ``None`` if nothing has been synchronized
+        yet.
+        """
+        if self._index is None and os.path.exists(self._path(self.index_file)):
+            self._index = PlayerIDIndex.load(self._path(self.index_file))
+        return self._index
+
+    @property
+    def last_sync(self) -> typing.Optional[datetime.datetime]:
+        """
+        Time of the last synchronization.
+        """
+        value = self._state().get("last_sync")
+        return datetime.datetime.fromisoformat(value) if value else None
+
+    @property
+    def last_change(self) -> typing.Optional[datetime.datetime]:
+        """
+        Date of the latest CHANGELOG entry as of the last synchronization.
+        """
+        value = self._state().get("last_change")
+        return datetime.datetime.fromisoformat(value) if value else None
+
+    def sync(self, *, force: bool = False) -> PlayerIDMapDiff:
+        """
+        Checks the CHANGELOG and, if any of its entries was added, removed or edited since the
+        last synchronization, downloads the Player ID Map and applies the rows that were added,
+        removed or changed to the stored snapshot and index (see :py:meth:`patch` and
+        :py:meth:`PlayerIDIndex.patch`).
+        Entries are compared by content rather than by date, since several changes may be logged
+        under the same date.
+
+        The Player ID Map is only published as a whole, so it is always downloaded in full.
+        If its columns differ from those of the stored snapshot, the snapshot and index are
+        replaced rather than patched.
+
+        :param force: Whether to download the Player ID Map regardless of the CHANGELOG
+        :return: The difference between the previous and the new snapshot
+        """
+        changelog = self.playeridmap.changelog()
+        digest = self.changelog_digest(changelog)
+
+        last_change = changelog.loc[:, "Date"].max()
+        if pd.isna(last_change):
+            last_change = None
+        else:
+            last_change = last_change.to_pydatetime()
+
+        previous = self.snapshot
+        if not force and previous is not None and digest == self._state().get("changelog_digest"):
+            self._write_state(last_change, digest)
+            return self.diff(previous, previous)
+
+        current = self.playeridmap.playeridmap()
+        diff = self.diff(previous, current)
+
+        if previous is None or list(previous.columns) != list(current.columns):
+            index = PlayerIDIndex.from_dataframe(current)
+        elif diff.empty:
+            index = None
+        else:
+            current = self.patch(previous, diff)
+            if self.index is not None:
+                index = self.index.patch(*diff)
+            else:
+                index = PlayerIDIndex.from_dataframe(current)
+
+        if index is not None:
+            self._replace(self.snapshot_file, lambda path: snapshot.to_parquet(current, path))
+            self._replace(self.index_file, lambda path: index.save(path))
+            self._snapshot, self._index = current, index
+        self._write_state(last_change, digest)
+
+        return diff
+
+    @staticmethod
+    def changelog_digest(changelog: pd.DataFrame) -> str:
+        """
+        :param changelog: CHANGELOG table, as returned by :py:meth:`PlayerIDMap.changelog`
+        :return: Hash of the CHANGELOG entries
+        """
+        content = changelog.to_csv(index=False, date_format="%Y-%m-%d")
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def diff(previous: typing.Optional[pd.DataFrame], current: pd.DataFrame) -> PlayerIDMapDiff:
+        """
+        :param previous: Previous version of the Player ID Map table, if any
+        :param current: Current version of the Player ID Map table
+        :return:
+        """
+        if previous is None:
+            return PlayerIDMapDiff(current, current.iloc[:0], current.iloc[:0])
+
+        previous = previous.drop_duplicates("PlayerID").set_index("PlayerID", drop=False)
+        current = current.drop_duplicates("PlayerID").set_index("PlayerID", drop=False)
+
+        added = current.loc[~current.index.isin(previous.index)]
+        removed = previous.loc[~previous.index.isin(current.index)]
+
+        common = current.index.intersection(previous.index)
+        columns = current.columns.intersection(previous.columns)
+        before = previous.loc[common, columns].astype("string").fillna("")
+        after = current.loc[common, columns].astype("string").fillna("")
+        changed = current.loc[common[(before != after).any(axis=1).to_numpy()]]
+
+        return PlayerIDMapDiff(*(df.reset_index(drop=True) for df in (added, removed, changed)))
+
+    @staticmethod
+    def patch(previous: pd.DataFrame, diff: PlayerIDMapDiff) -> pd.DataFrame:
+        """
+        Applies a row-level difference to a version of the Player ID Map table: the rows of the
+        removed players are dropped, the rows of the changed players are overwritten in place,
+        and the added players are appended.
+        Players are matched by ``PlayerID``.
+
+        :param previous: Previous version of the Player ID Map table
+        :param diff: Difference between ``previous`` and the current version, as returned by
+            :py:meth:`diff`
+        :return: The current version of the Player ID Map table
+        """
+        previous = previous.reset_index(drop=True)
+        kept = previous.loc[~previous.loc[:, "PlayerID"].isin(diff.removed.loc[:, "PlayerID"])]
+
+        changed = kept.loc[:, "PlayerID"].isin(diff.changed.loc[:, "PlayerID"])
+        rows = diff.changed.set_index("PlayerID", drop=False).loc[kept.loc[changed, "PlayerID"]]
+        rows.index = kept.index[changed]
+
+        current = pd.concat([kept.loc[~changed], rows]).sort_index()
+        return pd.concat([current, diff.added], ignore_index=True).loc[:, previous.columns]
+
+    def _path(self, filename: str) -> str:
+        """
+        :param filename:
+        :return:
+        """
+        return os.path.join(self.directory, filename)
+
+    def _replace(self, filename: str, write: typing.Callable[[str], None]) -> None:
+        """
+        Atomically replaces a file of the snapshot.
+
+        :param filename:
+        :param write: Function writing the new file to the path it is passed
+        """
+        base, extension = os.path.splitext(self._path(filename))
+        temporary = f"{base}.tmp{extension}"
+        write(temporary)
+        os.replace(temporary, self._path(filename))
+
+    def _state(self) -> typing.Dict[str, typing.Any]:
+        """
+        :return:
+        """
+        try:
+            with open(self._path(self.state_file), encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def _write_state(
+        self, last_change: typing.Optional[datetime.datetime], changelog_digest: str
+    ) -> None:
+        """
+        :param last_change:
+        :param changelog_digest: See :py:meth:`changelog_digest`
+        """
+        state = {
+            "last_sync": datetime.datetime.now().isoformat(),
+            "last_change": last_change.isoformat() if last_change is not None else None,
+            "changelog_digest": changelog_digest,
+        }
+
+        def write(path: str) -> None:
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(state, file)
+
+        self._replace(self.state_file, write)
@@ -2,16 +2,24 @@
 Web scraper for the `Tools`_ page of the **Smart Fantasy Baseball** website.
 """
 
-import datetime
+import io
 import math
+import threading
+import time
 import typing
+import warnings
 
-import bs4
-import dateutil.parser
 import numpy as np
 import pandas as pd
 import requests
 
+from sabrmetrics.htmlstream import declared_encoding
+from sabrmetrics.htmlstream import iter_elements
+from sabrmetrics.htmlstream import iter_table_rows
+from sabrmetrics.instrumentation import get_instrument
+from sabrmetrics.transport import ResponseStream
+from sabrmetrics.transport import get_transport
+
 
 class PlayerIDMap:
     """
@@ -64,6 +72,43 @@ class PlayerIDMap:
     .. py:attribute:: site_columns
 
         :type: dict[str, list[str]]
+
+    .. py:attribute:: integer_columns
+
+        Player ID Map columns converted to the nullable ``Int64`` dtype.
+
+        :type: list[str]
+
+    .. py:attribute:: categorical_columns
+
+        Player ID Map columns converted to the ``category`` dtype.
+
+        :type: list[str]
+
+    .. py:attribute:: birthdate_format
+
+        Format of the values of the Player ID Map "Birthdate" column.
+
+        :type: str
+
+    .. py:attribute:: hyperlinks_selector
+
+        Selector of the Player ID Map hyperlinks on the _Tools_ page.
+
+        :type: str
+
+    .. py:attribute:: hyperlinks_ttl
+
+        Seconds for which the hyperlinks scraped from the _Tools_ page are reused.
+
+        :type: float
+
+    .. py:attribute:: webview_selector
+
+        Selector of the table rows of the Player ID Map (and CHANGELOG) web views. The rows of the
+        ``<thead>`` (the column letters) are skipped, and the ``<tbody>`` may be implied.
+
+        :type: str
     """
     url = "https://smartfantasybaseball.com/tools/"
     headers = {
@@ -119,80 +164,245 @@ class PlayerIDMap:
         "RotoWire": ["RotoWireID", "RotoWireName"], "Yahoo": ["YahooID", "YahooName"],
     }
 
-    def __init__(self):
-        with requests.get(self.url, headers=self.headers, timeout=100) as response:
-            self._soup = bs4.BeautifulSoup(response.text, features="lxml")
+    integer_columns = [
+        "BaseballHQID", "BaseballProspectusID", "CBSID", "ESPNID", "FanDuelID",
+        "MLBID", "NFBCID", "OttoneuID", "RotoWireID", "YahooID"
+    ]
+    categorical_columns = ["Team", "League", "Position", "Bats", "Throws"]
+    birthdate_format = "%m/%d/%Y"
+
+    hyperlinks_selector = "#content table tr:nth-of-type(2) td:nth-of-type(1) a"
+    hyperlinks_ttl = 3600
+    webview_selector = "div#sheets-viewport div.grid-container table tr"
 
-        self._hyperlinks = [
-            e.attrs.get("href") for e in self._soup.select(
-                "#content table tr:nth-of-type(2) td:nth-of-type(1) a"
-            )
-        ]
+    _hyperlinks_cache: typing.Dict[str, typing.Tuple[float, typing.List[str]]] = {}
+    _hyperlinks_lock = threading.Lock()
+
+    @classmethod
+    def hyperlinks(cls, *, refresh: bool = False) -> typing.List[str]:
+        """
+        Hyperlinks to the Player ID Map files on the Tools page.
+        The Tools page is fetched on first use, and the hyperlinks are shared by all instances
+        for :py:attr:`hyperlinks_ttl` seconds.
+
+        :param refresh: Whether to fetch (and revalidate) the Tools page even if the hyperlinks
+            have not expired
+        :return: Copy of the shared hyperlinks
+        :raise requests.HTTPError: If the Tools page could not be fetched
+        :raise ValueError: If the Tools page does not link to any file
+        """
+        with cls._hyperlinks_lock:
+            if refresh:
+                cls._hyperlinks_cache.pop(cls.url, None)
+            cached = cls._hyperlinks_cache.get(cls.url)
+            if cached is None or time.monotonic() >= cached[0]:
+                transport = get_transport()
+                with transport.get(
+                    cls.url, headers=cls.headers, timeout=100, refresh=refresh
+                ) as response:
+                    response.raise_for_status()
+                    with get_instrument().span("parse", table="tools", source="html"):
+                        hyperlinks = [
+                            e.get("href") for e in iter_elements(
+                                [response.content], cls.hyperlinks_selector,
+                                encoding=declared_encoding(response)
+                            )
+                        ]
+                if not hyperlinks:
+                    # The page itself must not be reused either
+                    if transport.cache is not None:
+                        transport.cache.delete(transport.cache.key(cls.url))
+                    raise ValueError(f"No hyperlinks match {cls.hyperlinks_selector!r}")
+                cached = cls._hyperlinks_cache[cls.url] = (
+                    time.monotonic() + cls.hyperlinks_ttl, hyperlinks
+                )
+            return list(cached[1])
 
     @property
     def id_maps(self) -> typing.Dict[str, str]:
         """
         Hyperlinks for viewing/downloading the Player ID Map and related files.
         """
-        hyperlinks = [
-            e.attrs.get("href") for e in self._soup.select(
-                "#content table tr:nth-of-type(2) td:nth-of-type(1) a"
-            )
-        ]
+        hyperlinks = self.hyperlinks()
         return {
             "webview": hyperlinks[1], "excel_download": hyperlinks[0],
             "csv_download": hyperlinks[2], "changelog_webview": hyperlinks[3],
             "changelog_csv_download": hyperlinks[4]
         }
     
-    def playeridmap(self) -> pd.DataFrame:
+    def playeridmap(self, *, source: typing.Literal["csv", "html"] = "csv") -> pd.DataFrame:
         """
         The content of the Player ID Map table.
+
+        :param source: Whether to download the table as CSV, or to scrape it from the HTML web
+            view. If the CSV download fails, the table is scraped from the HTML web view instead.
+        :raise ValueError: If ``source`` is not ``"csv"`` or ``"html"``
+        """
+        if source == "csv":
+            try:
+                return self._playeridmap_csv()
+            except (requests.RequestException, ValueError, KeyError, IndexError) as error:
+                warnings.warn(f"Player ID Map CSV download failed ({error!r}); using web view")
+        elif source != "html":
+            raise ValueError(source)
+
+        return self._playeridmap_html()
+
+    @classmethod
+    def read_csv(cls, file: typing.Union[typing.BinaryIO, bytes]) -> pd.DataFrame:
+        """
+        Parses a Player ID Map CSV file (e.g., a previously downloaded copy), without making any
+        request.
+
+        :param file: File object, or content of the file
+        :return: The content of the Player ID Map table (see :py:meth:`playeridmap`)
         """
-        with requests.get(self.id_maps["webview"], headers=self.headers) as response:
-            soup = bs4.BeautifulSoup(response.text, features="lxml")
-            table = soup.select_one("div#sheets-viewport div.grid-container table")
-            dataframes = pd.read_html(str(table))
+        if isinstance(file, bytes):
+            file = io.BytesIO(file)
+
+        dtype = {k: str for k in cls.playeridmap_colmap}
+        dtype.update({
+            k: "category" for k, v in cls.playeridmap_colmap.items()
+            if v in cls.categorical_columns
+        })
+
+        with get_instrument().span("parse", table="playeridmap", source="csv"):
+            df = pd.read_csv(
+                file, encoding="utf-8", usecols=list(cls.playeridmap_colmap), dtype=dtype,
+                keep_default_na=False, na_values=[""]
+            )
+
+        df.rename(columns=cls.playeridmap_colmap, inplace=True)
+
+        return cls._typed_playeridmap(df)
+
+    def _playeridmap_csv(self) -> pd.DataFrame:
+        """
+        :return:
+        """
+        with get_transport().get(
+            self.id_maps["csv_download"], headers=self.headers, stream=True
+        ) as response:
+            response.raise_for_status()
+            return self.read_csv(io.BufferedReader(ResponseStream(response)))
+
+    def _playeridmap_html(self) -> pd.DataFrame:
+        """
+        :return:
+        """
+        with get_instrument().span("parse", table="playeridmap", source="html"):
+            table = self._webview_table(self.id_maps["webview"])
 
-        df = pd.concat(
-            [dataframes[0].iloc[2:, 1:9].copy(), dataframes[0].iloc[2:, 10:].copy()],
-            axis=1
-        )
-        df.columns = [*dataframes[0].iloc[0, 1:9], *dataframes[0].iloc[0, 10:]]
+        df = pd.concat([table.iloc[2:, 1:9].copy(), table.iloc[2:, 10:].copy()], axis=1)
+        df.columns = [*table.iloc[0, 1:9], *table.iloc[0, 10:]]
         df.reset_index(drop=True, inplace=True)
         df.rename(columns=self.playeridmap_colmap, inplace=True)
-        df = df.loc[:, self.playeridmap_columns]
-
-        integer_columns = [
-            "BaseballHQID", "BaseballProspectusID", "CBSID", "ESPNID", "FanDuelID",
-            "MLBID", "NFBCID", "OttoneuID", "RotoWireID", "YahooID"
-        ]
-        df.loc[:, "Birthdate"] = df.loc[:, "Birthdate"].apply(dateutil.parser.parse)
-        df.loc[:, "AllPositions"] = df.loc[:, "AllPositions"].apply(lambda x: x.split("/"))
-        df.loc[:, "Active"] = df.loc[:, "Active"].apply(lambda x: x == "Y")
-        df.loc[:, integer_columns] = df.loc[:, integer_columns].applymap(
-            lambda x: int(x) if isinstance(x, str) else pd.NA
-        )
+
+        return self._typed_playeridmap(df)
+
+    @classmethod
+    def _typed_playeridmap(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Selects, orders and converts the columns of the (renamed) Player ID Map table.
+
+        :param df:
+        :return:
+        """
+        with get_instrument().span("transform", table="playeridmap"):
+            return cls._convert_playeridmap(df)
+
+    @classmethod
+    def _convert_playeridmap(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        :param df:
+        :return:
+        """
+        df = df.loc[:, cls.playeridmap_columns].copy()
+
+        birthdate = df.loc[:, "Birthdate"]
+        df["Birthdate"] = pd.to_datetime(birthdate, format=cls.birthdate_format, errors="coerce")
+        unparsed = df.loc[:, "Birthdate"].isna() & birthdate.notna()
+        if unparsed.any():
+            df.loc[unparsed, "Birthdate"] = pd.to_datetime(
+                birthdate[unparsed], format="mixed", errors="coerce"
+            )
+
+        df["AllPositions"] = df.loc[:, "AllPositions"].str.split("/")
+        df["Active"] = df.loc[:, "Active"].eq("Y")
+        for column in cls.integer_columns:
+            df[column] = pd.to_numeric(df.loc[:, column], errors="coerce").astype("Int64")
+        for column in cls.categorical_columns:
+            df[column] = df.loc[:, column].astype("category")
 
         return df
-    
-    def changelog(self) -> pd.DataFrame:
+
+    def changelog(self, *, source: typing.Literal["csv", "html"] = "csv") -> pd.DataFrame:
         """
         The contents of the Player ID Map CHANGELOG table.
+
+        :param source: Whether to download the table as CSV, or to scrape it from the HTML web
+            view. If the CSV download fails, the table is scraped from the HTML web view instead.
+        :raise ValueError: If ``source`` is not ``"csv"`` or ``"html"``
         """
-        with requests.get(self.id_maps["changelog_webview"], headers=self.headers) as response:
-            soup = bs4.BeautifulSoup(response.text, features="lxml")
-            table = soup.select_one("div#sheets-viewport div.grid-container table")
-            dataframes = pd.read_html(str(table))
+        if source == "csv":
+            try:
+                df = self._changelog_csv()
+            except (requests.RequestException, ValueError, KeyError, IndexError) as error:
+                warnings.warn(f"CHANGELOG CSV download failed ({error!r}); using web view")
+                df = self._changelog_html()
+        elif source == "html":
+            df = self._changelog_html()
+        else:
+            raise ValueError(source)
 
-        df = dataframes[0].iloc[1:, 1:].copy()
-        df.columns = list(dataframes[0].iloc[0, 1:])
-        df.reset_index(drop=True, inplace=True)
         df.rename(columns=self.changelog_colmap, inplace=True)
         df = df.loc[:, self.changelog_columns]
+        df["Date"] = pd.to_datetime(df.loc[:, "Date"], format="%m/%d/%Y")
 
-        df.loc[:, "Date"] = df.loc[:, "Date"].apply(
-            lambda x: datetime.datetime.strptime(x, "%m/%d/%Y")
-        )
+        return df
+
+    def _changelog_csv(self) -> pd.DataFrame:
+        """
+        :return:
+        """
+        with get_transport().get(
+            self.id_maps["changelog_csv_download"], headers=self.headers, stream=True
+        ) as response:
+            response.raise_for_status()
+            with get_instrument().span("parse", table="changelog", source="csv"):
+                return pd.read_csv(
+                    io.BufferedReader(ResponseStream(response)), encoding="utf-8",
+                    usecols=list(self.changelog_colmap), dtype=str,
+                    keep_default_na=False, na_values=[""]
+                )
+
+    def _changelog_html(self) -> pd.DataFrame:
+        """
+        :return:
+        """
+        with get_instrument().span("parse", table="changelog", source="html"):
+            table = self._webview_table(self.id_maps["changelog_webview"])
+
+        df = table.iloc[1:, 1:].copy()
+        df.columns = list(table.iloc[0, 1:])
+        df.reset_index(drop=True, inplace=True)
 
         return df
+
+    def _webview_table(self, url: str) -> pd.DataFrame:
+        """
+        Streams the rows of the table of a spreadsheet web view, without building the parse tree
+        of the whole page (see :py:mod:`sabrmetrics.htmlstream`).
+        Empty cells are missing, and merged cells are repeated in each cell they span.
+
+        :param url:
+        :return: Cells of the table, including the row headers
+        """
+        with get_transport().get(url, headers=self.headers, stream=True) as response:
+            response.raise_for_status()
+            rows = list(iter_table_rows(
+                response.iter_content(2 ** 16), self.webview_selector,
+                encoding=declared_encoding(response), head=False
+            ))
+
+        return pd.DataFrame(rows).replace("", np.nan)
@@ -0,0 +1,202 @@
+"""
+Columnar snapshots of scraped tables, in the `Apache Arrow`_ (Feather) and `Apache Parquet`_
+formats.
+
+Writing and reading snapshots requires the optional ``pyarrow`` dependency
+(``pip install sabrmetrics[arrow]``).
+
+.. _Apache Arrow: https://arrow.apache.org/
+.. _Apache Parquet: https://parquet.apache.org/
+"""
+
+import os
+import typing
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pa = None
+
+
+def _require_pyarrow() -> None:
+    """
+    :raise ImportError: If ``pyarrow`` is not installed
+    """
+    if pa is None:
+        raise ImportError(
+            "columnar snapshots require pyarrow; install it with 'pip install sabrmetrics[arrow]'"
+        )
+
+
+def _label(label: typing.Any) -> str:
+    """
+    :param label: Column label, possibly a (nested) tuple
+    :return:
+    """
+    if isinstance(label, tuple):
+        return ".".join(filter(None, map(_label, label)))
+    return "" if label is None else str(label)
+
+
+def flatten(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Flattens a table into columns of scalar (or list) values: ``MultiIndex`` column labels are
+    joined with ``"."``, and columns of ``dict`` values are expanded into one column per key.
+    Columns of ``list`` (or ``tuple``) values are kept as lists, which Arrow stores as list
+    columns; other columns of mixed types are cast to strings.
+
+    :param df:
+    :return:
+    """
+    df = df.reset_index(drop=True)
+    df.columns = [_label(c) for c in df.columns]
+
+    columns = []
+    for name, column in df.items():
+        values = column.dropna()
+        if values.empty or column.dtype != object:
+            columns.append(column)
+        elif values.map(lambda x: isinstance(x, dict)).all():
+            nested = pd.json_normalize(list(column.map(lambda x: x if isinstance(x, dict) else {})))
+            nested.columns = [f"{name}.{c}" for c in nested.columns]
+            columns.extend(c for _, c in flatten(nested).items())
+        elif values.map(lambda x: isinstance(x, (list, tuple))).all():
+            columns.append(column.map(lambda x: list(x) if isinstance(x, tuple) else x))
+        elif pd.api.types.infer_dtype(values, skipna=True).startswith("mixed"):
+            columns.append(column.astype("string"))
+        else:
+            columns.append(column)
+
+    return pd.concat(columns, axis=1) if columns else df
+
+
+def _to_pandas(table: "pa.Table") -> pd.DataFrame:
+    """
+    Converts an Arrow table to a ``DataFrame``, with the values of list columns as lists (as
+    flattened by :py:func:`flatten`) rather than arrays.
+
+    :param table:
+    :return:
+    """
+    df = table.to_pandas()
+    for field in table.schema:
+        if pa.types.is_list(field.type) or pa.types.is_large_list(field.type):
+            df[field.name] = df.loc[:, field.name].map(
+                lambda x: x.tolist() if isinstance(x, np.ndarray) else x
+            )
+    return df
+
+
+def _table(obj: typing.Any, **kwargs: typing.Any) -> pd.DataFrame:
+    """
+    :param obj: ``DataFrame``, or object with a ``standings`` method (e.g.,
+        :py:class:`sabrmetrics.mlb.Standings`)
+    :param kwargs: Keyword arguments to the ``standings`` method
+    :return:
+    """
+    if isinstance(obj, pd.DataFrame):
+        return obj
+    if hasattr(obj, "standings"):
+        return obj.standings(**kwargs)
+    raise TypeError(f"cannot snapshot {type(obj).__name__}")
+
+
+def to_arrow(obj: typing.Any, **kwargs: typing.Any) -> "pa.Table":
+    """
+    :param obj: ``DataFrame``, or :py:class:`sabrmetrics.mlb.Standings`
+    :param kwargs: Keyword arguments to :py:meth:`sabrmetrics.mlb.Standings.standings`
+    :return:
+    """
+    _require_pyarrow()
+    return pa.Table.from_pandas(flatten(_table(obj, **kwargs)), preserve_index=False)
+
+
+def to_ipc(obj: typing.Any, **kwargs: typing.Any) -> "pa.Buffer":
+    """
+    Serializes a table in the Arrow IPC streaming format, e.g., for passing it between processes
+    without pickling a ``DataFrame``.
+
+    :param obj: ``DataFrame``, or :py:class:`sabrmetrics.mlb.Standings`
+    :param kwargs: Keyword arguments to :py:meth:`sabrmetrics.mlb.Standings.standings`
+    :return:
+    """
+    table = to_arrow(obj, **kwargs)
+    sink = pa.BufferOutputStream()
+    with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def read_ipc(
+    buffer: typing.Union["pa.Buffer", bytes], *, as_pandas: bool = False
+) -> typing.Union["pa.Table", pd.DataFrame]:
+    """
+    Reads a table serialized by :py:func:`to_ipc`, without copying its columns.
+
+    :param buffer:
+    :param as_pandas: Whether to return a ``DataFrame`` instead of an Arrow table
+    :return:
+    """
+    _require_pyarrow()
+    table = pyarrow.ipc.open_stream(pa.py_buffer(buffer)).read_all()
+    return _to_pandas(table) if as_pandas else table
+
+
+def to_parquet(
+    obj: typing.Any, path: typing.Union[str, os.PathLike], *, compression: str = "zstd",
+    **kwargs: typing.Any
+) -> None:
+    """
+    :param obj: ``DataFrame``, or :py:class:`sabrmetrics.mlb.Standings`
+    :param path:
+    :param compression:
+    :param kwargs: Keyword arguments to :py:meth:`sabrmetrics.mlb.Standings.standings`
+    """
+    pyarrow.parquet.write_table(to_arrow(obj, **kwargs), path, compression=compression)
+
+
+def to_feather(
+    obj: typing.Any, path: typing.Union[str, os.PathLike], *,
+    compression: str = "uncompressed", **kwargs: typing.Any
+) -> None:
+    """
+    Uncompressed Feather files (the default) can be memory-mapped without copying by
+    :py:func:`read_snapshot`.
+
+    :param obj: ``DataFrame``, or :py:class:`sabrmetrics.mlb.Standings`
+    :param path:
+    :param compression:
+    :param kwargs: Keyword arguments to :py:meth:`sabrmetrics.mlb.Standings.standings`
+    """
+    pyarrow.feather.write_feather(to_arrow(obj, **kwargs), path, compression=compression)
+
+
+def read_snapshot(
+    path: typing.Union[str, os.PathLike], *,
+    columns: typing.Optional[typing.Sequence[str]] = None,
+    memory_map: bool = True, as_pandas: bool = False
+) -> typing.Union["pa.Table", pd.DataFrame]:
+    """
+    Reads a snapshot written by :py:func:`to_parquet` (``.parquet``) or :py:func:`to_feather`
+    (any other extension).
+
+    :param path:
+    :param columns: Columns to read, or ``None`` to read all columns
+    :param memory_map: Whether to memory-map the file
+    :param as_pandas: Whether to return a ``DataFrame`` instead of an Arrow table
+    :return:
+    """
+    _require_pyarrow()
+
+    if os.fspath(path).endswith(".parquet"):
+        table = pyarrow.parquet.read_table(path, columns=columns, memory_map=memory_map)
+    else:
+        table = pyarrow.feather.read_table(path, columns=columns, memory_map=memory_map)
+
+    return _to_pandas(table) if as_pandas else table
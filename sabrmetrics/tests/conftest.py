@@ -0,0 +1,30 @@
+"""
+"""
+
+import typing
+
+import pytest
+
+from sabrmetrics.sfbb import PlayerIDMap
+from sabrmetrics.tests import payloads
+from sabrmetrics.transport import Transport
+from sabrmetrics.transport import set_transport
+
+
+@pytest.fixture
+def adapter() -> typing.Iterator[payloads.FixtureAdapter]:
+    """
+    Answers the requests of every scraper with synthetic responses (see
+    :py:func:`sabrmetrics.tests.payloads.route`).
+
+    :return: The adapter answering the requests
+    """
+    PlayerIDMap._hyperlinks_cache.clear()
+    with Transport() as transport:
+        adapter = payloads.mount(transport)
+        previous = set_transport(transport)
+        try:
+            yield adapter
+        finally:
+            set_transport(previous)
+            PlayerIDMap._hyperlinks_cache.clear()
@@ -0,0 +1,612 @@
+"""
+Synthetic responses of the endpoints scraped by :py:mod:`sabrmetrics`, for offline tests and
+benchmarks.
+
+:py:func:`route` answers a request like the live endpoint would (including the ``hydrate`` and
+``fields`` parameters of the standings endpoint).
+It is served either in-process, by mounting :py:class:`FixtureAdapter` on a transport's session,
+or over HTTP, by :py:class:`StandInServer`.
+:py:func:`record` records the responses of every public scraper entry point to an archive
+replayed by :py:class:`sabrmetrics.transport.ReplayTransport`.
+"""
+
+import csv
+import datetime
+import functools
+import http.server
+import io
+import json
+import random
+import socket
+import threading
+import typing
+import urllib.parse
+
+import requests
+import requests.adapters
+
+from sabrmetrics.transport import build_response
+
+
+STATSAPI = "https://statsapi.mlb.com/api/v1"
+TOOLS = "https://smartfantasybaseball.com/tools/"
+SHEETS = "https://docs.google.com/spreadsheets/d"
+
+HYPERLINKS = [
+    f"{SHEETS}/playeridmap/export?format=xlsx",
+    f"{SHEETS}/playeridmap/htmlview",
+    f"{SHEETS}/playeridmap/export?format=csv",
+    f"{SHEETS}/changelog/htmlview",
+    f"{SHEETS}/changelog/export?format=csv",
+]
+
+PLAYERS = 4000
+DIVISIONS = {200: 103, 201: 103, 202: 103, 203: 104, 204: 104, 205: 104}
+TEAMS = {
+    200: ["LAA", "HOU", "OAK", "SEA", "TEX"], 201: ["BAL", "BOS", "NYY", "TB", "TOR"],
+    202: ["CWS", "CLE", "DET", "KC", "MIN"], 203: ["AZ", "COL", "LAD", "SD", "SF"],
+    204: ["ATL", "MIA", "NYM", "PHI", "WSH"], 205: ["CHC", "CIN", "MIL", "PIT", "STL"],
+}
+SPLIT_TYPES = [
+    "home", "away", "left", "leftHome", "leftAway", "right", "rightHome", "rightAway",
+    "lastTen", "extraInning", "oneRun", "winners", "day", "night", "grass", "turf",
+]
+
+FIRST_NAMES = [
+    "Jose", "Luis", "Carlos", "Juan", "Miguel", "Michael", "Chris", "Matt", "Ryan", "Alex",
+    "Tyler", "Kyle", "Josh", "Daniel", "David", "Nick", "Andrew", "Brandon", "Jake", "Justin",
+    "Shohei", "Ronald", "Vladimir", "Fernando", "Yordan", "Rafael", "Francisco", "Julio",
+]
+LAST_NAMES = [
+    "Ramirez", "Rodriguez", "Martinez", "Hernandez", "Garcia", "Gonzalez", "Lopez", "Perez",
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Miller", "Davis", "Wilson", "Anderson",
+    "Taylor", "Thomas", "Moore", "Jackson", "White", "Harris", "Clark", "Lewis", "Walker",
+    "Ohtani", "Acuna", "Guerrero", "Tatis", "Alvarez", "Devers", "Lindor", "Soto", "Betts",
+]
+POSITIONS = ["C", "1B", "2B", "3B", "SS", "OF", "DH", "P"]
+
+
+def season_dates(season: int) -> typing.Dict[str, typing.Any]:
+    """
+    :param season:
+    :return: ``seasonDateInfo`` of a league document
+    """
+    return {
+        "preSeasonStartDate": f"{season}-01-01", "preSeasonEndDate": f"{season}-02-19",
+        "seasonStartDate": f"{season}-02-20", "seasonEndDate": f"{season}-11-01",
+        "springStartDate": f"{season}-02-20", "springEndDate": f"{season}-03-26",
+        "regularSeasonStartDate": f"{season}-03-30", "lastDate1stHalf": f"{season}-07-09",
+        "allStarDate": f"{season}-07-11", "firstDate2ndHalf": f"{season}-07-14",
+        "regularSeasonEndDate": f"{season}-10-01", "postSeasonStartDate": f"{season}-10-03",
+        "postSeasonEndDate": f"{season}-11-01", "offSeasonStartDate": f"{season}-11-02",
+        "offSeasonEndDate": f"{season + 1}-02-19", "gameLevelGamedayType": "P",
+        "seasonLevelGamedayType": "P", "qualifierPlateAppearances": 3.1,
+        "qualifierOutsPitched": 3.0,
+    }
+
+
+def league(league_id: int, season: int) -> typing.Dict[str, typing.Any]:
+    """
+    :param league_id:
+    :param season:
+    :return: Document of the league endpoint
+    """
+    return {
+        "copyright": "Copyright MLB Advanced Media, L.P.",
+        "leagues": [{
+            "id": league_id, "name": f"League {league_id}", "season": str(season),
+            "link": f"/api/v1/league/{league_id}", "seasonDateInfo": season_dates(season),
+        }],
+    }
+
+
+def division(division_id: int) -> typing.Dict[str, typing.Any]:
+    """
+    :param division_id:
+    :return: Document of the divisions endpoint
+    """
+    return {
+        "copyright": "Copyright MLB Advanced Media, L.P.",
+        "divisions": [{
+            "id": division_id, "name": f"Division {division_id}",
+            "link": f"/api/v1/divisions/{division_id}",
+            "league": {"id": DIVISIONS[division_id]},
+        }],
+    }
+
+
+def _team(division_id: int, position: int, hydrate: bool, date: datetime.date) -> dict:
+    """
+    :param division_id:
+    :param position:
+    :param hydrate: Whether to include the hydrated team fields and schedules
+    :param date:
+    :return:
+    """
+    team_id = 100 + (division_id - 200) * 5 + position
+    abbreviation = TEAMS[division_id][position]
+    team = {"id": team_id, "name": f"{abbreviation} Club", "link": f"/api/v1/teams/{team_id}"}
+    if not hydrate:
+        return team
+
+    game = {
+        "gamePk": team_id * 1000, "gameType": "R", "season": str(date.year),
+        "gameDate": f"{date.isoformat()}T23:05:00Z", "status": {"abstractGameState": "Final"},
+        "teams": {
+            side: {"team": {"id": team_id, "name": f"{abbreviation} Club"}, "score": 3}
+            for side in ("away", "home")
+        },
+        "venue": {"id": team_id, "name": f"{abbreviation} Park"},
+    }
+    schedule = {"totalGames": 1, "dates": [{"date": date.isoformat(), "games": [game]}]}
+    team.update({
+        "season": date.year, "teamCode": abbreviation.lower(), "abbreviation": abbreviation,
+        "teamName": f"{abbreviation} Club", "locationName": abbreviation,
+        "firstYearOfPlay": "1901", "active": True,
+        "venue": {
+            "id": team_id, "name": f"{abbreviation} Park", "link": f"/api/v1/venues/{team_id}"
+        },
+        "league": {"id": DIVISIONS[division_id], "name": f"League {DIVISIONS[division_id]}"},
+        "division": {"id": division_id, "name": f"Division {division_id}"},
+        "sport": {"id": 1, "name": "Major League Baseball"},
+        "nextSchedule": schedule, "previousSchedule": schedule,
+    })
+    return team
+
+
+def _record(wins: int, losses: int, **fields: typing.Any) -> dict:
+    """
+    :param wins:
+    :param losses:
+    :param fields:
+    :return:
+    """
+    pct = f"{wins / (wins + losses):.3f}".lstrip("0") if wins + losses else ".000"
+    return {"wins": wins, "losses": losses, **fields, "pct": pct}
+
+
+def standings(
+    season: int, date: datetime.date, *, league_ids: typing.Sequence[int] = (103, 104),
+    standings_types: typing.Sequence[str] = ("regularSeason",), hydrate: bool = False,
+    fields: typing.Optional[typing.Collection[str]] = None
+) -> typing.Dict[str, typing.Any]:
+    """
+    Standings of 30 teams in 6 divisions, whose records depend on ``season`` and ``date``.
+
+    :param season:
+    :param date:
+    :param league_ids:
+    :param standings_types:
+    :param hydrate: Whether to include the hydrated team fields and schedules
+    :param fields: Field names kept at every level of the document, like the ``fields`` query
+        parameter, or ``None`` to keep every field
+    :return: Document of the standings endpoint
+    """
+    rng = random.Random(f"{season}-{date.isoformat()}")
+    games = max(0, min((date - datetime.date(season, 3, 30)).days, 162))
+    updated = f"{date.isoformat()}T04:00:00Z"
+
+    records = []
+    for standings_type in standings_types:
+        for division_id, league_id in DIVISIONS.items():
+            if league_id not in league_ids:
+                continue
+            teams = []
+            for position in range(5):
+                wins = rng.randint(0, games)
+                teams.append((position, wins, games - wins))
+            teams.sort(key=lambda x: -x[1])
+            leader = teams[0][1] - teams[0][2]
+
+            team_records = []
+            for rank, (position, wins, losses) in enumerate(teams, 1):
+                games_back = (leader - (wins - losses)) / 2
+                wild_card = games_back - 3.0
+                streak = rng.randint(1, 6)
+                split = [
+                    _record(rng.randint(0, wins), rng.randint(0, losses), type=t)
+                    for t in SPLIT_TYPES
+                ]
+                team_records.append({
+                    "team": _team(division_id, position, hydrate, date),
+                    "season": str(season),
+                    "streak": {
+                        "streakCode": f"{'W' if streak % 2 else 'L'}{streak}",
+                        "streakType": "wins" if streak % 2 else "losses", "streakNumber": streak,
+                    },
+                    "divisionRank": str(rank), "leagueRank": str(rank + 2),
+                    "sportRank": str(rank + 5), "gamesPlayed": wins + losses,
+                    "gamesBack": "-" if rank == 1 else f"{games_back:.1f}",
+                    "wildCardGamesBack": (
+                        "-" if rank == 1 else f"+{-wild_card:.1f}" if wild_card < 0
+                        else f"{wild_card:.1f}"
+                    ),
+                    "leagueGamesBack": "-" if rank == 1 else f"{games_back:.1f}",
+                    "springLeagueGamesBack": "-", "sportGamesBack": f"{games_back:.1f}",
+                    "divisionGamesBack": "-" if rank == 1 else f"{games_back:.1f}",
+                    "conferenceGamesBack": "-",
+                    "leagueRecord": _record(wins, losses, ties=0),
+                    "lastUpdated": updated,
+                    "records": {
+                        "splitRecords": split,
+                        "divisionRecords": [
+                            _record(
+                                rng.randint(0, wins), rng.randint(0, losses),
+                                division={"id": d, "name": f"Division {d}",
+                                          "link": f"/api/v1/divisions/{d}"}
+                            ) for d in DIVISIONS if DIVISIONS[d] == league_id
+                        ],
+                        "overallRecords": [
+                            _record(rng.randint(0, wins), rng.randint(0, losses), type=t)
+                            for t in ("home", "away")
+                        ],
+                        "leagueRecords": [
+                            _record(
+                                rng.randint(0, wins), rng.randint(0, losses),
+                                league={"id": x, "name": f"League {x}",
+                                        "link": f"/api/v1/league/{x}"}
+                            ) for x in (103, 104)
+                        ],
+                        "expectedRecords": [
+                            _record(rng.randint(0, games), rng.randint(0, games), type=t)
+                            for t in ("xWinLoss", "xWinLossSeason")
+                        ],
+                    },
+                    "runsAllowed": rng.randint(0, 5 * games),
+                    "runsScored": rng.randint(0, 5 * games),
+                    "divisionChamp": False, "divisionLeader": rank == 1,
+                    "hasWildcard": True, "clinched": False,
+                    "eliminationNumber": "-", "wildCardEliminationNumber": "-",
+                    "wins": wins, "losses": losses,
+                    "runDifferential": rng.randint(-100, 100),
+                    "winningPercentage": _record(wins, losses)["pct"],
+                })
+
+            records.append({
+                "standingsType": standings_type,
+                "league": {"id": league_id, "link": f"/api/v1/league/{league_id}"},
+                "division": {"id": division_id, "link": f"/api/v1/divisions/{division_id}"},
+                "sport": {"id": 1, "link": "/api/v1/sports/1"},
+                "lastUpdated": updated,
+                "teamRecords": team_records,
+            })
+
+    document = {"copyright": "Copyright MLB Advanced Media, L.P.", "records": records}
+    return document if fields is None else trim(document, set(fields))
+
+
+def trim(value: typing.Any, fields: typing.Set[str]) -> typing.Any:
+    """
+    :param value: Decoded JSON value
+    :param fields: Field names kept at every level, like the ``fields`` query parameter
+    :return:
+    """
+    if isinstance(value, dict):
+        return {k: trim(v, fields) for k, v in value.items() if k in fields}
+    if isinstance(value, list):
+        return [trim(x, fields) for x in value]
+    return value
+
+
+def _players(count: int) -> typing.Iterator[typing.Dict[str, str]]:
+    """
+    :param count:
+    :return: Rows of the Player ID Map CSV file
+    """
+    rng = random.Random(count)
+    for i in range(count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        name = f"{first} {last}" + (" Jr." if i % 97 == 0 else "")
+        mlbid = 400000 + i
+        positions = rng.sample(POSITIONS, rng.randint(1, 3))
+        missing = i % 7 == 0
+
+        yield {
+            "IDPLAYER": f"{last.lower()}{first[0].lower()}{i:05d}", "PLAYERNAME": name,
+            "BIRTHDATE": f"{rng.randint(1, 12)}/{rng.randint(1, 28)}/{rng.randint(1975, 2004)}",
+            "FIRSTNAME": first, "LASTNAME": last,
+            "TEAM": rng.choice([t for v in TEAMS.values() for t in v]),
+            "LG": rng.choice(["AL", "NL"]), "POS": positions[0],
+            "IDFANGRAPHS": f"sa{i}" if i % 5 == 0 else str(10000 + i), "FANGRAPHSNAME": name,
+            "MLBID": str(mlbid), "MLBNAME": name,
+            "CBSID": "" if missing else str(1000000 + i), "CBSNAME": "" if missing else name,
+            "RETROID": f"{last[:4].lower()}{first[0].lower()}{i % 1000:03d}",
+            "BREFID": f"{last[:5].lower()}{first[:2].lower()}{i % 100:02d}",
+            "NFBCID": str(2000 + i), "NFBCNAME": name, "ESPNID": str(30000 + i),
+            "ESPNNAME": name, "KFFLNAME": name, "DAVENPORTID": f"{last[:4].upper()}{i:04d}",
+            "BPID": str(50000 + i), "YAHOOID": str(8000 + i), "YAHOONAME": name,
+            "MSTRBLLNAME": name, "BATS": rng.choice("RLS"), "THROWS": rng.choice("RL"),
+            "FANTPROSNAME": name, "LASTCOMMAFIRST": f"{last}, {first}",
+            "ROTOWIREID": str(9000 + i), "FANDUELNAME": name, "FANDUELID": str(60000 + i),
+            "DRAFTKINGSNAME": name, "OTTONEUID": str(70000 + i), "HQID": str(i),
+            "RAZZBALLNAME": name, "FANTRAXID": f"*{i:05d}*", "FANTRAXNAME": name,
+            "ROTOWIRENAME": name, "ALLPOS": "/".join(positions),
+            "NFBCLASTFIRST": f"{last}, {first}", "ACTIVE": rng.choice("YN"),
+        }
+
+
+@functools.lru_cache(maxsize=None)
+def playeridmap_csv(count: int = PLAYERS) -> bytes:
+    """
+    :param count: Number of players
+    :return: Player ID Map CSV file
+    """
+    from sabrmetrics.sfbb import PlayerIDMap
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(PlayerIDMap.playeridmap_colmap))
+    writer.writeheader()
+    writer.writerows(_players(count))
+    return buffer.getvalue().encode("utf-8")
+
+
+def changelog_rows(count: int = 50) -> typing.List[typing.Tuple[str, str]]:
+    """
+    :param count:
+    :return: Date and description of each CHANGELOG entry, most recent first
+    """
+    start = datetime.date(2023, 9, 1)
+    return [
+        ((start - datetime.timedelta(i // 2)).strftime("%m/%d/%Y"), f"Change number {count - i}")
+        for i in range(count)
+    ]
+
+
+def changelog_csv(rows: typing.Optional[typing.Sequence[typing.Tuple[str, str]]] = None) -> bytes:
+    """
+    :param rows:
+    :return: CHANGELOG CSV file
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["DATE", "DESCRIPTION OF CHANGE"])
+    writer.writerows(changelog_rows() if rows is None else rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def sheet_html(rows: typing.Sequence[typing.Sequence[str]], *, tbody: bool = True) -> bytes:
+    """
+    Google Sheets web view of a table: the first column holds the row numbers, and a head row
+    holds the column letters.
+
+    :param rows:
+    :param tbody: Whether the rows are wrapped in an explicit ``<tbody>`` element
+    :return:
+    """
+    width = max(map(len, rows))
+    head = "".join(f"<th class=\"column-headers-background\">C{i}</th>" for i in range(width))
+    body = "".join(
+        f"<tr style=\"height: 20px\"><th class=\"row-headers-background\">"
+        f"<div class=\"row-header-wrapper\">{i}</div></th>"
+        + "".join(f"<td class=\"s0\">{c}</td>" for c in row) + "</tr>"
+        for i, row in enumerate(rows, 1)
+    )
+    if tbody:
+        body = f"<tbody>{body}</tbody>"
+    return (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>Sheet</title>"
+        "<style>.s0{color:#000}</style></head><body>"
+        "<div id=\"sheets-viewport\"><div class=\"grid-container\">"
+        "<table class=\"waffle\" cellspacing=\"0\" cellpadding=\"0\">"
+        f"<thead><tr><th class=\"row-header\"></th>{head}</tr></thead>{body}"
+        "</table></div></div></body></html>"
+    ).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def playeridmap_html(count: int = PLAYERS, *, tbody: bool = True) -> bytes:
+    """
+    :param count: Number of players
+    :param tbody:
+    :return: Web view of the Player ID Map, whose first 8 columns are separated from the others
+        by an empty column, and whose header row is followed by a frozen row
+    """
+    players = list(csv.reader(io.StringIO(playeridmap_csv(count).decode("utf-8"))))
+    rows = [[*r[:8], "", *r[8:]] for r in players]
+    rows.insert(1, [""] * len(rows[0]))
+    return sheet_html(rows, tbody=tbody)
+
+
+def changelog_html(tbody: bool = True) -> bytes:
+    """
+    :param tbody:
+    :return: Web view of the CHANGELOG
+    """
+    return sheet_html([["DATE", "DESCRIPTION OF CHANGE"], *changelog_rows()], tbody=tbody)
+
+
+def tools_html() -> bytes:
+    """
+    :return: The Tools page, whose second table row links to the Player ID Map files
+    """
+    links = "".join(f"<a href=\"{x}\">Link {i}</a> " for i, x in enumerate(HYPERLINKS))
+    filler = "".join(f"<p>Paragraph {i} about fantasy baseball tools.</p>" for i in range(500))
+    return (
+        "<html><head><title>Tools</title></head><body><div id=\"content\">"
+        f"{filler}<table><tr><td>Header</td></tr><tr><td>{links}</td><td>Other</td></tr>"
+        "<tr><td><a href=\"https://example.com/other\">Other</a></td></tr></table>"
+        "</div></body></html>"
+    ).encode("utf-8")
+
+
+def route(url: str) -> typing.Tuple[int, typing.Dict[str, str], bytes]:
+    """
+    :param url: Requested URL, including the query string
+    :return: Status code, headers and body of the response
+    """
+    parts = urllib.parse.urlsplit(url)
+    query = dict(urllib.parse.parse_qsl(parts.query))
+    path = parts.path
+    json_headers = {"Content-Type": "application/json;charset=UTF-8"}
+
+    def encode(document: typing.Any) -> bytes:
+        return json.dumps(document).encode("utf-8")
+
+    if path.startswith("/api/v1/league/"):
+        league_id = int(path.rsplit("/", 1)[1])
+        return 200, json_headers, encode(league(league_id, int(query.get("season", 2023))))
+    if path.startswith("/api/v1/divisions/"):
+        return 200, json_headers, encode(division(int(path.rsplit("/", 1)[1])))
+    if path == "/api/v1/standings":
+        document = standings(
+            int(query["season"]), datetime.date.fromisoformat(query["date"]),
+            league_ids=[int(x) for x in query.get("leagueId", "103,104").split(",")],
+            # Spring training and split-season standings are empty for the AL and NL
+            standings_types=["regularSeason"],
+            hydrate="team" in query.get("hydrate", ""),
+            fields=query["fields"].split(",") if "fields" in query else None
+        )
+        return 200, json_headers, encode(document)
+
+    if url == TOOLS:
+        return 200, {"Content-Type": "text/html; charset=UTF-8"}, tools_html()
+    if url == HYPERLINKS[1]:
+        return 200, {"Content-Type": "text/html; charset=utf-8"}, playeridmap_html()
+    if url == HYPERLINKS[2]:
+        return 200, {"Content-Type": "text/csv; charset=utf-8"}, playeridmap_csv()
+    if url == HYPERLINKS[3]:
+        return 200, {"Content-Type": "text/html; charset=utf-8"}, changelog_html()
+    if url == HYPERLINKS[4]:
+        return 200, {"Content-Type": "text/csv; charset=utf-8"}, changelog_csv()
+    return 404, {"Content-Type": "text/plain"}, b"Not Found"
+
+
+class FixtureAdapter(requests.adapters.BaseAdapter):
+    """
+    Transport adapter answering every request with :py:func:`route`, without network access.
+
+    :param router: Defaults to :py:func:`route`
+
+    .. py:attribute:: requests
+
+        URL of every request received, in order.
+
+        :type: list[str]
+    """
+    def __init__(
+        self,
+        router: typing.Callable[[str], typing.Tuple[int, typing.Dict[str, str], bytes]] = route
+    ):
+        super().__init__()
+        self._router = router
+        self._lock = threading.Lock()
+        self.requests: typing.List[str] = []
+
+    def send(self, request: requests.PreparedRequest, **kwargs: typing.Any) -> requests.Response:
+        with self._lock:
+            self.requests.append(request.url)
+        status_code, headers, content = self._router(request.url)
+        response = build_response(
+            content, status_code=status_code, headers=headers, url=request.url,
+            encoding=requests.utils.get_encoding_from_headers(headers)
+        )
+        response.request = request
+        response.reason = http.HTTPStatus(status_code).phrase
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def mount(transport: typing.Any, adapter: typing.Optional[FixtureAdapter] = None) -> FixtureAdapter:
+    """
+    Answers every request of ``transport`` with ``adapter``.
+
+    :param transport: :py:class:`sabrmetrics.transport.Transport`
+    :param adapter: Defaults to a new :py:class:`FixtureAdapter`
+    :return: ``adapter``
+    """
+    adapter = adapter or FixtureAdapter()
+    transport.session.mount("https://", adapter)
+    transport.session.mount("http://", adapter)
+    return adapter
+
+
+_cached_route = functools.lru_cache(maxsize=None)(route)
+
+
+class StandInServer(http.server.ThreadingHTTPServer):
+    """
+    Local HTTP server answering ``GET`` requests with (memoized) :py:func:`route`, with
+    keep-alive.
+    Request paths are resolved against the scraped hosts, e.g. ``/api/v1/standings?...`` against
+    the statsapi.
+    """
+    daemon_threads = True
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self) -> None:
+            super().setup()
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def do_GET(self) -> None:
+            base = STATSAPI.rsplit("/api/v1", 1)[0] if self.path.startswith("/api/") else ""
+            status_code, headers, content = _cached_route(base + self.path)
+            self.send_response(status_code)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args: typing.Any) -> None:
+            pass
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), self.Handler)
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    def __enter__(self) -> "StandInServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.shutdown()
+        self.server_close()
+
+    @property
+    def url(self) -> str:
+        """
+        """
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+def record(archive: str, seasons: typing.Sequence[int] = (2021, 2022, 2023)) -> None:
+    """
+    Records the responses of every public scraper entry point to ``archive``, for
+    :py:func:`sabrmetrics.transport.replaying`.
+
+    :param archive:
+    :param seasons: Seasons whose standings are recorded
+    """
+    from sabrmetrics.mlb import divisions
+    from sabrmetrics.mlb import leagues
+    from sabrmetrics.mlb import standings as mlb_standings
+    from sabrmetrics.sfbb import PlayerIDMap
+    from sabrmetrics.transport import recording
+
+    with recording(archive) as transport:
+        mount(transport)
+        PlayerIDMap.hyperlinks(refresh=True)
+        for season in seasons:
+            date = datetime.datetime(season, 7, 1)
+            for cls in (leagues.AmericanLeague, leagues.NationalLeague):
+                cls(season)
+            mlb_standings.Standings(season=season, date=date)
+            mlb_standings.Standings(
+                season=season, date=date, columns=["wins", "losses", "gamesBack"]
+            )
+            address = mlb_standings.Address(
+                season=season, date=date, hydrate=mlb_standings.HYDRATE_ALL
+            )
+            transport.get(address.url, params=dict(address.query))
+        for cls in (divisions.ALWest, divisions.ALEast, divisions.ALCentral,
+                    divisions.NLWest, divisions.NLEast, divisions.NLCentral):
+            cls()
+        playeridmap = PlayerIDMap()
+        playeridmap.playeridmap(source="csv")
+        playeridmap.playeridmap(source="html")
+        playeridmap.changelog(source="csv")
+        playeridmap.changelog(source="html")
@@ -0,0 +1,97 @@
+"""
+"""
+
+import datetime
+import itertools
+import pickle
+import types
+
+import pytest
+
+from sabrmetrics.cache import ResponseCache
+from sabrmetrics.mlb import address
+from sabrmetrics.mlb import divisions
+from sabrmetrics.mlb import leagues
+from sabrmetrics.mlb import standings
+
+
+class TestURL:
+    """
+    """
+    def test_class(self):
+        assert standings.Address.url == "https://statsapi.mlb.com/api/v1/standings"
+        assert isinstance(leagues.Address.url, str)
+        assert isinstance(divisions.Address.url, str)
+
+    def test_instance(self):
+        address = leagues.Address(league_id=103, season=2023)
+        assert address.url == leagues.Address.url.format(league_id=103)
+        assert pickle.loads(pickle.dumps(address)).url == address.url
+
+
+def _address(**kwargs):
+    return standings.Address(season=2023, date=datetime.datetime(2023, 7, 1), **kwargs)
+
+
+class TestImmutable:
+    """
+    """
+    def test_equal(self):
+        assert _address(league_id=(103,)) == _address(league_id=(103,))
+        assert hash(_address(league_id=(103,))) == hash(_address(league_id=(103,)))
+        assert _address(league_id=(103,)) != _address(league_id=(104,))
+        assert _address() != leagues.Address(league_id=103, season=2023)
+
+    def test_list_arguments(self):
+        address = _address(league_id=[103])
+        assert address.fields["league_id"] == (103,)
+        assert address == _address(league_id=(103,))
+        assert hash(address) == hash(_address(league_id=(103,)))
+
+    def test_keys(self):
+        addresses = {_address(league_id=[103]): "AL", _address(league_id=[104]): "NL"}
+        assert addresses[_address(league_id=(103,))] == "AL"
+        assert len({_address(), _address(), pickle.loads(pickle.dumps(_address()))}) == 1
+
+        first, second = _address(league_id=[103]), _address(league_id=(103,))
+        assert (
+            ResponseCache.key(first.url, dict(first.query))
+            == ResponseCache.key(second.url, dict(second.query))
+        )
+
+    @pytest.mark.parametrize("name", ["url", "fields", "season", "_hash", "other"])
+    def test_setattr(self, name):
+        address = _address()
+        with pytest.raises(AttributeError):
+            setattr(address, name, None)
+        with pytest.raises(AttributeError):
+            delattr(address, name)
+
+    def test_fields(self):
+        address = _address()
+        with pytest.raises(TypeError):
+            address.fields["season"] = 2022
+        assert address.fields["season"] == 2023
+
+
+class TestLazyDefault:
+    """
+    """
+    def test_memoized_per_day(self, monkeypatch):
+        days = iter([datetime.date(2023, 7, 1)] * 3 + [datetime.date(2023, 7, 2)] * 4)
+        clock = types.SimpleNamespace(date=types.SimpleNamespace(today=lambda: next(days)))
+        monkeypatch.setattr(address, "datetime", clock)
+
+        default = address.LazyDefault(itertools.count().__next__)
+        assert not default.resolved
+        assert default.resolve() == default.resolve() == 0
+        assert not default.resolved
+        assert default.resolve() == default.resolve() == 1
+
+        default.reset()
+        assert default.resolve() == 2
+
+    def test_season_default(self, adapter):
+        default = standings.Address.field_defaults["season"]
+        default.reset()
+        assert default.resolve() == leagues.Season.latest_year()
@@ -0,0 +1,32 @@
+"""
+"""
+
+import datetime
+import urllib.parse
+
+import pytest
+
+from sabrmetrics import snapshot
+from sabrmetrics.backfill import Backfill
+from sabrmetrics.backfill import Partition
+
+pytest.importorskip("pyarrow")
+
+
+class TestBackfill:
+    """
+    """
+    @pytest.mark.parametrize("date", [datetime.date(2023, 3, 20), datetime.date(2023, 7, 1)])
+    def test_partition_date(self, tmp_path, adapter, date):
+        partition = Partition("standings", 2023, date)
+        backfill = Backfill(str(tmp_path), [partition])
+        assert backfill.run().completed == 1
+
+        table = snapshot.read_snapshot(tmp_path / partition.path, as_pandas=True)
+        assert table.loc[:, "standard.lastUpdated"].str.startswith(date.isoformat()).all()
+
+        queries = [
+            urllib.parse.parse_qs(urllib.parse.urlsplit(x).query)
+            for x in adapter.requests if "/standings" in x
+        ]
+        assert [x["date"] for x in queries] == [[date.isoformat()]]
@@ -0,0 +1,41 @@
+"""
+"""
+
+import concurrent.futures
+import datetime
+import json
+
+import pandas as pd
+import pytest
+
+from sabrmetrics import batch
+from sabrmetrics import snapshot
+from sabrmetrics.mlb.standings import Standings
+from sabrmetrics.tests import payloads
+
+pyarrow = pytest.importorskip("pyarrow")
+
+
+class TestBatch:
+    """
+    """
+    def test_buffers(self):
+        payload = json.dumps(payloads.standings(2023, datetime.date(2023, 7, 1))).encode()
+        buffer = batch._parse_standings(payload, view=None, options={})
+        assert isinstance(buffer, pyarrow.Buffer)
+
+    def test_standings(self):
+        documents = [
+            json.dumps(payloads.standings(s, datetime.date(s, 7, 1))).encode()
+            for s in (2021, 2022, 2023)
+        ]
+        with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+            tables = batch.parse_standings(
+                documents, workers=2, executor=executor, as_pandas=True
+            )
+
+        for document, table in zip(documents, tables):
+            expected = snapshot.read_ipc(
+                snapshot.to_ipc(Standings.from_payload(document)), as_pandas=True
+            )
+            pd.testing.assert_frame_equal(table, expected)
@@ -0,0 +1,203 @@
+"""
+"""
+
+import time
+import typing
+
+import pytest
+import requests
+
+from sabrmetrics.cache import CacheEntry
+from sabrmetrics.cache import MemoryCache
+from sabrmetrics.cache import ResponseCache
+from sabrmetrics.cache import SQLiteCache
+from sabrmetrics.tests import payloads
+from sabrmetrics.transport import Transport
+from sabrmetrics.transport import build_response
+from sabrmetrics.transport import get_transport
+
+
+URL = f"{payloads.STATSAPI}/divisions/200"
+
+
+class ConditionalAdapter(payloads.FixtureAdapter):
+    """
+    Answers with a validator, and with ``304 Not Modified`` to requests that send it back.
+
+    :param validator: ``"ETag"`` or ``"Last-Modified"``
+
+    .. py:attribute:: conditions
+
+        Conditional request headers of every request received, in order.
+
+        :type: list[dict[str, str]]
+    """
+    values = {"ETag": "\"v1\"", "Last-Modified": "Sat, 01 Jul 2023 00:00:00 GMT"}
+    conditions_of = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+
+    def __init__(self, validator: str):
+        super().__init__()
+        self.validator = validator
+        self.conditions: typing.List[typing.Dict[str, str]] = []
+
+    def send(self, request: requests.PreparedRequest, **kwargs: typing.Any) -> requests.Response:
+        self.requests.append(request.url)
+        self.conditions.append(
+            {k: v for k, v in request.headers.items() if k.startswith("If-")}
+        )
+        value = self.values[self.validator]
+        if request.headers.get(self.conditions_of[self.validator]) == value:
+            response = build_response(b"", status_code=304, url=request.url)
+        else:
+            response = build_response(
+                payloads.route(request.url)[2], url=request.url, encoding="utf-8",
+                headers={"Content-Type": "application/json", self.validator: value}
+            )
+        response.request = request
+        return response
+
+
+def _entry(content: bytes) -> CacheEntry:
+    return CacheEntry(
+        url=URL, status_code=200, headers={}, content=content, encoding=None,
+        stored=time.time(), expires=None
+    )
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache_factory(request, tmp_path) -> typing.Callable[..., ResponseCache]:
+    """
+    :return: Builds a cache of the parametrized backend
+    """
+    if request.param == "memory":
+        return MemoryCache
+    return lambda **kwargs: SQLiteCache(str(tmp_path / "responses.sqlite"), **kwargs)
+
+
+class TestResponseCache:
+    """
+    """
+    def test_abstract(self):
+        with pytest.raises(TypeError):
+            ResponseCache()
+
+    def test_default_transport(self):
+        assert get_transport().cache is None
+
+    def test_zero_ttl(self):
+        cache = MemoryCache(ttls={payloads.TOOLS: 3600, payloads.STATSAPI: 0})
+        with Transport(cache=cache) as transport:
+            adapter = payloads.mount(transport)
+            for _ in range(2):
+                transport.get(payloads.TOOLS)
+                transport.get(f"{payloads.STATSAPI}/divisions/200")
+                transport.get(f"{payloads.STATSAPI}/league/103", immutable=True)
+
+        assert len(cache) == 2
+        assert len(adapter.requests) == 4
+
+    def test_refresh(self):
+        cache = MemoryCache()
+        with Transport(cache=cache) as transport:
+            adapter = payloads.mount(transport)
+            transport.get(payloads.TOOLS)
+            transport.get(payloads.TOOLS)
+            transport.get(payloads.TOOLS, refresh=True)
+
+        assert len(adapter.requests) == 2
+        assert cache.stats.hits == 1
+
+    def test_refresh_fresh_entry(self):
+        cache = MemoryCache(ttls={URL: 3600})
+        with Transport(cache=cache) as transport:
+            adapter = payloads.mount(transport)
+            first = transport.get(URL)
+            assert transport.get(URL).content == first.content
+            transport.get(URL, refresh=True)
+
+        assert len(adapter.requests) == 2
+
+
+class TestRevalidation:
+    """
+    """
+    @pytest.mark.parametrize("validator", ["ETag", "Last-Modified"])
+    def test_not_modified(self, validator):
+        cache = MemoryCache(ttls={URL: 0.05})
+        adapter = ConditionalAdapter(validator)
+        with Transport(cache=cache) as transport:
+            payloads.mount(transport, adapter)
+            content = transport.get(URL).content
+            stored = cache.get(cache.key(URL))
+            time.sleep(0.1)
+
+            response = transport.get(URL)
+            assert response.status_code == 200 and response.content == content
+            assert response.from_cache
+
+            refreshed = cache.get(cache.key(URL))
+            assert refreshed.stored > stored.stored and refreshed.fresh()
+            assert refreshed.content == content
+
+            transport.get(URL)
+
+        assert len(adapter.requests) == 2
+        assert adapter.conditions[0] == {}
+        assert adapter.conditions[1] == {
+            ConditionalAdapter.conditions_of[validator]: ConditionalAdapter.values[validator]
+        }
+        assert cache.stats.revalidations == 1
+        assert cache.stats.hits == 1
+
+    def test_refresh_revalidates(self):
+        cache = MemoryCache(ttls={URL: 3600})
+        adapter = ConditionalAdapter("ETag")
+        with Transport(cache=cache) as transport:
+            payloads.mount(transport, adapter)
+            content = transport.get(URL).content
+            assert transport.get(URL, refresh=True).content == content
+
+        assert len(adapter.requests) == 2
+        assert "If-None-Match" in adapter.conditions[1]
+        assert cache.stats.revalidations == 1
+
+
+class TestBackends:
+    """
+    """
+    def test_sqlite_persists(self, tmp_path):
+        path = str(tmp_path / "responses.sqlite")
+        cache = SQLiteCache(path, ttls={URL: 3600})
+        with Transport(cache=cache) as transport:
+            adapter = payloads.mount(transport)
+            content = transport.get(URL).content
+        cache.close()
+
+        cache = SQLiteCache(path, ttls={URL: 3600})
+        with Transport(cache=cache) as transport:
+            payloads.mount(transport, adapter)
+            response = transport.get(URL)
+        cache.close()
+
+        assert response.content == content and response.from_cache
+        assert len(adapter.requests) == 1
+
+    def test_lru_eviction(self, cache_factory):
+        cache = cache_factory(max_bytes=25)
+        for key in ("a", "b"):
+            cache.set(key, _entry(b"x" * 10))
+            time.sleep(0.01)
+        cache.get("a")
+        time.sleep(0.01)
+        cache.set("c", _entry(b"x" * 10))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+        assert cache.size == 20
+        assert cache.stats.evictions == 1
+
+    def test_oversized(self, cache_factory):
+        cache = cache_factory(max_bytes=5)
+        cache.set("a", _entry(b"x" * 10))
+        assert cache.get("a") is None
+        assert len(cache) == 0
@@ -0,0 +1,97 @@
+"""
+"""
+
+import datetime
+import json
+import typing
+
+import pandas as pd
+import pytest
+
+from sabrmetrics import decoding
+from sabrmetrics.decoding import LazyDocument
+from sabrmetrics.mlb.standings import Standings
+from sabrmetrics.tests import payloads
+
+
+PAYLOAD = json.dumps(payloads.standings(2023, datetime.date(2023, 7, 1))).encode()
+
+
+class TestLazyDocument:
+    """
+    """
+    @pytest.mark.parametrize("backend", [x for x in decoding.backends() if x != "simdjson"])
+    def test_decoded_once(self, monkeypatch, backend):
+        calls = []
+        loads = decoding._BACKENDS[backend]
+        monkeypatch.setitem(
+            decoding._BACKENDS, backend, lambda data: calls.append(data) or loads(data)
+        )
+        previous = decoding.set_backend(backend)
+        try:
+            document = LazyDocument(PAYLOAD)
+        finally:
+            decoding.set_backend(previous)
+
+        assert not calls
+        assert list(document) == list(json.loads(PAYLOAD))
+        assert document["records"] == json.loads(PAYLOAD)["records"]
+        assert document["records"] is document["records"]
+        assert len(calls) == 1
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            decoding.set_backend("ujson")
+
+
+class TestFallback:
+    """
+    """
+    @pytest.fixture(params=["simdjson", "orjson,simdjson"])
+    def missing(self, request, monkeypatch) -> typing.List[str]:
+        """
+        Rebuilds the backends as if the modules in the parameter were not installed.
+
+        :return: Names of the missing backends
+        """
+        missing = request.param.split(",")
+        for name in missing:
+            monkeypatch.setattr(decoding, name, None)
+        backends = decoding._backends()
+        monkeypatch.setattr(decoding, "_BACKENDS", backends)
+        monkeypatch.setattr(decoding, "_backend", next(iter(backends)))
+        return missing
+
+    def test_backends(self, missing):
+        assert not set(missing) & set(decoding.backends())
+        assert decoding.backends()[-1] == "json"
+        assert decoding.get_backend() == decoding.backends()[0]
+        with pytest.raises(ValueError):
+            decoding.set_backend("simdjson")
+
+    def test_decoding(self, missing):
+        assert decoding.loads(PAYLOAD) == json.loads(PAYLOAD)
+
+        document = LazyDocument(PAYLOAD)
+        assert list(document) == list(json.loads(PAYLOAD))
+        assert document["records"] == json.loads(PAYLOAD)["records"]
+        pd.testing.assert_frame_equal(
+            Standings.from_payload(PAYLOAD, lazy=True).standings(),
+            Standings.from_payload(PAYLOAD).standings()
+        )
+
+class TestLazyScraper:
+    """
+    """
+    def test_per_call(self):
+        lazy = Standings.from_payload(PAYLOAD, lazy=True)
+        eager = Standings.from_payload(PAYLOAD)
+
+        assert lazy.lazy and isinstance(lazy.data, LazyDocument)
+        assert not eager.lazy and isinstance(eager.data, dict)
+        pd.testing.assert_frame_equal(lazy.standings(), eager.standings())
+
+    def test_flight_key(self, adapter):
+        lazy = Standings(season=2023, date=datetime.datetime(2023, 7, 1), lazy=True)
+        eager = Standings(season=2023, date=datetime.datetime(2023, 7, 1))
+        assert isinstance(lazy.data, LazyDocument) and isinstance(eager.data, dict)
@@ -0,0 +1,72 @@
+"""
+"""
+
+import datetime
+import urllib.parse
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sabrmetrics.mlb import standings
+from sabrmetrics.mlb.history import StandingsHistory
+
+
+DATES = [datetime.datetime(2023, 7, d) for d in range(1, 6)]
+
+
+@pytest.fixture
+def history(adapter) -> StandingsHistory:
+    return StandingsHistory(2023, dates=DATES)
+
+
+class TestStandingsHistory:
+    """
+    """
+    def test_regular_season(self, adapter, history):
+        queries = [
+            urllib.parse.parse_qs(urllib.parse.urlsplit(x).query)
+            for x in adapter.requests if "/standings" in x
+        ]
+        assert len(queries) == len(DATES)
+        assert all(x["standingsTypes"] == ["regularSeason"] for x in queries)
+
+    def test_wild_card_games_back(self, history):
+        assert StandingsHistory._number("wildCardGamesBack", "+2.0") == -2.0
+        assert StandingsHistory._number("wildCardGamesBack", "1.5") == 1.5
+        assert (history.metric("wildCardGamesBack").to_numpy() < 0).any()
+
+    @pytest.mark.parametrize("window", [0, -1])
+    def test_rolling_window(self, history, window):
+        with pytest.raises(ValueError):
+            history.rolling_win_pct(window)
+
+    def test_rolling(self, history):
+        rolling = history.rolling_win_pct(1)
+        assert rolling.iloc[0].isna().all()
+        assert np.isfinite(rolling.iloc[1:].to_numpy()).any()
+
+    def test_future_dates(self, adapter):
+        future = datetime.datetime.today() + datetime.timedelta(days=400)
+        history = StandingsHistory(2023, dates=[*DATES, future])
+        assert list(history.dates) == DATES
+        assert sum("/standings" in x for x in adapter.requests) == len(DATES)
+
+    def test_default_season(self, adapter):
+        history = StandingsHistory(dates=DATES)
+        assert history.season == standings.Address.field_defaults["season"].resolve()
+
+    def test_playoff_line(self):
+        # Three divisions of two teams, whose third division leader is the weakest team but one
+        history = StandingsHistory.__new__(StandingsHistory)
+        history._dates = pd.DatetimeIndex(DATES[:1])
+        history._teams = pd.DataFrame({
+            "id": range(1, 7), "name": list("ABCDEF"), "league": [103] * 6,
+            "division": [201, 201, 202, 202, 203, 203],
+        })
+        history._cube = np.full((1, 6, len(StandingsHistory.metrics)), np.nan, np.float32)
+        history._cube[0, :, 0] = [70, 65, 60, 55, 30, 20]
+        history._cube[0, :, 1] = [30, 35, 40, 45, 70, 80]
+
+        distance = history.playoff_line_distance(spots=4).iloc[0]
+        assert distance.to_dict() == {1: -5.0, 2: 0.0, 3: 5.0, 4: 10.0, 5: 35.0, 6: 45.0}
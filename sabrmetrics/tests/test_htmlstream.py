@@ -0,0 +1,58 @@
+"""
+"""
+
+import io
+
+import pandas as pd
+import pytest
+
+from sabrmetrics.htmlstream import iter_table_rows
+from sabrmetrics.sfbb import PlayerIDMap
+from sabrmetrics.tests import payloads
+
+
+SPANNED = (
+    b"<html><body><table id=\"data\">"
+    b"<thead><tr><th>a</th><th colspan=\"2\">b</th></tr></thead>"
+    b"<tr><td rowspan=\"2\">1</td><td>2</td><td>3</td></tr>"
+    b"<tr><td colspan=\"2\" rowspan=\"2\">4</td></tr>"
+    b"<tr><td>5</td></tr>"
+    b"<tr><td>6</td><td>7</td><td rowspan=\"0\">8</td></tr>"
+    b"</table></body></html>"
+)
+
+
+class TestTableRows:
+    """
+    """
+    @pytest.mark.parametrize("tbody", [True, False], ids=["tbody", "implied"])
+    def test_implied_tbody(self, tbody):
+        document = payloads.playeridmap_html(50, tbody=tbody)
+        rows = list(iter_table_rows([document], PlayerIDMap.webview_selector, head=False))
+
+        assert len(rows) == 52
+        assert rows[0][:3] == ["1", "IDPLAYER", "PLAYERNAME"]
+        assert rows == list(iter_table_rows(
+            [payloads.playeridmap_html(50)], PlayerIDMap.webview_selector, head=False
+        ))
+
+    def test_head(self):
+        document = payloads.playeridmap_html(50, tbody=False)
+        rows = list(iter_table_rows([document], PlayerIDMap.webview_selector))
+        assert len(rows) == 53
+        assert rows[0][:2] == ["", "C0"]
+
+    def test_spans(self):
+        rows = list(iter_table_rows([SPANNED], "table#data tr"))
+        assert rows == [
+            ["a", "b", "b"],
+            ["1", "2", "3"],
+            ["1", "4", "4"],
+            ["5", "4", "4"],
+            ["6", "7", "8"],
+        ]
+
+    def test_spans_read_html(self):
+        rows = list(iter_table_rows([SPANNED], "table#data tr", head=False))
+        expected = pd.read_html(io.BytesIO(SPANNED), header=0)[0].astype(str)
+        assert rows == expected.values.tolist()
@@ -0,0 +1,34 @@
+"""
+"""
+
+import subprocess
+import sys
+import textwrap
+
+
+def test_import_without_network():
+    """
+    Importing the package, and every module of it, makes no request.
+    """
+    script = textwrap.dedent("""
+        import socket
+
+        def blocked(*args, **kwargs):
+            raise RuntimeError("network access during import")
+
+        socket.socket.connect = blocked
+        socket.socket.connect_ex = blocked
+        socket.create_connection = blocked
+        socket.getaddrinfo = blocked
+
+        import pkgutil
+        import sabrmetrics
+
+        for module in pkgutil.walk_packages(sabrmetrics.__path__, "sabrmetrics."):
+            if not module.name.startswith("sabrmetrics.tests"):
+                __import__(module.name)
+    """)
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr
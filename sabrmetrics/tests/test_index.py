@@ -0,0 +1,26 @@
+"""
+"""
+
+import os
+
+import pytest
+
+from sabrmetrics.sfbb import PlayerIDIndex
+
+
+@pytest.fixture
+def index() -> PlayerIDIndex:
+    return PlayerIDIndex({"PlayerID": ["a", "b", ""], "MLBID": ["1", "", "3"]})
+
+
+class TestPlayerIDIndex:
+    """
+    """
+    @pytest.mark.parametrize("name", ["index", "index.npz", "index.bin"])
+    def test_save_load(self, tmp_path, index, name):
+        path = str(tmp_path / name)
+        index.save(path)
+
+        assert os.listdir(tmp_path) == [name]
+        loaded = PlayerIDIndex.load(path)
+        assert list(loaded.translate(["1", "3"], "MLB", "SFBB")) == ["a", None]
@@ -0,0 +1,66 @@
+"""
+"""
+
+import asyncio
+import datetime
+import threading
+import time
+
+from sabrmetrics.instrumentation import get_instrument
+from sabrmetrics.instrumentation import in_context
+from sabrmetrics.instrumentation import profile
+from sabrmetrics.mlb import gather_standings
+
+
+class TestSpans:
+    """
+    """
+    def test_exclusive_time(self):
+        with profile() as report:
+            with get_instrument().span("outer"):
+                time.sleep(0.05)
+                with get_instrument().span("inner"):
+                    time.sleep(0.1)
+
+        summary = report.summary()
+        assert 0.05 <= summary["outer_seconds"][1] < 0.1
+        assert summary["inner_seconds"][1] >= 0.1
+
+
+class TestProfile:
+    """
+    """
+    def test_concurrent_blocks(self):
+        entered, counted = threading.Barrier(2), threading.Barrier(2)
+        reports = {}
+
+        def run(name):
+            with profile() as report:
+                entered.wait(5)
+                get_instrument().count(name)
+                counted.wait(5)
+            reports[name] = report
+
+        threads = [threading.Thread(target=run, args=(x,)) for x in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert [x[0] for x in reports["a"].events] == ["a"]
+        assert [x[0] for x in reports["b"].events] == ["b"]
+        assert not get_instrument().enabled
+
+    def test_in_context(self):
+        with profile() as report:
+            thread = threading.Thread(target=in_context(get_instrument().count, "worker"))
+            thread.start()
+            thread.join()
+        assert [x[0] for x in report.events] == ["worker"]
+
+    def test_gather_standings(self, adapter):
+        with profile() as report:
+            asyncio.run(gather_standings(dates=[datetime.datetime(2023, 7, 1)]))
+        summary = report.summary()
+        assert summary["headers_seconds"][0] == 1
+        assert "connect_seconds" not in summary
@@ -0,0 +1,87 @@
+"""
+"""
+
+import datetime
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sabrmetrics.mlb import leagues
+from sabrmetrics.mlb.leagues import SeasonCalendar
+from sabrmetrics.mlb.leagues import classify_dates
+
+
+DATES = ["2022-12-15", "2023-03-01", "2023-05-01", "2023-08-01", "2023-10-15", "2023-12-01"]
+EXPECTED = ["offseason", "spring", "first-half", "second-half", "postseason", "offseason"]
+
+
+@pytest.fixture
+def calendars(adapter):
+    leagues._calendars.clear()
+    yield adapter
+    leagues._calendars.clear()
+
+
+class TestClassifyDates:
+    """
+    """
+    @pytest.mark.parametrize("dates", [
+        pd.Series(pd.to_datetime(DATES)),
+        pd.Series(pd.to_datetime(DATES)).dt.tz_localize("UTC"),
+        pd.Series(pd.to_datetime(DATES)).dt.tz_localize("US/Pacific"),
+        [f"{x}T12:00:00Z" for x in DATES],
+        np.array(DATES, dtype="datetime64[D]"),
+    ], ids=["naive", "utc", "pacific", "iso-z", "numpy"])
+    def test_inputs(self, calendars, dates):
+        labels = classify_dates(dates)
+        assert list(labels.astype(str) if isinstance(labels, pd.Series) else labels) == EXPECTED
+
+    def test_tz_converted_to_utc(self, calendars):
+        dates = pd.Series(pd.to_datetime(["2023-03-29 20:00"])).dt.tz_localize("US/Pacific")
+        assert list(classify_dates(dates, ["regular-season"]).isna()) == [False]
+
+    def test_outside_spans(self, calendars):
+        dates = pd.Series(pd.to_datetime(["2023-01-15", None, "2023-05-01"]))
+        labels = classify_dates(dates, ["regular-season"])
+        assert list(labels.isna()) == [True, True, False]
+
+    def test_calendar_reused(self, calendars):
+        classify_dates(DATES)
+        requests = len(calendars.requests)
+        assert requests == 3
+
+        classify_dates(["2023-06-01", "2022-12-01"])
+        classify_dates(pd.Series(pd.to_datetime(DATES)).dt.tz_localize("UTC"))
+        assert len(calendars.requests) == requests
+        assert len(leagues._calendars) == 1
+
+        classify_dates(DATES, league=leagues.NationalLeague)
+        assert len(calendars.requests) == requests + 3
+
+    def test_given_calendar(self, calendars):
+        calendar = SeasonCalendar([2022, 2023])
+        requests = len(calendars.requests)
+        assert list(classify_dates(DATES, calendar=calendar)) == EXPECTED
+        assert len(calendars.requests) == requests
+        assert not leagues._calendars
+
+
+class TestSeason:
+    """
+    """
+    def test_latest_at_call_time(self, adapter, monkeypatch):
+        class Clock(datetime.datetime):
+            now = datetime.datetime(2023, 7, 1)
+
+            @classmethod
+            def today(cls):
+                return cls.now
+
+        monkeypatch.setattr(leagues, "datetime", types.SimpleNamespace(datetime=Clock))
+        assert leagues.Season.latest_year() == 2023
+
+        Clock.now = datetime.datetime(2024, 7, 1)
+        assert leagues.Season.latest_year() == 2024
+        assert leagues.Season.latest_date() == Clock.now
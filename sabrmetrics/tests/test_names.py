@@ -0,0 +1,34 @@
+"""
+"""
+
+import pandas as pd
+import pytest
+
+from sabrmetrics.sfbb import NameResolver
+from sabrmetrics.sfbb import PlayerIDMap
+from sabrmetrics.tests import payloads
+
+
+@pytest.fixture(scope="module")
+def playeridmap() -> pd.DataFrame:
+    return PlayerIDMap.read_csv(payloads.playeridmap_csv(2000))
+
+
+class TestNameResolver:
+    """
+    """
+    def test_exact(self, playeridmap):
+        resolved = NameResolver(playeridmap).resolve(playeridmap.loc[:50, "LastFirst"])
+        assert resolved.loc[:, "Score"].eq(1.0).all()
+
+    def test_typos(self, playeridmap):
+        df = pd.DataFrame({
+            "PlayerID": ["a", "b", "c"],
+            "Name": ["Jonathan Smithson", "Mike Trout", "Mookie Betts"],
+            "Team": ["NYY", "LAA", "LAD"], "Birthdate": [None] * 3,
+            "AllPositions": [["C"], ["CF"], ["RF"]], "Position": ["C", "CF", "RF"],
+        })
+        resolved = NameResolver(df).resolve(
+            ["Jonathon Smithsen", "Mkie Trout", "Moky Bets", "Nobody Atall"], threshold=0.7
+        )
+        assert resolved.loc[:, "PlayerID"].tolist() == ["a", "b", "c", None]
@@ -0,0 +1,71 @@
+"""
+"""
+
+import concurrent.futures
+import datetime
+
+import pytest
+import requests
+
+from sabrmetrics.cache import MemoryCache
+from sabrmetrics.mlb.poller import StandingsPoller
+from sabrmetrics.tests import payloads
+from sabrmetrics.transport import Transport
+from sabrmetrics.transport import get_transport
+from sabrmetrics.transport import set_transport
+
+
+NOW = datetime.datetime(2023, 7, 1, 15, 30)
+
+
+class TestStandingsPoller:
+    """
+    """
+    def test_calendar_once_per_day(self, adapter):
+        poller = StandingsPoller()
+        poller.poll(NOW)
+        leagues = sum("/league/" in x for x in adapter.requests)
+
+        for minutes in range(5):
+            poller.poll(NOW + datetime.timedelta(minutes=minutes))
+            assert poller.interval(NOW + datetime.timedelta(minutes=minutes)) == 60
+        assert sum("/league/" in x for x in adapter.requests) == leagues
+
+        assert poller.interval(datetime.datetime(2023, 12, 1)) == 6 * 3600
+        assert sum("/league/" in x for x in adapter.requests) > leagues
+
+    def test_concurrent_polls(self, adapter):
+        poller = StandingsPoller()
+        poller.poll(NOW)
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            list(executor.map(lambda _: poller.poll(NOW), range(64)))
+
+        stats = poller.stats
+        assert stats["polls"] == 65
+        assert stats["unchanged"] == 64
+        assert stats["parsed"] == 1
+
+    def test_revalidates_cached_response(self):
+        cache = MemoryCache(ttls={f"{payloads.STATSAPI}/standings": 3600})
+        with Transport(cache=cache) as transport:
+            adapter = payloads.mount(transport)
+            previous = set_transport(transport)
+            try:
+                poller = StandingsPoller()
+                for _ in range(3):
+                    poller.poll(NOW)
+            finally:
+                set_transport(previous)
+
+        assert sum("/standings" in x for x in adapter.requests) == 3
+        assert poller.stats == {"polls": 3, "unchanged": 2, "parsed": 1}
+
+    def test_error_response(self, adapter):
+        def router(url):
+            if "/standings" in url:
+                return 503, {}, b""
+            return payloads.route(url)
+
+        payloads.mount(get_transport(), payloads.FixtureAdapter(router))
+        with pytest.raises(requests.HTTPError):
+            StandingsPoller().poll(NOW)
@@ -0,0 +1,36 @@
+"""
+"""
+
+import pandas as pd
+import pytest
+
+from sabrmetrics import snapshot
+from sabrmetrics.sfbb import PlayerIDMap
+from sabrmetrics.tests import payloads
+
+pa = pytest.importorskip("pyarrow")
+
+
+class TestFlatten:
+    """
+    """
+    def test_lists(self):
+        df = pd.DataFrame({
+            "positions": [["C", "1B"], None, ("SS",)], "mixed": [1, "a", None]
+        })
+        table = snapshot.to_arrow(df)
+
+        assert table.schema.field("positions").type == pa.list_(pa.string())
+        assert table.column("positions").to_pylist() == [["C", "1B"], None, ["SS"]]
+        assert table.schema.field("mixed").type == pa.string()
+
+    @pytest.mark.parametrize("extension", [".parquet", ".feather"])
+    @pytest.mark.filterwarnings("ignore:Mismatched null-like values")
+    def test_playeridmap(self, tmp_path, extension):
+        df = PlayerIDMap.read_csv(payloads.playeridmap_csv(200))
+        path = tmp_path / f"playeridmap{extension}"
+        snapshot.to_parquet(df, path) if extension == ".parquet" else snapshot.to_feather(df, path)
+
+        loaded = snapshot.read_snapshot(path, as_pandas=True)
+        assert loaded.loc[:, "AllPositions"].tolist() == df.loc[:, "AllPositions"].tolist()
+        pd.testing.assert_frame_equal(loaded, df)
@@ -0,0 +1,233 @@
+"""
+"""
+
+import asyncio
+import datetime
+import json
+import threading
+import time
+import urllib.parse
+
+import pandas as pd
+import pytest
+
+from sabrmetrics.mlb.standings import Standings
+from sabrmetrics.mlb.standings import gather_standings
+from sabrmetrics.mlb.standings import projection
+from sabrmetrics.tests import payloads
+
+
+def _dates(urls):
+    return {
+        urllib.parse.parse_qs(urllib.parse.urlsplit(x).query)["date"][0]
+        for x in urls if "/standings" in x
+    }
+
+
+class TestGatherStandings:
+    """
+    """
+    def test_dates(self, adapter):
+        dates = [datetime.datetime(2023, 7, 1), datetime.datetime(2023, 10, 10)]
+        results = asyncio.run(gather_standings(dates=dates))
+
+        assert set(results) == {(2023, x) for x in dates}
+        assert all(len(x.standings()) == 30 for x in results.values())
+        assert _dates(adapter.requests) == {"2023-07-01", "2023-10-10"}
+        assert not any("/league/" in x for x in adapter.requests)
+
+    def test_failure_does_not_block(self, monkeypatch):
+        release = threading.Event()
+
+        def from_address(address, **kwargs):
+            if address.fields["season"] == 2000:
+                raise RuntimeError("failed")
+            release.wait(10)
+
+        monkeypatch.setattr(Standings, "from_address", from_address)
+
+        async def gather():
+            start = time.monotonic()
+            with pytest.raises(RuntimeError):
+                await gather_standings(
+                    seasons=[2000, 2001, 2002], dates=[datetime.datetime(2000, 7, 1)]
+                )
+            elapsed = time.monotonic() - start
+            release.set()
+            return elapsed
+
+        assert asyncio.run(gather()) < 5
+
+
+def _baseline_flat_record(records, key):
+    """
+    Flat records as built before the single-pass flattening.
+    """
+    series = []
+    for record in records:
+        dataframe = pd.DataFrame(record[key])
+        dataframe.rename(index=dataframe.loc[:, "type"], inplace=True)
+        dataframe.drop(columns=["type"], inplace=True)
+        series.append(dataframe.stack())
+    return pd.DataFrame(series)
+
+
+def _baseline_nested_record(records, key, inner_key):
+    """
+    Nested records as built before the single-pass flattening.
+    """
+    series = []
+    for record in records:
+        dataframe = pd.DataFrame(record[key])
+        nested_df = pd.DataFrame(list(dataframe.loc[:, inner_key]))
+        nested_df.columns = pd.MultiIndex.from_product([[inner_key], nested_df.columns])
+        series.append(pd.concat([dataframe.iloc[:, :-1], nested_df], axis=1).stack())
+    return pd.DataFrame(series)
+
+
+@pytest.fixture
+def records():
+    """
+    Records of each team, with the nested object of each entry last (as in the statsapi), a
+    ``null`` value, and a column that is ``null`` for every team.
+    """
+    document = payloads.standings(2023, datetime.date(2023, 7, 1))
+    records = [x["records"] for r in document["records"] for x in r["teamRecords"]]
+    for record in records:
+        for key, inner_key in (("divisionRecords", "division"), ("leagueRecords", "league")):
+            record[key] = [
+                {**{k: v for k, v in x.items() if k != inner_key}, inner_key: x[inner_key]}
+                for x in record[key]
+            ]
+        for entry in record["splitRecords"]:
+            entry["ties"] = None
+    records[0]["splitRecords"][0]["pct"] = None
+    records[1]["leagueRecords"][0]["pct"] = None
+    return records
+
+
+class TestRecordFrames:
+    """
+    """
+    @pytest.mark.parametrize("key", ["splitRecords", "overallRecords", "expectedRecords"])
+    @pytest.mark.filterwarnings("ignore::FutureWarning")
+    def test_flat(self, records, key):
+        frame = Standings.__new__(Standings)._flat_record(records, key)
+        pd.testing.assert_frame_equal(
+            frame, _baseline_flat_record(records, key), check_like=True, check_dtype=False
+        )
+
+    @pytest.mark.parametrize(
+        "key, inner_key", [("divisionRecords", "division"), ("leagueRecords", "league")]
+    )
+    @pytest.mark.filterwarnings("ignore::FutureWarning")
+    def test_nested(self, records, key, inner_key):
+        frame = Standings.__new__(Standings)._nested_record(records, key, inner_key)
+        pd.testing.assert_frame_equal(
+            frame, _baseline_nested_record(records, key, inner_key), check_like=True,
+            check_dtype=False
+        )
+
+
+@pytest.fixture
+def standings():
+    payload = json.dumps(payloads.standings(2023, datetime.date(2023, 7, 1))).encode()
+    return Standings.from_payload(payload)
+
+
+class TestViews:
+    """
+    """
+    @pytest.mark.parametrize("name", Standings.views)
+    def test_copy(self, standings, name):
+        view = getattr(standings, name)
+        view.iloc[:, 0] = None
+        view["added"] = 1
+        assert "added" not in getattr(standings, name).columns
+        assert getattr(standings, name).iloc[:, 0].notna().any()
+
+    def test_concurrent_views(self, standings):
+        started, release = threading.Event(), threading.Event()
+
+        def build():
+            started.set()
+            release.wait(10)
+            return pd.DataFrame()
+
+        thread = threading.Thread(target=standings._view, args=("blocked", build))
+        thread.start()
+        assert started.wait(5)
+
+        done = threading.Event()
+        other = threading.Thread(target=lambda: (standings.split_records, done.set()))
+        other.start()
+        try:
+            assert done.wait(5)
+        finally:
+            release.set()
+            thread.join()
+            other.join()
+
+    def test_single_build(self, standings):
+        calls = []
+
+        def build():
+            calls.append(None)
+            time.sleep(0.05)
+            return pd.DataFrame()
+
+        threads = [
+            threading.Thread(target=standings._view, args=("shared", build)) for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(calls) == 1
+
+
+class TestProjection:
+    """
+    """
+    def test_node_names(self):
+        fields, hydrate = projection([("home", "wins"), (0, ("division", "name"))])
+        assert {
+            "records", "teamRecords", "team", "id", "name", "splitRecords", "overallRecords",
+            "type", "wins", "divisionRecords", "division",
+        } == set(fields)
+        assert not any("." in x for x in fields)
+        assert not hydrate
+
+    @pytest.mark.parametrize("label", [
+        ("unknown", "wins"), ("home",), ("standard", "wins", "losses"), (0, ("league",)), 5
+    ])
+    def test_unknown(self, label):
+        with pytest.raises(ValueError):
+            projection([label])
+
+    @pytest.mark.parametrize("advanced", ["split", "division", "overall", "league", "expected"])
+    def test_columns(self, adapter, advanced):
+        full = Standings(season=2023, date=datetime.datetime(2023, 7, 1)).standings(
+            advanced=advanced
+        )
+        columns = [x for x in full.columns if x[0] != "team"]
+        trimmed = Standings(
+            season=2023, date=datetime.datetime(2023, 7, 1), columns=columns
+        ).standings(advanced=advanced)
+
+        assert set(columns) | {("team", "id"), ("team", "name")} <= set(trimmed.columns)
+        pd.testing.assert_frame_equal(trimmed, full.loc[:, trimmed.columns])
+
+    def test_unrequested(self, adapter):
+        standings = Standings(
+            season=2023, date=datetime.datetime(2023, 7, 1), columns=[("home", "wins")]
+        )
+        assert list(standings.split_records.loc[:, "home"].columns) == ["wins"]
+        for name in ("streak", "league_record", "division_records", "expected_records"):
+            with pytest.raises(KeyError):
+                getattr(standings, name)
+        with pytest.raises(KeyError):
+            standings.standings(advanced="league")
+        assert list(standings.standings().columns) == [
+            ("team", "id"), ("team", "name"), ("standard", "wins")
+        ]
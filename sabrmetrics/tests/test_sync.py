@@ -0,0 +1,62 @@
+"""
+"""
+
+import pandas as pd
+import pytest
+
+from sabrmetrics.sfbb import PlayerIDMap
+from sabrmetrics.sfbb import PlayerIDMapSync
+from sabrmetrics.tests import payloads
+
+pytest.importorskip("pyarrow")
+
+
+class TestPlayerIDMapSync:
+    """
+    """
+    def test_same_date_entry(self, tmp_path, adapter, monkeypatch):
+        changelog = PlayerIDMap().changelog()
+        monkeypatch.setattr(PlayerIDMap, "changelog", lambda self, **kwargs: changelog.copy())
+
+        sync = PlayerIDMapSync(str(tmp_path))
+        assert len(sync.sync().added) == len(sync.snapshot)
+
+        adapter.requests.clear()
+        assert sync.sync().empty
+        assert payloads.HYPERLINKS[2] not in adapter.requests
+
+        entry = pd.DataFrame({"Date": [changelog["Date"].max()], "Description": ["Edited"]})
+        changelog = pd.concat([changelog, entry], ignore_index=True)
+        sync.sync()
+        assert payloads.HYPERLINKS[2] in adapter.requests
+
+    def test_snapshot_roundtrip(self, tmp_path, adapter):
+        PlayerIDMapSync(str(tmp_path)).sync()
+
+        sync = PlayerIDMapSync(str(tmp_path))
+        assert sync.snapshot.loc[:, "AllPositions"].map(type).eq(list).all()
+        assert sync.sync(force=True).empty
+
+    def test_patch(self, tmp_path, adapter, monkeypatch):
+        sync = PlayerIDMapSync(str(tmp_path))
+        sync.sync()
+        previous = sync.snapshot
+
+        current = previous.iloc[1:].reset_index(drop=True)
+        current.loc[0, "MLBID"] = 999999
+        added = previous.iloc[:1].assign(PlayerID="newplayer", MLBID=888888)
+        current = pd.concat([current, added], ignore_index=True)
+        monkeypatch.setattr(PlayerIDMap, "playeridmap", lambda self, **kwargs: current.copy())
+
+        diff = sync.sync(force=True)
+        assert (len(diff.added), len(diff.removed), len(diff.changed)) == (1, 1, 1)
+
+        for reloaded in (sync, PlayerIDMapSync(str(tmp_path))):
+            assert PlayerIDMapSync.diff(current, reloaded.snapshot).empty
+            assert reloaded.snapshot.dtypes.equals(current.dtypes)
+            assert list(reloaded.snapshot.loc[:, "PlayerID"]) == list(current.loc[:, "PlayerID"])
+            assert reloaded.index.lookup(previous.loc[0, "PlayerID"], "SFBB") is None
+            assert reloaded.index.lookup("newplayer", "SFBB")["MLBID"] == "888888"
+            assert list(reloaded.index.translate(["999999"], "MLB", "SFBB")) == [
+                current.loc[0, "PlayerID"]
+            ]
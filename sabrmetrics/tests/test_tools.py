@@ -0,0 +1,93 @@
+"""
+"""
+
+import typing
+
+import pytest
+import requests
+
+from sabrmetrics.cache import MemoryCache
+from sabrmetrics.sfbb import PlayerIDMap
+from sabrmetrics.tests import payloads
+from sabrmetrics.transport import Transport
+from sabrmetrics.transport import set_transport
+
+
+@pytest.fixture
+def tools() -> typing.Iterator[typing.List[typing.Tuple[int, bytes]]]:
+    """
+    Answers the requests for the Tools page with the queued responses first, over a transport
+    with a response cache.
+
+    :return: Queue of status codes and bodies of the next responses for the Tools page
+    """
+    queue: typing.List[typing.Tuple[int, bytes]] = []
+
+    def router(url: str) -> typing.Tuple[int, typing.Dict[str, str], bytes]:
+        if url == payloads.TOOLS and queue:
+            status_code, content = queue.pop(0)
+            return status_code, {"Content-Type": "text/html; charset=UTF-8"}, content
+        return payloads.route(url)
+
+    PlayerIDMap._hyperlinks_cache.clear()
+    with Transport(cache=MemoryCache(ttls={payloads.TOOLS: 3600})) as transport:
+        payloads.mount(transport, payloads.FixtureAdapter(router))
+        previous = set_transport(transport)
+        try:
+            yield queue
+        finally:
+            set_transport(previous)
+            PlayerIDMap._hyperlinks_cache.clear()
+
+
+class TestHyperlinks:
+    """
+    """
+    def test_copy(self, adapter):
+        PlayerIDMap.hyperlinks().clear()
+        assert PlayerIDMap.hyperlinks() == payloads.HYPERLINKS
+        assert adapter.requests == [payloads.TOOLS]
+
+    def test_refresh(self, tools):
+        assert PlayerIDMap.hyperlinks() == payloads.HYPERLINKS
+
+        tools.append((200, payloads.tools_html().replace(b"playeridmap", b"idmap")))
+        assert PlayerIDMap.hyperlinks() == payloads.HYPERLINKS
+        assert PlayerIDMap.hyperlinks(refresh=True)[0].endswith("/idmap/export?format=xlsx")
+        assert not tools
+
+    def test_error(self, tools):
+        tools.append((503, b"Service Unavailable"))
+        with pytest.raises(requests.HTTPError):
+            PlayerIDMap.hyperlinks()
+        assert PlayerIDMap.hyperlinks() == payloads.HYPERLINKS
+
+    def test_empty(self, tools):
+        tools.append((200, b"<html><body><div id=\"content\"></div></body></html>"))
+        with pytest.raises(ValueError):
+            PlayerIDMap.hyperlinks()
+        assert PlayerIDMap.hyperlinks() == payloads.HYPERLINKS
+
+
+class TestFallback:
+    """
+    """
+    @pytest.mark.parametrize("error", [KeyError, IndexError, ValueError])
+    def test_playeridmap(self, adapter, monkeypatch, error):
+        def fail(self):
+            raise error("failed")
+
+        monkeypatch.setattr(PlayerIDMap, "_playeridmap_csv", fail)
+        with pytest.warns(UserWarning, match="web view"):
+            df = PlayerIDMap().playeridmap()
+        assert list(df.columns) == PlayerIDMap.playeridmap_columns
+
+    @pytest.mark.parametrize("error", [KeyError, IndexError, ValueError])
+    def test_changelog(self, adapter, monkeypatch, error):
+        def fail(self):
+            raise error("failed")
+
+        monkeypatch.setattr(PlayerIDMap, "_changelog_csv", fail)
+        with pytest.warns(UserWarning, match="web view"):
+            df = PlayerIDMap().changelog()
+        assert list(df.columns) == PlayerIDMap.changelog_columns
@@ -0,0 +1,229 @@
+"""
+"""
+
+import asyncio
+import io
+import threading
+import time
+import zipfile
+
+import pandas as pd
+import pytest
+import requests
+
+from sabrmetrics.instrumentation import profile
+from sabrmetrics.mlb import divisions
+from sabrmetrics.mlb.scraper import Scraper
+from sabrmetrics.tests import payloads
+from sabrmetrics.transport import RecordingTransport
+from sabrmetrics.transport import ReplayTransport
+from sabrmetrics.transport import ResponseStream
+from sabrmetrics.transport import SingleFlight
+from sabrmetrics.transport import Transport
+from sabrmetrics.transport import set_transport
+
+
+class TestRecordReplay:
+    """
+    """
+    def test_streamed(self, tmp_path):
+        archive = str(tmp_path / "responses.zip")
+        url = payloads.HYPERLINKS[2]
+
+        with RecordingTransport(archive) as transport:
+            payloads.mount(transport)
+            with transport.get(url, stream=True) as response:
+                content = b"".join(response.iter_content(1024))
+
+        with zipfile.ZipFile(archive) as file:
+            assert len(file.namelist()) == 2
+
+        with ReplayTransport(archive) as transport:
+            assert transport.get(url).content == content == payloads.playeridmap_csv()
+
+    def test_partially_read(self, tmp_path):
+        archive = str(tmp_path / "responses.zip")
+
+        with RecordingTransport(archive) as transport:
+            payloads.mount(transport)
+            with transport.get(payloads.HYPERLINKS[2], stream=True) as response:
+                next(response.iter_content(1024))
+
+        with ReplayTransport(archive) as transport:
+            with pytest.raises(requests.ConnectionError):
+                transport.get(payloads.HYPERLINKS[2])
+
+    def test_replay_instrumentation(self, tmp_path):
+        archive = str(tmp_path / "responses.zip")
+        with RecordingTransport(archive) as transport:
+            payloads.mount(transport)
+            transport.get(payloads.TOOLS)
+
+        with ReplayTransport(archive) as transport, profile() as report:
+            transport.get(payloads.TOOLS)
+
+        summary = report.summary()
+        assert summary["response_bytes"] == (1, len(payloads.tools_html()))
+        assert summary["download_seconds"][0] == 1
+
+
+class TestHostLimits:
+    """
+    """
+    def test_streamed_body_holds_slot(self):
+        host = "docs.google.com"
+        with Transport(host_limits={host: 1}) as transport:
+            payloads.mount(transport)
+            response = transport.get(payloads.HYPERLINKS[2], stream=True)
+
+            done = threading.Event()
+            thread = threading.Thread(
+                target=lambda: (transport.get(payloads.HYPERLINKS[4]), done.set())
+            )
+            thread.start()
+            assert not done.wait(0.2)
+
+            pd.read_csv(io.BufferedReader(ResponseStream(response)))
+            assert done.wait(5)
+            thread.join()
+
+    def test_closed_response_releases_slot(self):
+        with Transport(host_limits={"docs.google.com": 1}) as transport:
+            payloads.mount(transport)
+            for _ in range(3):
+                with transport.get(payloads.HYPERLINKS[2], stream=True) as response:
+                    next(response.iter_content(1024))
+
+
+def _concurrently(count, function):
+    """
+    Calls ``function`` on ``count`` threads at once.
+
+    :return: Result (or exception) of each call
+    """
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def call(i):
+        barrier.wait()
+        try:
+            results[i] = function()
+        except Exception as error:
+            results[i] = error
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlight:
+    """
+    """
+    def test_shared_result(self):
+        flight, calls = SingleFlight(), []
+
+        def function():
+            calls.append(None)
+            time.sleep(0.2)
+            return object()
+
+        results = _concurrently(8, lambda: flight.do("key", function))
+        assert len(calls) == 1
+        assert all(x is results[0] for x in results)
+        assert flight.stats == {"calls": 8, "deduplicated": 7}
+        assert not flight._calls
+
+    def test_shared_error(self):
+        flight, calls = SingleFlight(), []
+
+        def function():
+            calls.append(None)
+            time.sleep(0.2)
+            raise ValueError("failed")
+
+        results = _concurrently(8, lambda: flight.do("key", function))
+        assert len(calls) == 1
+        assert all(isinstance(x, ValueError) and x is results[0] for x in results)
+        assert not flight._calls
+
+        assert flight.do("key", lambda: 1) == 1
+        assert flight.stats == {"calls": 9, "deduplicated": 7}
+
+    def test_distinct_keys(self):
+        flight = SingleFlight()
+        results = _concurrently(4, lambda: flight.do(threading.get_ident(), time.time))
+        assert len(set(results)) == 4
+        assert flight.stats["deduplicated"] == 0
+
+    def test_async(self):
+        flight, calls = SingleFlight(), []
+
+        async def function():
+            calls.append(None)
+            await asyncio.sleep(0.1)
+            return object()
+
+        async def gather():
+            return await asyncio.gather(*(flight.do_async("key", function) for _ in range(8)))
+
+        results = asyncio.run(gather())
+        assert len(calls) == 1
+        assert all(x is results[0] for x in results)
+        assert flight.stats == {"calls": 8, "deduplicated": 7}
+        assert not flight._futures
+
+    def test_async_error(self):
+        flight = SingleFlight()
+
+        async def function():
+            await asyncio.sleep(0.1)
+            raise ValueError("failed")
+
+        async def gather():
+            return await asyncio.gather(
+                *(flight.do_async("key", function) for _ in range(4)), return_exceptions=True
+            )
+
+        results = asyncio.run(gather())
+        assert all(isinstance(x, ValueError) for x in results)
+        assert not flight._futures
+        assert asyncio.run(flight.do_async("key", lambda: asyncio.sleep(0, 1))) == 1
+
+    def test_async_cancelled_waiter(self):
+        flight = SingleFlight()
+
+        async def function():
+            await asyncio.sleep(0.1)
+            return 1
+
+        async def run():
+            leader = asyncio.ensure_future(flight.do_async("key", function))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(flight.do_async("key", function))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            return await leader
+
+        assert asyncio.run(run()) == 1
+
+    def test_scrapers(self, monkeypatch):
+        monkeypatch.setattr(Scraper, "flight", SingleFlight())
+
+        def router(url):
+            time.sleep(0.2)
+            return payloads.route(url)
+
+        with Transport() as transport:
+            adapter = payloads.mount(transport, payloads.FixtureAdapter(router))
+            previous = set_transport(transport)
+            try:
+                results = _concurrently(8, divisions.ALWest)
+            finally:
+                set_transport(previous)
+
+        assert len(adapter.requests) == 1
+        assert all(x.data is results[0].data for x in results)
+        assert Scraper.flight.stats == {"calls": 8, "deduplicated": 7}
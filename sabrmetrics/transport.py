@@ -0,0 +1,657 @@
+"""
+Shared HTTP transport for the web scrapers in :py:mod:`sabrmetrics`.
+
+A single :py:class:`Transport` is shared by every scraper, so that connections are pooled and
+kept alive across requests instead of being re-established for each scraper instance.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import io
+import json
+import shutil
+import tempfile
+import threading
+import time
+import typing
+import urllib.parse
+import weakref
+import zipfile
+
+import requests
+import requests.adapters
+import requests.structures
+import urllib3.util.retry
+
+from .instrumentation import get_instrument
+
+if typing.TYPE_CHECKING:
+    from .cache import ResponseCache
+
+
+class Transport:
+    """
+    Pooled HTTP session with automatic retries of idempotent requests.
+
+    :param pool_connections: Number of per-host connection pools to keep
+    :param pool_maxsize: Maximum number of connections to keep alive per host
+    :param retries: Maximum number of times to retry a failed ``GET``/``HEAD`` request
+    :param backoff_factor: Base delay (in seconds) of the exponential backoff between retries
+    :param backoff_jitter: Maximum random delay (in seconds) added to each backoff
+    :param host_limits: Maximum number of concurrent requests per host, keyed by host name
+    :param default_host_limit: Maximum number of concurrent requests to hosts missing from
+        ``host_limits``, or ``None`` for no limit
+    :param headers: Headers sent with every request
+    :param timeout: Default request timeout (in seconds)
+    :param cache: Response cache (see :py:mod:`sabrmetrics.cache`), or ``None`` to disable caching
+
+    .. py:attribute:: retry_statuses
+
+        HTTP status codes for which an idempotent request is retried.
+
+        :type: tuple[int]
+    """
+    retry_statuses = (429, 500, 502, 503, 504)
+    retry_methods = frozenset({"GET", "HEAD"})
+
+    def __init__(
+        self, *, pool_connections: int = 10, pool_maxsize: int = 10,
+        retries: int = 3, backoff_factor: float = 0.5, backoff_jitter: float = 0.25,
+        host_limits: typing.Optional[typing.Dict[str, int]] = None,
+        default_host_limit: typing.Optional[int] = None,
+        headers: typing.Optional[typing.Dict[str, str]] = None,
+        timeout: float = 100, cache: typing.Optional["ResponseCache"] = None
+    ):
+        self._timeout = timeout
+        self._cache = cache
+        self._host_limits = dict(host_limits or {})
+        self._default_host_limit = default_host_limit
+        self._semaphores: typing.Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+        retry = urllib3.util.retry.Retry(
+            total=retries, connect=retries, read=retries, status=retries,
+            allowed_methods=self.retry_methods, status_forcelist=self.retry_statuses,
+            backoff_factor=backoff_factor, backoff_jitter=backoff_jitter,
+            raise_on_status=False, respect_retry_after_header=True
+        )
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry
+        )
+
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        if headers:
+            self._session.headers.update(headers)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(host_limits={self._host_limits})"
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        """
+        return self._session
+
+    @property
+    def cache(self) -> typing.Optional["ResponseCache"]:
+        """
+        """
+        return self._cache
+
+    def get(
+        self, url: str, *, params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        headers: typing.Optional[typing.Dict[str, str]] = None,
+        timeout: typing.Optional[float] = None, stream: bool = False, immutable: bool = False,
+        refresh: bool = False
+    ) -> requests.Response:
+        """
+        Streamed requests bypass the response cache.
+
+        :param url:
+        :param params:
+        :param headers:
+        :param timeout:
+        :param stream:
+        :param immutable: Whether the requested resource never changes (e.g., standings of a
+            past season), in which case its cached response never expires
+        :param refresh: Whether to revalidate the cached response even if it has not expired
+        :return:
+        """
+        if self._cache is None or stream:
+            return self._request(
+                url, params=params, headers=headers, timeout=timeout, stream=stream
+            )
+
+        key = self._cache.key(url, params)
+        entry = self._cache.get(key)
+        if entry is not None and entry.fresh() and not refresh:
+            self._cache.stats.increment("hits")
+            return entry.response()
+
+        if entry is not None:
+            headers = {**(headers or {}), **entry.validators()}
+        response = self._request(url, params=params, headers=headers, timeout=timeout)
+
+        if entry is not None and response.status_code == 304:
+            return self._cache.refresh(key, entry, immutable=immutable).response()
+
+        self._cache.stats.increment("misses")
+        if self._cache.storable(response, immutable=immutable):
+            self._cache.set(key, self._cache.entry(response, immutable=immutable))
+        return response
+
+    def close(self) -> None:
+        """
+        Closes all pooled connections.
+        """
+        self._session.close()
+
+    def _request(
+        self, url: str, *, params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        headers: typing.Optional[typing.Dict[str, str]] = None,
+        timeout: typing.Optional[float] = None, stream: bool = False
+    ) -> requests.Response:
+        """
+        :param url:
+        :param params:
+        :param headers:
+        :param timeout:
+        :param stream:
+        :return:
+        """
+        host = urllib.parse.urlsplit(url).hostname or ""
+        release = self._acquire(host)
+        try:
+            start = time.perf_counter()
+            response = self._session.get(
+                url, params=params, headers=headers,
+                timeout=self._timeout if timeout is None else timeout, stream=stream
+            )
+            elapsed = time.perf_counter() - start
+        except BaseException:
+            release()
+            raise
+
+        if stream:
+            _release_on_close(response, release)
+        else:
+            release()
+
+        self._observe(host, response, elapsed, stream=stream)
+        return response
+
+    @staticmethod
+    def _observe(host: str, response: requests.Response, elapsed: float, *, stream: bool) -> None:
+        """
+        Reports the timings and size of a response to the current instrument.
+
+        :param host:
+        :param response:
+        :param elapsed: Seconds until the response was received (or, if not streamed, read)
+        :param stream:
+        """
+        instrument = get_instrument()
+        if instrument.enabled:
+            headers = response.elapsed.total_seconds()
+            instrument.observe("headers_seconds", headers, host=host)
+            retries = getattr(getattr(response.raw, "retries", None), "history", ())
+            if retries:
+                instrument.count("retries_total", len(retries), host=host)
+            if not stream:
+                instrument.observe("download_seconds", max(elapsed - headers, 0.0), host=host)
+                instrument.observe("response_bytes", len(response.content), host=host)
+
+    def _acquire(self, host: str) -> typing.Callable[[], None]:
+        """
+        Waits for a free request slot of a host.
+
+        :param host:
+        :return: Function releasing the slot (only the first call has an effect)
+        """
+        limit = self._host_limits.get(host, self._default_host_limit)
+        if limit is None:
+            return lambda: None
+
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(limit)
+            semaphore = self._semaphores[host]
+
+        semaphore.acquire()
+        released = threading.Lock()
+
+        def release() -> None:
+            if released.acquire(blocking=False):
+                semaphore.release()
+
+        return release
+
+
+def _release_on_close(response: requests.Response, release: typing.Callable[[], None]) -> None:
+    """
+    Holds the request slot of a streamed response until the response is closed (e.g., by
+    :py:class:`ResponseStream` once the body has been read) or garbage-collected.
+
+    :param response:
+    :param release:
+    """
+    close = response.close
+
+    def closing() -> None:
+        try:
+            close()
+        finally:
+            release()
+
+    response.close = closing
+    weakref.finalize(response, release)
+
+
+class ResponseStream(io.RawIOBase):
+    """
+    Read-only file-like view of the body of a (streamed) response, read chunk by chunk.
+    The response is closed once its body has been read completely, or the stream is closed.
+
+    :param response:
+    :param chunk_size:
+    """
+    def __init__(self, response: requests.Response, chunk_size: int = 2 ** 16):
+        super().__init__()
+
+        self._response = response
+        self._chunks = response.iter_content(chunk_size)
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        if not self.closed:
+            self._response.close()
+        super().close()
+
+    def readinto(self, buffer: bytearray) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                self._response.close()
+                return 0
+
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls: while a call with a given key is in progress, other
+    callers with the same key wait for it and share its result (or exception), instead of making
+    their own call.
+
+    Threads call :py:meth:`do`, which blocks until the result is ready.
+    Coroutines either call the blocking scrapers in an executor (e.g., through
+    :py:meth:`sabrmetrics.mlb.scraper.Scraper.fetch`), or await :py:meth:`do_async`, which shares
+    a single future per key between the coroutines of an event loop, so that waiting never blocks
+    the event loop.
+    Calls of :py:meth:`do` and :py:meth:`do_async` are never coalesced with each other.
+    """
+    class _Call:
+        __slots__ = ("event", "result", "error")
+
+        def __init__(self):
+            self.event = threading.Event()
+            self.result = None
+            self.error = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: typing.Dict[typing.Hashable, "SingleFlight._Call"] = {}
+        self._futures: typing.Dict[
+            typing.Tuple[asyncio.AbstractEventLoop, typing.Hashable], asyncio.Future
+        ] = {}
+        self._counts = {"calls": 0, "deduplicated": 0}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(stats={self.stats})"
+
+    @property
+    def stats(self) -> typing.Dict[str, int]:
+        """
+        Number of calls, and of calls that shared the result of a call already in progress.
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def do(self, key: typing.Hashable, function: typing.Callable[[], typing.Any]) -> typing.Any:
+        """
+        :param key:
+        :param function:
+        :return: The result of ``function``, or of the call in progress with the same ``key``
+        """
+        with self._lock:
+            self._counts["calls"] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = self._Call()
+            else:
+                self._counts["deduplicated"] += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    async def do_async(
+        self, key: typing.Hashable, function: typing.Callable[[], typing.Awaitable[typing.Any]]
+    ) -> typing.Any:
+        """
+        If the coroutine making the call is cancelled, the coroutines sharing it are cancelled
+        too; a cancelled coroutine sharing a call does not cancel it.
+
+        :param key:
+        :param function: Returns the awaitable of the call (e.g., a coroutine function)
+        :return: The result of ``function``, or of the call in progress with the same ``key`` in
+            the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._counts["calls"] += 1
+            future = self._futures.get((loop, key))
+            leader = future is None
+            if leader:
+                future = self._futures[loop, key] = loop.create_future()
+            else:
+                self._counts["deduplicated"] += 1
+
+        if not leader:
+            return await asyncio.shield(future)
+
+        try:
+            result = await function()
+        except BaseException as error:
+            with self._lock:
+                del self._futures[loop, key]
+            if isinstance(error, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(error)
+                # Retrieved, so that a call without any other waiter is not logged
+                future.exception()
+            raise
+
+        with self._lock:
+            del self._futures[loop, key]
+        future.set_result(result)
+        return result
+
+
+def request_key(url: str, params: typing.Optional[typing.Dict[str, typing.Any]] = None) -> str:
+    """
+    Canonical URL of a ``GET`` request, with the query parameters sorted by name.
+
+    :param url:
+    :param params:
+    :return:
+    """
+    items = sorted((params or {}).items())
+    return requests.Request("GET", url, params=items).prepare().url
+
+
+def build_response(
+    content: bytes, *, status_code: int = 200,
+    headers: typing.Optional[typing.Dict[str, str]] = None,
+    url: typing.Optional[str] = None, encoding: typing.Optional[str] = None
+) -> requests.Response:
+    """
+    Builds a :py:class:`requests.Response` from an already-downloaded body.
+
+    :param content:
+    :param status_code:
+    :param headers:
+    :param url:
+    :param encoding:
+    :return:
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    response.url = url
+    response.encoding = encoding
+    response._content = content
+    response._content_consumed = True
+    return response
+
+
+_TRANSPORT: typing.Optional[Transport] = None
+_TRANSPORT_LOCK = threading.Lock()
+
+
+def get_transport() -> Transport:
+    """
+    Returns the transport shared by all scrapers, creating it on first use.
+    The default transport does not cache responses; to cache them, share a transport with a
+    cache instead (e.g., ``set_transport(Transport(cache=MemoryCache()))``).
+
+    :return:
+    """
+    global _TRANSPORT
+    if _TRANSPORT is None:
+        with _TRANSPORT_LOCK:
+            if _TRANSPORT is None:
+                _TRANSPORT = Transport()
+    return _TRANSPORT
+
+
+def set_transport(transport: Transport) -> typing.Optional[Transport]:
+    """
+    Replaces the transport shared by all scrapers.
+
+    :param transport:
+    :return: The previously shared transport, if any
+    """
+    global _TRANSPORT
+    with _TRANSPORT_LOCK:
+        previous, _TRANSPORT = _TRANSPORT, transport
+    return previous
+
+
+class RecordingTransport(Transport):
+    """
+    Transport that records every response it receives to a ZIP archive, for later replay by
+    :py:class:`ReplayTransport`.
+    Responses already in the archive are not recorded again.
+
+    :param archive: Path to the archive, created if it does not exist
+    :param kwargs: Keyword arguments to :py:class:`Transport`
+
+    .. py:attribute:: spool_size
+
+        Number of bytes of a streamed response body held in memory until it is recorded, beyond
+        which the body is spooled to a temporary file.
+
+        :type: int
+    """
+    spool_size = 2 ** 22
+
+    def __init__(self, archive: str, **kwargs: typing.Any):
+        super().__init__(**kwargs)
+
+        self._archive = zipfile.ZipFile(archive, "a", compression=zipfile.ZIP_DEFLATED)
+        self._names = set(self._archive.namelist())
+        self._archive_lock = threading.Lock()
+
+    def close(self) -> None:
+        with self._archive_lock:
+            self._archive.close()
+        super().close()
+
+    def _request(
+        self, url: str, *, params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        headers: typing.Optional[typing.Dict[str, str]] = None,
+        timeout: typing.Optional[float] = None, stream: bool = False
+    ) -> requests.Response:
+        """
+        Streamed responses are recorded once their body has been read completely, without
+        buffering the body in memory.
+        """
+        response = super()._request(
+            url, params=params, headers=headers, timeout=timeout, stream=stream
+        )
+        if response.status_code != 200:
+            return response
+
+        name = _archive_name(request_key(url, params))
+        with self._archive_lock:
+            if f"{name}.json" in self._names:
+                return response
+
+        if not stream:
+            self._record(name, response, io.BytesIO(response.content))
+            return response
+
+        iter_content = response.iter_content
+
+        def tee(
+            chunk_size: typing.Optional[int] = 1, decode_unicode: bool = False
+        ) -> typing.Iterator[typing.Union[bytes, str]]:
+            chunks = iter_content(chunk_size)
+            with tempfile.SpooledTemporaryFile(max_size=self.spool_size) as body:
+                def recorded() -> typing.Iterator[bytes]:
+                    for chunk in chunks:
+                        body.write(chunk)
+                        yield chunk
+                    body.seek(0)
+                    self._record(name, response, body)
+
+                if decode_unicode:
+                    yield from requests.utils.stream_decode_response_unicode(recorded(), response)
+                else:
+                    yield from recorded()
+
+        response.iter_content = tee
+        return response
+
+    def _record(self, name: str, response: requests.Response, body: typing.BinaryIO) -> None:
+        """
+        :param name: Name of the response in the archive
+        :param response:
+        :param body: Body of the response
+        """
+        metadata = {
+            "url": response.url, "status_code": response.status_code,
+            "headers": dict(response.headers), "encoding": response.encoding
+        }
+        with self._archive_lock:
+            if f"{name}.json" not in self._names:
+                with self._archive.open(f"{name}.body", "w") as file:
+                    shutil.copyfileobj(body, file)
+                self._archive.writestr(f"{name}.json", json.dumps(metadata))
+                self._names.add(f"{name}.json")
+
+
+class ReplayTransport(Transport):
+    """
+    Transport that serves the responses recorded by :py:class:`RecordingTransport`, without any
+    network access.
+
+    :param archive: Path to the archive
+    :param kwargs: Keyword arguments to :py:class:`Transport`
+    :raise requests.ConnectionError: When a request has no recorded response
+    """
+    def __init__(self, archive: str, **kwargs: typing.Any):
+        super().__init__(**kwargs)
+
+        self._archive = zipfile.ZipFile(archive, "r")
+        self._names = set(self._archive.namelist())
+        self._archive_lock = threading.Lock()
+
+    def close(self) -> None:
+        with self._archive_lock:
+            self._archive.close()
+        super().close()
+
+    def _request(
+        self, url: str, *, params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        headers: typing.Optional[typing.Dict[str, str]] = None,
+        timeout: typing.Optional[float] = None, stream: bool = False
+    ) -> requests.Response:
+        key = request_key(url, params)
+        name = _archive_name(key)
+        if f"{name}.json" not in self._names:
+            raise requests.ConnectionError(f"no recorded response for {key}")
+
+        start = time.perf_counter()
+        with self._archive_lock:
+            metadata = json.loads(self._archive.read(f"{name}.json"))
+            content = self._archive.read(f"{name}.body")
+        response = build_response(content, **metadata)
+
+        self._observe(
+            urllib.parse.urlsplit(url).hostname or "", response, time.perf_counter() - start,
+            stream=False
+        )
+        return response
+
+
+def _archive_name(key: str) -> str:
+    """
+    :param key: Canonical request URL
+    :return:
+    """
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+@contextlib.contextmanager
+def recording(archive: str, **kwargs: typing.Any) -> typing.Iterator[RecordingTransport]:
+    """
+    Shares a :py:class:`RecordingTransport` between all scrapers within the context.
+
+    :param archive:
+    :param kwargs: Keyword arguments to :py:class:`RecordingTransport`
+    """
+    with RecordingTransport(archive, **kwargs) as transport:
+        previous = set_transport(transport)
+        try:
+            yield transport
+        finally:
+            set_transport(previous)
+
+
+@contextlib.contextmanager
+def replaying(archive: str, **kwargs: typing.Any) -> typing.Iterator[ReplayTransport]:
+    """
+    Shares a :py:class:`ReplayTransport` between all scrapers within the context.
+
+    :param archive:
+    :param kwargs: Keyword arguments to :py:class:`ReplayTransport`
+    """
+    with ReplayTransport(archive, **kwargs) as transport:
+        previous = set_transport(transport)
+        try:
+            yield transport
+        finally:
+            set_transport(previous)